@@ -0,0 +1,22 @@
+-- Normaliza as informações dos produtos na tabela products.
+-- Cada produto passa a ser guardado uma unica vez, a wishlist guarda somente o product_id.
+-- Quando o mesmo produto possui mais de uma versão, e mantida a mais recente que não seja mockada.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS products (
+    product_id INTEGER PRIMARY KEY,
+    product_info VARCHAR,
+    updated_at TIMESTAMP WITHOUT TIME ZONE
+);
+
+INSERT INTO products (product_id, product_info, updated_at)
+SELECT DISTINCT ON (product_id) product_id, product_info, created_at
+FROM wishlist
+WHERE product_id IS NOT NULL
+ORDER BY product_id, (product_info LIKE '%''mocked'': True%'), created_at DESC
+ON CONFLICT (product_id) DO NOTHING;
+
+ALTER TABLE wishlist DROP COLUMN IF EXISTS product_info;
+
+COMMIT;
@@ -0,0 +1,36 @@
+-- Converte products.product_info para JSONB.
+-- Os registros antigos foram gravados como repr de um dicionario python ({'price': 1.0, 'mocked': True}),
+-- os mesmos são convertidos para JSON. Os registros que não puderem ser convertidos ficam nulos e
+-- são preenchidos novamente na proxima vez que o produto for favoritado.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION pg_temp.product_info_to_jsonb(value TEXT) RETURNS JSONB AS $$
+BEGIN
+    IF value IS NULL THEN
+        RETURN NULL;
+    END IF;
+    BEGIN
+        RETURN value::JSONB;
+    EXCEPTION WHEN others THEN
+        NULL;
+    END;
+    RETURN regexp_replace(
+        regexp_replace(
+            regexp_replace(
+                replace(value, '''', '"'),
+                ': True([,}])', ': true\1', 'g'
+            ),
+            ': False([,}])', ': false\1', 'g'
+        ),
+        ': None([,}])', ': null\1', 'g'
+    )::JSONB;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE products
+    ALTER COLUMN product_info TYPE JSONB USING pg_temp.product_info_to_jsonb(product_info);
+
+COMMIT;
@@ -0,0 +1,5 @@
+-- Indice usado pela paginação por cursor (keyset) da wishlist, ordenada por (created_at, wishlist_id).
+-- Criado com CONCURRENTLY para não bloquear escritas, então não deve ser executado dentro de uma transação.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_wishlist_client_created
+    ON wishlist (client_id, created_at, wishlist_id);
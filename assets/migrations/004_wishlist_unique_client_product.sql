@@ -0,0 +1,18 @@
+-- Garante que o mesmo produto não seja adicionado duas vezes na wishlist do cliente.
+-- As duplicidades existentes são removidas mantendo o registro mais antigo, depois e criada a
+-- constraint unica usada pelo INSERT ... ON CONFLICT e removido o indice não unico que a mesma substitui.
+
+BEGIN;
+
+DELETE FROM wishlist w
+USING wishlist d
+WHERE w.client_id = d.client_id
+AND w.product_id = d.product_id
+AND w.wishlist_id > d.wishlist_id;
+
+ALTER TABLE wishlist
+    ADD CONSTRAINT uq_wishlist_client_product UNIQUE (client_id, product_id);
+
+DROP INDEX IF EXISTS idx_wishlist_client_product;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Passa as datas para timestamptz geradas pelo banco de dados.
+-- As datas existentes foram gravadas sem fuso no horario de America/Sao_Paulo, então são
+-- convertidas a partir do mesmo. O created_at passa a ter now() como padrão e as inserções e
+-- atualizações retornam as datas geradas com RETURNING.
+
+BEGIN;
+
+ALTER TABLE clients
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'America/Sao_Paulo',
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'America/Sao_Paulo';
+
+ALTER TABLE wishlist
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'America/Sao_Paulo',
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE products
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'America/Sao_Paulo',
+    ALTER COLUMN updated_at SET DEFAULT now();
+
+COMMIT;
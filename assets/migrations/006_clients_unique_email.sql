@@ -0,0 +1,6 @@
+-- Garante o indice unico de email usado pelo INSERT ... ON CONFLICT (email) no cadastro de clientes.
+-- Bases criadas pela API ja possuem o indice clients_email_key, gerado pela constraint unica do modelo,
+-- então o comando não faz nada nas mesmas. A unicidade passa a ser verificada apenas pelo banco,
+-- sem a consulta previa por email no cadastro e na atualização.
+
+CREATE UNIQUE INDEX IF NOT EXISTS clients_email_key ON clients (email);
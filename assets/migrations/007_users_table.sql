@@ -0,0 +1,13 @@
+-- Cria a tabela de usuarios da API, usada no login em /token no lugar das credenciais fixas.
+-- As senhas ficam apenas como hash scrypt, o usuario administrador e cadastrado pela API na
+-- inicialização com as credenciais de AUTH_ADMIN_USERNAME e AUTH_ADMIN_PASSWORD.
+
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR NOT NULL,
+    password_hash VARCHAR NOT NULL,
+    created_at timestamptz DEFAULT now(),
+    CONSTRAINT users_username_key UNIQUE (username)
+);
+
+CREATE INDEX IF NOT EXISTS ix_users_id ON users (id);
@@ -14,3 +14,15 @@ EXPLAIN (ANALYZE, BUFFERS)
 SELECT * FROM wishlist w 
 WHERE client_id = 1
 AND product_id = 1;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM wishlist w
+WHERE client_id = 1
+AND (created_at, wishlist_id) > ('2024-01-01 00:00:00', 1)
+ORDER BY created_at, wishlist_id
+LIMIT 11;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT product_id FROM wishlist w
+WHERE client_id = 1
+AND product_id = ANY('{1,2,3}'::int[]);
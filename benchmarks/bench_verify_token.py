@@ -0,0 +1,53 @@
+"""
+Micro benchmark do custo de autenticação por requisição em `verify_token`.
+
+Compara a verificação completa do JWT (decodificação, HMAC e validação das claims), feita
+quando o token não esta no cache de tokens verificados, com a leitura do cache feita nas
+requisições seguintes com o mesmo token.
+
+Execução:
+    python -m benchmarks.bench_verify_token
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("SECRET_KEY", "benchmark_secret_key")
+
+from jose import jwt
+
+from src.utils.auth.auth import ALGORITHM, SECRET_KEY, verified_tokens, verify_token
+
+CALLS = 20000
+
+
+async def measure(name: str, call) -> float:
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        await call()
+    elapsed = (time.perf_counter() - started) / CALLS
+    print(f"{name:<24} {elapsed * 1_000_000:8.2f} us/requisição")
+    return elapsed
+
+
+async def main():
+    token = jwt.encode(
+        {"sub": "admin", "exp": datetime.now(timezone.utc) + timedelta(hours=1)},
+        SECRET_KEY,
+        algorithm=ALGORITHM
+    )
+
+    async def uncached():
+        verified_tokens.clear()
+        await verify_token(token)
+
+    print(f"Media de {CALLS} chamadas")
+    before = await measure("sem cache", uncached)
+    await verify_token(token)
+    after = await measure("com cache", lambda: verify_token(token))
+    print(f"{'':<24} {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
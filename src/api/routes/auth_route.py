@@ -1,15 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import jwt
-from datetime import timedelta, datetime
-from src.utils.exceptions.exceptions import UnauthorizedException
-
-from src.utils.auth.auth import SECRET_KEY, ALGORITHM
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.utils.database.postgres import get_db
+from src.api.services.auth_services import AuthService
 
 router = APIRouter()
 
-@router.post("/token")
-async def login(form_data: OAuth2PasswordRequestForm = Depends()):
+@router.post("/token", response_model=dict)
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db, scope="function")):
     """
         Endpoint para autenticação de usuario e geração de token JWT.
         
@@ -24,8 +22,4 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
         **Exceções:**
         - `UnauthorizedException`: Se as credenciais fornecidas não forem validas.
     """
-    if form_data.username != "admin" or form_data.password != "admin":
-        raise UnauthorizedException
-    to_encode = {"sub": form_data.username, "exp": datetime.utcnow() + timedelta(hours=1)}
-    token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return {"access_token": token, "token_type": "bearer"}
\ No newline at end of file
+    return await AuthService.login(db, form_data.username, form_data.password)
\ No newline at end of file
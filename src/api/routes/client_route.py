@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.utils.database.postgres import get_db
+from src.utils.database.postgres import get_read_db, get_write_db, mark_client_written
 from src.utils.schemas.clients_schema import (
     ClientsOut,
     ClientsCreate,
@@ -20,27 +20,29 @@ logger = HelperFunctions.get_logger()
 @router.get("/", response_model=ListAllClientsResponse)
 async def list_all_clients(
     request: ListAllClientsRequest = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     user_id: str = Depends(verify_token)
 ):
     """
-        Lista todos os clientes de maneira paginada.
+        Lista todos os clientes de maneira paginada, ordenados pelo ID.
 
         **Parâmetros:**
-        - `page` (int): Numero da página a ser consultada (Padrão e 1)
-        - `page_size` (int): Tamanho da página (Padrão e 10)
+        - `page` (int): Numero da página a ser consultada (Padrão e 1), mantido por compatibilidade, prefira o `cursor`.
+        - `page_size` (int): Tamanho da página (Padrão e 10, maximo definido em CLIENTS_MAX_PAGE_SIZE)
+        - `cursor` (str): Cursor retornado em `next_cursor` pela página anterior (Opcional).
 
         **Retorna:**
-        - Uma dicionario com 2 campos sendo eles items e has_next:
+        - Uma dicionario com 3 campos sendo eles items, has_next e next_cursor:
             - `items`: Lista de clientes paginada.
             - `has_next`: Booleano indicando se ha mais paginas disponiveis.
+            - `next_cursor`: Cursor a ser enviado para buscar a proxima página.
     """
     return await ClientsService.get_all_clients(db, request, logger)
 
 @router.get("/{client_id}", response_model=ClientsOut)
 async def get_client(
     client_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     user_id: str = Depends(verify_token)
 ):
     """
@@ -56,7 +58,8 @@ async def get_client(
 @router.post("/", response_model=ClientsOut)
 async def create_client(
     cliente: ClientsCreate,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_write_db, scope="function"),
     user_id: str = Depends(verify_token)
 ):
     """
@@ -71,13 +74,15 @@ async def create_client(
     - Um dicionario com os dados do cliente criado, incluindo o ID gerado.
     
     """
-    return await ClientsService.create_client(db, cliente)
+    created = await ClientsService.create_client(db, cliente)
+    mark_client_written(request, created.id)
+    return created
 
 @router.put("/{client_id}", response_model=ClientsOut)
 async def update_client(
     client_id: int,
     cliente: ClientsUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db, scope="function"),
     user_id: str = Depends(verify_token)
 ):
     """
@@ -96,10 +101,10 @@ async def update_client(
     """
     return await ClientsService.update_client(db, client_id, cliente)
 
-@router.delete("/{client_id}")
+@router.delete("/{client_id}", response_model=dict)
 async def delete_client(
     client_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db, scope="function"),
     user_id: str = Depends(verify_token)
 ):
     """
@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends
+
+from src.utils.auth.auth import verify_token
+from src.utils.catalog.product_catalog import product_catalog_client
+from src.utils.database.postgres import engine, read_engine
+from src.utils.cache.caches import (
+    product_swr,
+    negative_product_cache,
+    wishlist_page_swr,
+    wishlist_membership_cache,
+    client_swr
+)
+
+router = APIRouter(prefix="/metrics", tags=["Monitoramento"])
+
+@router.get("/product-catalog", response_model=dict)
+async def get_product_catalog_metrics(user_id: str = Depends(verify_token)):
+    """
+    Retorna as metricas da integração com a API de produtos.
+
+    **Retorna:**
+    - Um dicionario com os seguintes campos:
+        - `circuit_breaker`: Estado do circuit breaker da API de produtos.
+        - `product_cache`: Contadores do cache de produtos e das atualizações em segundo plano.
+        - `negative_product_cache`: Contadores do cache de produtos não encontrados.
+    """
+    return {
+        "circuit_breaker": product_catalog_client.circuit_breaker.snapshot(),
+        "product_cache": product_swr.stats(),
+        "negative_product_cache": negative_product_cache.stats()
+    }
+
+@router.get("/wishlist-cache", response_model=dict)
+async def get_wishlist_cache_metrics(user_id: str = Depends(verify_token)):
+    """
+    Retorna as metricas dos caches da lista de favoritos.
+
+    **Retorna:**
+    - Um dicionario com os seguintes campos:
+        - `page_cache`: Contadores do cache de páginas da lista de favoritos e das atualizações em segundo plano.
+        - `membership_cache`: Contadores do cache de produtos favoritados por cliente.
+    """
+    return {
+        "page_cache": wishlist_page_swr.stats(),
+        "membership_cache": wishlist_membership_cache.stats()
+    }
+
+@router.get("/client-cache", response_model=dict)
+async def get_client_cache_metrics(user_id: str = Depends(verify_token)):
+    """
+    Retorna as metricas do cache de clientes.
+
+    **Retorna:**
+    - Um dicionario com os contadores do cache de clientes e das atualizações em segundo plano.
+    """
+    return client_swr.stats()
+
+
+@router.get("/database-pool", response_model=dict)
+async def get_database_pool_metrics(user_id: str = Depends(verify_token)):
+    """
+    Retorna as metricas dos pools de conexões com o banco de dados deste worker.
+
+    **Retorna:**
+    - Um dicionario com o campo `primary`, com o pool do banco principal, e o campo `read`, com o
+      pool da replica de leitura ou null quando DATABASE_READ_URL não estiver configurada. Cada pool
+      contem os seguintes campos:
+        - `pool_size`, `max_overflow` e `timeout`: Configurações do pool.
+        - `checked_out`: Conexões em uso.
+        - `idle`: Conexões abertas aguardando uso.
+        - `overflow`: Conexões abertas acima do `pool_size`.
+        - `checkouts` e `timeouts`: Quantidade de conexões obtidas e de esperas que excederam o `timeout`.
+        - `wait_total`, `wait_avg` e `wait_max`: Tempos de espera por uma conexão em segundos.
+    """
+    return {
+        "primary": engine.pool.stats(),
+        "read": read_engine.pool.stats() if read_engine is not engine else None
+    }
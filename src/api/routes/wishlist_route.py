@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.utils.database.postgres import get_db
+from src.utils.database.postgres import get_read_db, get_write_db
 
 from src.utils.schemas.wishlist_schema import (
     GetWishlistByClientIdRequest,
@@ -8,7 +8,11 @@ from src.utils.schemas.wishlist_schema import (
     AddProductInWishlistRequest,
     DeleteProductFromWishList,
     WishlistBase,
-    AddProductInWishlistRequestPayload
+    AddProductInWishlistRequestPayload,
+    BatchWishlistRequestPayload,
+    BatchWishlistResponse,
+    GetWishlistMembershipRequest,
+    GetWishlistMembershipResponse
 )
 from src.api.services.wishlist_services import WishlistService
 from src.utils.auth.auth import verify_token
@@ -20,10 +24,10 @@ router = APIRouter(prefix="/clients", tags=["Lista de favoritos"])
 
 logger = HelperFunctions.get_logger()
 
-@router.get("/{client_id}/favorite", response_model=GetWishlistByClientIdResponse)
+@router.get("/{client_id}/favorite", response_model=GetWishlistByClientIdResponse, response_model_exclude_unset=True)
 async def get_wishlist_by_client_id(
     request: GetWishlistByClientIdRequest = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     user_id: str = Depends(verify_token)
 ):
     """
@@ -31,21 +35,42 @@ async def get_wishlist_by_client_id(
 
         **Parâmetros:**
         - `client_id` (int): Identificador unico do cliente.
-        - `page` (int): Numero da página a ser consultada (Padrão e 1).
+        - `page` (int): Numero da página a ser consultada (Padrão e 1), mantido por compatibilidade, prefira o `cursor`.
         - `page_size` (int): Tamanho da página (Padrão e 10).
+        - `cursor` (str): Cursor retornado em `next_cursor` pela página anterior (Opcional).
+        - `fields` (str): Campos do produto a serem retornados separados por virgula, ex: `title,price` (Opcional).
 
         **Retorna:**
-        - Uma dicionario com 2 campos sendo eles items e has_next:
-            - `items`: Lista de produtos favorito do cliente paginada.
+        - Uma dicionario com 3 campos sendo eles items, has_next e next_cursor:
+            - `items`: Lista de produtos favorito do cliente paginada, ordenada pela data em que foram favoritados.
             - `has_next`: Booleano indicando se ha mais paginas disponiveis.
+            - `next_cursor`: Cursor a ser enviado para buscar a proxima página.
     """
     return await WishlistService.get_wishlist_by_client_id(db, request, logger)
 
+@router.get("/{client_id}/favorite/contains", response_model=GetWishlistMembershipResponse)
+async def get_wishlist_membership(
+    request: GetWishlistMembershipRequest = Depends(),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+    user_id: str = Depends(verify_token)
+):
+    """
+        Verifica quais produtos estão na lista de favoritos do cliente.
+
+        **Parâmetros:**
+        - `client_id` (int): Identificador unico do cliente.
+        - `product_ids` (str): Identificadores dos produtos separados por virgula, ex: `1,2,3`.
+
+        **Retorna:**
+        - Um dicionario com o campo `favorites`, contendo os produtos informados que estão na lista de favoritos.
+    """
+    return await WishlistService.get_wishlist_membership(db, request)
+
 @router.post("/{client_id}/favorite", response_model=WishlistBase)
 async def add_product_in_wishlist(
     client_id: int,
     payload: AddProductInWishlistRequestPayload,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db, scope="function"),
     user_id: str = Depends(verify_token)
 ):
     """
@@ -64,11 +89,31 @@ async def add_product_in_wishlist(
     request = AddProductInWishlistRequest(client_id=client_id, product_id=payload.product_id)
     return await WishlistService.add_product_in_wishlist(db, request)
 
-@router.delete("/{client_id}/favorite/{product_id}")
+@router.post("/{client_id}/favorite/batch", response_model=BatchWishlistResponse)
+async def batch_update_wishlist(
+    client_id: int,
+    payload: BatchWishlistRequestPayload,
+    db: AsyncSession = Depends(get_write_db, scope="function"),
+    user_id: str = Depends(verify_token)
+):
+    """
+    Adiciona e remove varios produtos da lista de desejo do cliente em uma unica requisição.
+
+    **Payload:**
+    - `add` (list[int]): Identificadores dos produtos a serem adicionados.
+    - `remove` (list[int]): Identificadores dos produtos a serem removidos.
+
+    **Retorna:**
+    - Um dicionario com o campo `items`, contendo para cada produto a operação solicitada e o seu
+      resultado (`created`, `already_exists`, `product_not_found`, `deleted` ou `not_found`).
+    """
+    return await WishlistService.batch_update_wishlist(db, client_id, payload)
+
+@router.delete("/{client_id}/favorite/{product_id}", response_model=dict)
 async def delete_client(
     client_id: int,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db, scope="function"),
     user_id: str = Depends(verify_token)
     ):
     """
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from jose import jwt
+from src.utils.repository import UsersRepository
+from src.utils.auth.auth import SECRET_KEY, ALGORITHM
+from src.utils.auth.passwords import password_hasher
+from src.utils.database.postgres import AsyncSessionLocal, release_connection
+from src.utils.exceptions.exceptions import UnauthorizedException
+import os
+
+AUTH_ADMIN_USERNAME = os.getenv("AUTH_ADMIN_USERNAME", "admin")
+AUTH_ADMIN_PASSWORD = os.getenv("AUTH_ADMIN_PASSWORD", "admin")
+AUTH_TOKEN_EXPIRE_MINUTES = int(os.getenv("AUTH_TOKEN_EXPIRE_MINUTES", "60"))
+
+
+class AuthService:
+
+    async def login(db: AsyncSession, username: str, password: str) -> dict:
+        """
+            Autentica o usuario pelo nome de usuario e senha e gera o token JWT.
+
+            A senha e verificada no pool de threads do PasswordHasher, fora do event loop. Quando
+            o usuario não existe a senha e verificada contra um hash descartavel, então o tempo de
+            resposta e o mesmo de uma senha errada. A conexão da consulta do usuario e devolvida ao
+            pool antes da verificação, então logins aguardando o pool de threads não ocupam as
+            conexões usadas pelas demais rotas.
+
+            Args:
+                db (AsyncSession): Sessão assincrona do banco de dados.
+                username (str): Nome de usuario.
+                password (str): Senha em texto plano.
+
+            Raises:
+                UnauthorizedException: Se o usuario não existir ou a senha estiver errada.
+
+            Returns:
+                dict: Dicionário com access_token e token_type.
+        """
+        user = await UsersRepository.get_by_username(db, username)
+        await release_connection(db)
+        if not await password_hasher.verify(password, user.password_hash if user else None):
+            raise UnauthorizedException
+        to_encode = {"sub": user.username, "exp": datetime.utcnow() + timedelta(minutes=AUTH_TOKEN_EXPIRE_MINUTES)}
+        token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        return {"access_token": token, "token_type": "bearer"}
+
+    async def ensure_admin_user():
+        """
+            Cadastra o usuario administrador definido em AUTH_ADMIN_USERNAME e AUTH_ADMIN_PASSWORD
+            caso o mesmo ainda não exista, deve ser chamado na inicialização da aplicação.
+        """
+        async with AsyncSessionLocal() as session:
+            if await UsersRepository.get_by_username(session, AUTH_ADMIN_USERNAME) is None:
+                await UsersRepository.create(session, AUTH_ADMIN_USERNAME, await password_hasher.hash(AUTH_ADMIN_PASSWORD))
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy.exc import NoResultFound, IntegrityError
 from fastapi import HTTPException
 from src.utils.schemas.clients_schema import (
     ClientsCreate,
@@ -11,50 +11,121 @@ from src.utils.schemas.clients_schema import (
 from src.utils.repository import (
     ClientsRepository
 )
-from src.utils.exceptions.exceptions import GenericExceptions, DataAlreadyExistsException
+from src.utils.exceptions.exceptions import GenericExceptions, DataAlreadyExistsException, SchemaValidationError
+from src.utils.helpers.helpers_functions import HelperFunctions
+from src.utils.cache.caches import client_swr, client_versions
+from src.utils.database.postgres import AsyncSessionLocal
 from logging import Logger
+import os
+
+CLIENTS_MAX_PAGE_SIZE = int(os.getenv("CLIENTS_MAX_PAGE_SIZE", "1000"))
 
 
 class ClientsService:
 
     async def get_all_clients(db: AsyncSession, request: ListAllClientsRequest, logger: Logger):
         """
-            Obtem todos os clientes de maneira paginada
+            Obtem todos os clientes de maneira paginada, ordenados pelo ID.
 
             Args:
                 db (AsyncSession): Sessão assincrona do banco de dados.
                 request (ListAllClientsRequest): Schema ListAllClientsRequest contendo os parâmetros de paginação.
+                    Quando `cursor` e informado a paginação e feita por keyset e `page` e ignorado.
             
+            Raises:
+                SchemaValidationError: Se o tamanho da página ou o cursor forem invalidos.
+
             Returns:
-                ListAllClientsResponse: Resposta contendo a lista de clientes e se ha mais paginas.
+                ListAllClientsResponse: Resposta contendo a lista de clientes, se ha mais paginas e o cursor da proxima página.
         
         """
         try:
-            clients, has_next = await ClientsRepository.get_all(db, request)
+            if not 1 <= request.page_size <= CLIENTS_MAX_PAGE_SIZE:
+                raise SchemaValidationError(f"page_size must be between 1 and {CLIENTS_MAX_PAGE_SIZE}.")
+
+            after_id = None
+            if request.cursor:
+                cursor = HelperFunctions.decode_cursor(request.cursor)
+                try:
+                    after_id = int(cursor["id"])
+                except (KeyError, TypeError, ValueError):
+                    raise SchemaValidationError("Invalid pagination cursor.")
+
+            clients, has_next = await ClientsRepository.get_all(db, request, after_id)
+
+            next_cursor = None
+            if has_next and clients:
+                next_cursor = HelperFunctions.encode_cursor({"id": clients[-1].id})
+
+            # As linhas vem do banco de dados, onde o email ja foi validado na gravação, então os
+            # itens são montados sem validar novamente cada campo.
             return ListAllClientsResponse(
-                items=[ClientsOut(**client.json()) for client in clients],
-                has_next=has_next
+                items=[
+                    ClientsOut.model_construct(
+                        id=client.id,
+                        nome=client.nome,
+                        email=client.email,
+                        created_at=client.created_at
+                    )
+                    for client in clients
+                ],
+                has_next=has_next,
+                next_cursor=next_cursor
             )
+        except SchemaValidationError:
+            raise
         except Exception as e:
             raise GenericExceptions(f"Erro ao buscar clientes: {str(e)}")
 
     async def get_client(db: AsyncSession, client_id: int):
         """
-            Obtem um cliente pelo ID do mesmo na tabela clients
+            Obtem um cliente pelo ID do mesmo na tabela clients, consultando primeiro o cache de clientes.
+
+            As entradas do cache tem a versão do cliente na chave, que e incrementada pelo
+            ClientsRepository a cada alteração, então um cliente alterado não e mais encontrado
+            no cache mesmo que tenha sido consultado durante a alteração. Depois de vencida a
+            entrada continua sendo retornada enquanto uma tarefa em segundo plano atualiza a mesma.
 
             Args:
                 db (AsyncSession): Sessão assincrona do banco de dados.
                 client_id (int): ID do cliente a ser buscado.
+            Raises:
+                NoResultFound: Se o cliente não for encontrado.
             Returns:
                 ClientsOut: Cliente encontrado com os dados do mesmo.
         """
         try:
-            return await ClientsRepository.get_by_id(db, client_id)
+            async def load_client(session: AsyncSession) -> dict:
+                client = await ClientsRepository.get_by_id(session, client_id)
+                return ClientsOut(**client.json()).model_dump(mode="json")
+
+            # A atualização em segundo plano roda depois do fim da requisição, então usa
+            # uma sessão propria em vez da sessão da requisição.
+            async def refresh_client() -> dict:
+                async with AsyncSessionLocal() as session:
+                    return await load_client(session)
+
+            version = await client_versions.get_version(client_id)
+            if version is None:
+                return ClientsOut(**await load_client(db))
+            return ClientsOut(**await client_swr.get(f"{client_id}:{version}", lambda: load_client(db), refresh_client))
         except NoResultFound:
             raise
         except Exception as e:
             raise GenericExceptions(f"Erro ao buscar cliente pelo id -> {e}")
 
+    async def ensure_client_exists(db: AsyncSession, client_id: int):
+        """
+            Verifica se o cliente existe, usando o cache de clientes.
+
+            Args:
+                db (AsyncSession): Sessão assincrona do banco de dados.
+                client_id (int): ID do cliente a ser verificado.
+            Raises:
+                NoResultFound: Se o cliente não for encontrado.
+        """
+        await ClientsService.get_client(db, client_id)
+
     async def create_client(db: AsyncSession, client_data: ClientsCreate):
         """
             Cria um novo cliente no banco de dados e tambem cria uma wishlist para o mesmo.
@@ -62,17 +133,19 @@ class ClientsService:
             Args:
                 db (AsyncSession): Sessão assincrona do banco de dados.
                 client_data (ClientsCreate): Dados do cliente a ser criado.
-            
+
+            Raises:
+                DataAlreadyExistsException: Se o email informado ja estiver cadastrado.
+
             Returns:
                 ClientsOut: Cliente criado com os dados do mesmo, incluindo a wishlist.
         """
         try:
-            existing_cliente = await ClientsRepository.get_by_email(db, client_data.email)
-            if existing_cliente:
+            client = await ClientsRepository.create(db, client_data)
+            if client is None:
                 raise DataAlreadyExistsException("Client with this email already exists.")
-            client_data = await ClientsRepository.create(db, client_data)
-            return client_data
-        except DataAlreadyExistsException:
+            return client
+        except (DataAlreadyExistsException, IntegrityError):
             raise
         except Exception as e:
             raise GenericExceptions(f"Erro ao criar o client -> {e}")
@@ -85,16 +158,16 @@ class ClientsService:
             db (AsyncSession): Sessão assincrona do banco de dados.
             client_id (int): ID do cliente a ser atualizado.
             client_data (ClientsUpdate): Dados para atualizar do cliente.
+        Raises:
+            NoResultFound: Se o cliente não for encontrado.
+            IntegrityError: Se o email informado ja estiver cadastrado para outro cliente, tratado como 409.
         Returns:
             ClientsOut: Cliente atualizado com os novos dados.
         """
         try:
             return await ClientsRepository.update(db, client_id, client_data)
-        except NoResultFound:
+        except (NoResultFound, IntegrityError):
             raise
-        except DataAlreadyExistsException:
-            raise
-
         except Exception as e:
             raise GenericExceptions(f"Erro ao atualizar o client -> {e}")
 
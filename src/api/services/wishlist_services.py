@@ -1,45 +1,303 @@
+import asyncio
+import os
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import NoResultFound
 from fastapi import HTTPException
 from src.utils.schemas.wishlist_schema import (
+    ProductInfo,
     WishlistBase,
     GetWishlistByClientIdRequest,
     GetWishlistByClientIdResponse,
     AddProductInWishlistRequest,
-    DeleteProductFromWishList
+    DeleteProductFromWishList,
+    BatchWishlistRequestPayload,
+    BatchWishlistItemResult,
+    BatchWishlistResponse,
+    GetWishlistMembershipRequest,
+    GetWishlistMembershipResponse
 )
 from src.utils.repository import (
-    WishlistRepository
+    WishlistRepository,
+    ProductsRepository
 )
+from src.api.services.clients_services import ClientsService
 from src.utils.helpers.helpers_functions import HelperFunctions
-from src.utils.exceptions.exceptions import GenericExceptions, DataAlreadyExistsException
+from src.utils.exceptions.exceptions import (
+    SchemaValidationError,
+    GenericExceptions,
+    DataAlreadyExistsException,
+    ProductCatalogUnavailableException
+)
+from src.utils.catalog.product_catalog import product_catalog_client
+from src.utils.cache.caches import (
+    product_swr,
+    negative_product_cache,
+    wishlist_membership_cache,
+    wishlist_page_swr,
+    wishlist_versions,
+    WISHLIST_PAGE_CACHE_MAX_PAGE,
+    WISHLIST_PAGE_CACHE_MAX_PAGE_SIZE
+)
+from src.utils.database.postgres import AsyncSessionLocal, release_connection
 from logging import Logger
-import requests
+from datetime import datetime
+
+WISHLIST_BATCH_MAX_ITEMS = int(os.getenv("WISHLIST_BATCH_MAX_ITEMS", "100"))
+WISHLIST_MEMBERSHIP_MAX_ITEMS = int(os.getenv("WISHLIST_MEMBERSHIP_MAX_ITEMS", "100"))
 
 
 class WishlistService:
 
+    async def get_product_info(product_id: int, db: AsyncSession | None = None) -> dict:
+        """
+            Obtem as informações de um produto, consultando primeiro o cache de produtos e
+            depois a API de produtos. Produtos não encontrados ficam por um curto periodo
+            no cache negativo para não consultar a API novamente.
+
+            Depois de vencida a entrada do cache continua sendo retornada enquanto uma unica
+            tarefa em segundo plano atualiza a mesma na API de produtos.
+
+            Caso a API esteja indisponivel, e usado o ultimo valor conhecido do produto no cache,
+            mesmo que expirado, depois o produto salvo na tabela products e na falta dos mesmos
+            um produto mockado.
+
+            Args:
+                product_id (int): Identificador do produto.
+                db (AsyncSession): Sessão assincrona do banco de dados, usada quando a API estiver indisponivel.
+
+            Raises:
+                HTTPException: Se o produto não for encontrado na API de produtos.
+
+            Returns:
+                dict: Informações do produto.
+        """
+        try:
+            return await product_swr.get(product_id, lambda: WishlistService.fetch_product_info(product_id))
+        except ProductCatalogUnavailableException:
+            product_info = await product_swr.peek(product_id)
+            if product_info is not None:
+                return product_info
+            product = await ProductsRepository.get_by_id(db, product_id) if db is not None else None
+            if product and product.product_info:
+                return product.product_info
+            return {
+                "price": 0.0,
+                "image": "https://image_mockado.com.br",
+                "brand": "MockBrand",
+                "id": product_id,
+                "title": "Produto Mockado",
+                "reviewScore": 3,
+                "mocked": True
+            }
+
+    async def fetch_product_info(product_id: int) -> dict:
+        """
+            Busca as informações de um produto na API de produtos.
+
+            Chamadas concorrentes para o mesmo produto são agrupadas pelo cache de produtos,
+            então apenas uma requisição por produto fica em andamento na API.
+
+            Args:
+                product_id (int): Identificador do produto.
+
+            Raises:
+                HTTPException: Se o produto não for encontrado na API de produtos.
+                ProductCatalogUnavailableException: Se a API de produtos estiver indisponivel.
+
+            Returns:
+                dict: Informações do produto.
+        """
+        if await negative_product_cache.get(product_id):
+            raise HTTPException(status_code=404, detail="Product not found or no exist")
+
+        product_info = await product_catalog_client.get_product(product_id)
+        if product_info is None:
+            await negative_product_cache.set(product_id, True)
+            await product_swr.delete(product_id)
+            raise HTTPException(status_code=404, detail="Product not found or no exist")
+        return product_info
+
+    def parse_product_fields(fields: str | None) -> list[str] | None:
+        """
+            Converte o parâmetro `fields` em uma lista de campos do produto.
+
+            Args:
+                fields (str): Campos do produto separados por virgula.
+
+            Raises:
+                SchemaValidationError: Se algum dos campos não existir no schema ProductInfo.
+
+            Returns:
+                list[str] | None: Lista de campos ou None se nenhum campo for informado.
+        """
+        if not fields:
+            return None
+        product_fields = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+        invalid_fields = [field for field in product_fields if field not in ProductInfo.model_fields]
+        if invalid_fields:
+            raise SchemaValidationError(f"Invalid product fields: {', '.join(invalid_fields)}")
+        return product_fields or None
+
     async def get_wishlist_by_client_id(db: AsyncSession, request: GetWishlistByClientIdRequest, logger: Logger):
         """
             Obtem todos os produtos da lista de favoritos de maneira paginada
 
+            As primeiras páginas de cada cliente ficam em cache, com a versão da wishlist do cliente
+            na chave, então qualquer alteração na wishlist invalida as páginas em cache.
+
             Args:
                 db (AsyncSession): Sessão assincrona do banco de dados.
-                request (GetWishlistByClientIdRequest): Schema GetWishlistByClientIdRequest contendo os parâmetros de paginação.
+                request (GetWishlistByClientIdRequest): Schema GetWishlistByClientIdRequest contendo os parâmetros de paginação
+                    e opcionalmente os campos do produto a serem retornados. Quando `cursor` e informado a
+                    paginação e feita por keyset e `page` e ignorado.
             
+            Raises:
+                SchemaValidationError: Se algum dos campos do produto informados não existir ou se o cursor for invalido.
+
             Returns:
-                GetWishlistByClientIdResponse: Resposta contendo a lista de produtos do clientes e se ha mais paginas.
+                GetWishlistByClientIdResponse: Resposta contendo a lista de produtos do clientes, se ha mais paginas
+                    e o cursor da proxima página.
         
         """
         try:
-            wishlist, has_next = await WishlistRepository.get_by_client_id(db, request)
-            return GetWishlistByClientIdResponse(
-                items=[WishlistBase(**products.json()) for products in wishlist],
-                has_next=has_next
-            )
+            product_fields = WishlistService.parse_product_fields(request.fields)
+
+            after = None
+            if request.cursor:
+                cursor = HelperFunctions.decode_cursor(request.cursor)
+                try:
+                    after = (datetime.fromisoformat(cursor["created_at"]), int(cursor["wishlist_id"]))
+                except (KeyError, TypeError, ValueError):
+                    raise SchemaValidationError("Invalid pagination cursor.")
+
+            if (
+                request.cursor is None
+                and request.page <= WISHLIST_PAGE_CACHE_MAX_PAGE
+                and request.page_size <= WISHLIST_PAGE_CACHE_MAX_PAGE_SIZE
+            ):
+                # A versão e lida antes da consulta, então uma página consultada durante uma
+                # alteração fica com a versão antiga e não e mais encontrada.
+                version = await wishlist_versions.get_version(request.client_id)
+                if version is not None:
+                    async def load_page(session: AsyncSession) -> dict:
+                        page = await WishlistService.load_wishlist_page(session, request, product_fields, None)
+                        return page.model_dump(mode="json", exclude_unset=True)
+
+                    # A atualização em segundo plano roda depois do fim da requisição, então usa
+                    # uma sessão propria em vez da sessão da requisição.
+                    async def refresh_page() -> dict:
+                        async with AsyncSessionLocal() as session:
+                            return await load_page(session)
+
+                    cached = await wishlist_page_swr.get(
+                        f"{request.client_id}:{version}:{request.page}:{request.page_size}:{','.join(product_fields or [])}",
+                        lambda: load_page(db),
+                        refresh_page
+                    )
+                    return GetWishlistByClientIdResponse.model_validate(cached)
+
+            return await WishlistService.load_wishlist_page(db, request, product_fields, after)
+        except SchemaValidationError:
+            raise
         except Exception as e:
             raise GenericExceptions(f"Erro ao retornar a lista de clientes: {str(e)}")
         
+    async def load_wishlist_page(
+        db: AsyncSession,
+        request: GetWishlistByClientIdRequest,
+        product_fields: list[str] | None,
+        after: tuple[datetime, int] | None
+    ) -> GetWishlistByClientIdResponse:
+        """
+            Consulta uma página da wishlist do cliente no banco de dados.
+
+            Args:
+                db (AsyncSession): Sessão assincrona do banco de dados.
+                request (GetWishlistByClientIdRequest): Schema contendo os parâmetros de paginação.
+                product_fields (list[str]): Campos do produto a serem retornados.
+                after (Tuple(datetime, int)): Posição do cursor, (created_at, wishlist_id) do ultimo item da página anterior.
+
+            Returns:
+                GetWishlistByClientIdResponse: Página da wishlist do cliente.
+        """
+        wishlist, has_next = await WishlistRepository.get_by_client_id(db, request, product_fields, after)
+
+        next_cursor = None
+        if has_next and wishlist:
+            last = wishlist[-1]
+            next_cursor = HelperFunctions.encode_cursor({
+                "created_at": last.created_at.isoformat(),
+                "wishlist_id": last.wishlist_id
+            })
+
+        # A página inteira e validada em uma unica chamada, lendo os campos direto das linhas.
+        return GetWishlistByClientIdResponse.model_validate(
+            {"items": wishlist, "has_next": has_next, "next_cursor": next_cursor},
+            from_attributes=True
+        )
+
+    async def invalidate_wishlist_cache(client_id: int):
+        """
+            Invalida as páginas e os produtos favoritados do cliente em cache, deve ser chamado
+            depois do commit de qualquer alteração na wishlist do cliente.
+
+            Args:
+                client_id (int): Identificador do cliente.
+        """
+        await wishlist_versions.bump_version(client_id)
+
+    async def get_wishlist_membership(db: AsyncSession, request: GetWishlistMembershipRequest):
+        """
+            Verifica quais dos produtos informados estão na wishlist do cliente.
+
+            O resultado de cada produto consultado fica no cache por cliente e versão da wishlist,
+            então apenas os produtos ainda não conhecidos são consultados no banco de dados, em uma
+            unica query.
+
+            Args:
+                db (AsyncSession): Sessão assincrona do banco de dados.
+                request (GetWishlistMembershipRequest): Schema contendo o cliente e os produtos separados por virgula.
+
+            Raises:
+                SchemaValidationError: Se algum produto informado não for um numero inteiro ou se
+                    forem informados mais produtos que o permitido.
+                GenericExceptions: Se ocorrer um erro ao consultar a wishlist.
+
+            Returns:
+                GetWishlistMembershipResponse: Resposta contendo os produtos favoritados pelo cliente.
+        """
+        try:
+            try:
+                product_ids = list(dict.fromkeys(
+                    int(product_id) for product_id in request.product_ids.split(",") if product_id.strip()
+                ))
+            except ValueError:
+                raise SchemaValidationError("product_ids must be a comma separated list of integers.")
+            if len(product_ids) > WISHLIST_MEMBERSHIP_MAX_ITEMS:
+                raise SchemaValidationError(f"At most {WISHLIST_MEMBERSHIP_MAX_ITEMS} products can be checked at once.")
+
+            # A versão e lida antes da consulta, então um resultado consultado durante uma
+            # alteração fica com a versão antiga e não e mais encontrado.
+            version = await wishlist_versions.get_version(request.client_id)
+            cache_key = f"{request.client_id}:{version}"
+            membership = (await wishlist_membership_cache.get(cache_key) or {}) if version is not None else {}
+
+            unknown_ids = [product_id for product_id in product_ids if str(product_id) not in membership]
+            if unknown_ids:
+                favorited = await WishlistRepository.get_favorited_product_ids(db, request.client_id, unknown_ids)
+                membership = {**membership, **{str(product_id): product_id in favorited for product_id in unknown_ids}}
+                if version is not None:
+                    await wishlist_membership_cache.set(cache_key, membership)
+
+            return GetWishlistMembershipResponse(
+                favorites=[product_id for product_id in product_ids if membership[str(product_id)]]
+            )
+        except SchemaValidationError:
+            raise
+        except Exception as e:
+            raise GenericExceptions(f"Erro ao verificar a lista de favoritos -> {e}")
+
     async def add_product_in_wishlist(db: AsyncSession, wishlist_data: AddProductInWishlistRequest):
         """
             Cria um novo produto na wishlist do cliente.
@@ -49,6 +307,7 @@ class WishlistService:
                 wishlist_data (AddProductInWishlistRequest): Schema contendo os dados do produto a ser adicionado na wishlist.
 
             Raises:
+                NoResultFound: Se o cliente não for encontrado.
                 HTTPException: Se o produto ja estiver na wishlist do cliente ou se o produto não for encontrado.
                 GenericExceptions: Se ocorrer um erro ao adicionar o produto na wishlist.
             
@@ -56,38 +315,104 @@ class WishlistService:
                 WishlistBase: Retorna um objeto WishlistBase com os dados do produto adicionado na wishlist.
         """
         try:
-            product_exist_on_the_client_wishlist = await WishlistRepository.get_by_client_id_and_product_id(db, wishlist_data)
-            if product_exist_on_the_client_wishlist:
+            await ClientsService.ensure_client_exists(db, wishlist_data.client_id)
+            # Devolve a conexão usada na verificação do cliente antes da chamada a API de produtos.
+            await release_connection(db)
+            product_info = await WishlistService.get_product_info(wishlist_data.product_id, db)
+            await ProductsRepository.upsert(
+                db,
+                wishlist_data.product_id,
+                product_info,
+                overwrite=not product_info.get("mocked", False)
+            )
+            wishlist = await WishlistRepository.create(db, wishlist_data)
+            if wishlist is None:
                 raise DataAlreadyExistsException("Product already exists in the wishlist for this client.")
-            
-            product_url = f"http://challenge-api.luizalabs.com/api/product/{wishlist_data.product_id}/"
-            try:
-                response = requests.get(product_url, timeout=3)
-                if response.status_code == 200:
-                    product_info = response.json()
-                else:
-                    raise HTTPException(status_code=404, detail="Product not found or no exist")
-            except requests.exceptions.RequestException:
-                product = await WishlistRepository.get_by_product_id(db, wishlist_data.product_id)
-                if product:
-                    product_info = product.product_info
-                else:
-                    product_info = {
-                        "price": 0.0,
-                        "image": "https://image_mockado.com.br",
-                        "brand": "MockBrand",
-                        "id": wishlist_data.product_id,
-                        "title": "Produto Mockado",
-                        "reviewScore": 3,
-                        "mocked": True
-                    }
-            wishlist_data = await WishlistRepository.create(db, wishlist_data, str(product_info))
-            return WishlistBase(**wishlist_data.json())
-        except DataAlreadyExistsException as e:
+            await WishlistService.invalidate_wishlist_cache(wishlist_data.client_id)
+            return WishlistBase(**wishlist.json(), product_info=product_info)
+        except (DataAlreadyExistsException, NoResultFound, HTTPException):
             raise
         except Exception as e:
             raise GenericExceptions(f"Erro ao adicionar produto na lista de favoritos -> {e}")
 
+    async def batch_update_wishlist(db: AsyncSession, client_id: int, payload: BatchWishlistRequestPayload):
+        """
+            Adiciona e remove varios produtos da wishlist do cliente de uma unica vez.
+
+            As informações dos produtos a serem adicionados são buscadas de maneira concorrente e
+            todas as alterações são gravadas em uma unica transação.
+
+            Args:
+                db (AsyncSession): Sessão assincrona do banco de dados.
+                client_id (int): Identificador do cliente.
+                payload (BatchWishlistRequestPayload): Schema contendo os produtos a serem adicionados e removidos.
+
+            Raises:
+                NoResultFound: Se o cliente não for encontrado.
+                SchemaValidationError: Se o lote tiver mais produtos que o permitido ou se um mesmo produto
+                    for adicionado e removido no mesmo lote.
+                GenericExceptions: Se ocorrer um erro ao atualizar a wishlist.
+
+            Returns:
+                BatchWishlistResponse: Resposta contendo o resultado de cada produto do lote.
+        """
+        try:
+            add_ids = list(dict.fromkeys(payload.add))
+            remove_ids = list(dict.fromkeys(payload.remove))
+            if len(add_ids) + len(remove_ids) > WISHLIST_BATCH_MAX_ITEMS:
+                raise SchemaValidationError(f"A batch accepts at most {WISHLIST_BATCH_MAX_ITEMS} products.")
+            conflicting_ids = set(add_ids) & set(remove_ids)
+            if conflicting_ids:
+                raise SchemaValidationError(
+                    f"Products cannot be added and removed in the same batch: {', '.join(map(str, sorted(conflicting_ids)))}"
+                )
+
+            await ClientsService.ensure_client_exists(db, client_id)
+            # Devolve a conexão usada na verificação do cliente antes das chamadas a API de produtos.
+            await release_connection(db)
+
+            # A sessão não pode ser usada de maneira concorrente, então o fallback para a tabela
+            # products não e usado aqui.
+            results = await asyncio.gather(
+                *(WishlistService.get_product_info(product_id) for product_id in add_ids),
+                return_exceptions=True
+            )
+            products, not_found = {}, set()
+            for product_id, result in zip(add_ids, results):
+                if isinstance(result, HTTPException) and result.status_code == 404:
+                    not_found.add(product_id)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    products[product_id] = result
+
+            await ProductsRepository.upsert_many(db, products)
+            created, deleted = await WishlistRepository.bulk_update(db, client_id, list(products), remove_ids)
+            if created or deleted:
+                await WishlistService.invalidate_wishlist_cache(client_id)
+
+            items = [
+                BatchWishlistItemResult(
+                    product_id=product_id,
+                    action="add",
+                    status="product_not_found" if product_id in not_found
+                    else "created" if product_id in created else "already_exists"
+                )
+                for product_id in add_ids
+            ]
+            items += [
+                BatchWishlistItemResult(
+                    product_id=product_id,
+                    action="remove",
+                    status="deleted" if product_id in deleted else "not_found"
+                )
+                for product_id in remove_ids
+            ]
+            return BatchWishlistResponse(items=items)
+        except (SchemaValidationError, NoResultFound):
+            raise
+        except Exception as e:
+            raise GenericExceptions(f"Erro ao atualizar a lista de favoritos -> {e}")
 
     async def delete_product_from_wishlist(db: AsyncSession, request: DeleteProductFromWishList):
         """
@@ -106,6 +431,7 @@ class WishlistService:
         """
         try:
             await WishlistRepository.delete_by_client_id_and_product_id(db, request)
+            await WishlistService.invalidate_wishlist_cache(request.client_id)
             return {"ok": True}
         except NoResultFound:
             raise
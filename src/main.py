@@ -3,19 +3,23 @@ load_dotenv()
 
 from fastapi import FastAPI
 from src.utils.database.postgres import init_db
+from src.utils.catalog.product_catalog import product_catalog_client
+from src.utils.cache.caches import close_caches
+from src.utils.auth.passwords import password_hasher
+from src.api.services.auth_services import AuthService
 from src.api.routes.client_route import router as cliente_router
 from src.api.routes.wishlist_route import router as wishlist_router
 from src.api.routes.auth_route import router as auth_router
+from src.api.routes.metrics_route import router as metrics_router
 
 
 from fastapi import APIRouter, FastAPI, Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import NoResultFound, IntegrityError
 
 
+from src.utils.helpers.json_response import FastJSONResponse
 from src.utils.exceptions.exceptions import (
     SchemaValidationError,
     GenericExceptions,
@@ -46,6 +50,7 @@ def configure_routers(_app: FastAPI):
     _app.include_router(auth_router, prefix='/api/v1')
     _app.include_router(cliente_router, prefix='/api/v1')
     _app.include_router(wishlist_router, prefix='/api/v1')
+    _app.include_router(metrics_router, prefix='/api/v1')
 
 def configure_middlewares(_app: FastAPI):
     """
@@ -94,7 +99,7 @@ def configure_exception_handlers(_app: FastAPI):
             exc (RequestValidationError): A exceção gerada pela falha de validação.
 
         Returns:
-            JSONResponse: Resposta JSON contendo as mensagens de erro de validação.
+            FastJSONResponse: Resposta JSON contendo as mensagens de erro de validação.
         """
         errors = exc.errors()
         custom_errors = []
@@ -104,14 +109,15 @@ def configure_exception_handlers(_app: FastAPI):
             msg = "Error in the sent payload. Check your JSON" if type(err['loc'][1]) == int else f"Field not provided or invalid: {loc}"
             custom_errors.append(msg)
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=422,
-            content=jsonable_encoder({"message": custom_errors})
+            content={"message": custom_errors}
         )
 
 def configure_database(_app: FastAPI):
     """
-    Configura a conexão com o banco de dados e inicializa a base de dados.
+    Configura a conexão com o banco de dados, inicializa a base de dados e cadastra o
+    usuario administrador da API.
 
     Args:
         _app (FastAPI): Instância do aplicativo FastAPI onde a conexão com o banco de dados será configurada.
@@ -119,11 +125,27 @@ def configure_database(_app: FastAPI):
     @_app.on_event("startup")
     async def on_startup():
         await init_db()
+        await AuthService.ensure_admin_user()
+
+def configure_http_clients(_app: FastAPI):
+    """
+    Configura o encerramento dos clientes HTTP compartilhados, fechando o pool de conexões
+    keep-alive, as conexões com o cache compartilhado e o pool de threads de hash de senhas
+    quando a aplicação for finalizada.
+
+    Args:
+        _app (FastAPI): Instância do aplicativo FastAPI onde os clientes HTTP serão configurados.
+    """
+    @_app.on_event("shutdown")
+    async def on_shutdown():
+        await product_catalog_client.aclose()
+        await close_caches()
+        password_hasher.shutdown()
 
 
 def configure_health_check_endpoint(_app: FastAPI):
 
-    @_app.get('/health', status_code=200)
+    @_app.get('/health', status_code=200, response_model=dict)
     async def health_check():
         """
         Endpoint para verificar se a API está funcionando corretamente.
@@ -145,6 +167,7 @@ def create_app():
     configure_middlewares(_app)
     configure_routers(_app)
     configure_database(_app)
+    configure_http_clients(_app)
     configure_health_check_endpoint(_app)
 
     return _app
@@ -2,17 +2,44 @@ from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from src.utils.exceptions.exceptions import UnauthorizedException
+from src.utils.cache.ttl_cache import TTLCache
+import hashlib
 import os
+import time
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
+AUTH_TOKEN_CACHE_MAXSIZE = int(os.getenv("AUTH_TOKEN_CACHE_MAXSIZE", "10000"))
+AUTH_TOKEN_CACHE_MAX_TTL = float(os.getenv("AUTH_TOKEN_CACHE_MAX_TTL", "300"))
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/token")
 
-def verify_token(token: str = Depends(oauth2_scheme)):
+verified_tokens = TTLCache(maxsize=AUTH_TOKEN_CACHE_MAXSIZE, ttl=AUTH_TOKEN_CACHE_MAX_TTL)
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def invalidate_token(token: str):
+    """
+    Remove o token do cache de tokens verificados, deve ser chamado por qualquer mecanismo de
+    revogação para que a proxima requisição com o token seja verificada novamente.
+
+    Args:
+        token (str): O token JWT a ser removido.
+    """
+    verified_tokens.delete(_token_key(token))
+
+async def verify_token(token: str = Depends(oauth2_scheme)):
     """
     Verifica o token JWT fornecido e extrai o ID do usuario.
 
+    Os tokens ja verificados ficam em cache pelo digest SHA-256 do token até o `exp` do mesmo,
+    limitado a AUTH_TOKEN_CACHE_MAX_TTL segundos, então as requisições seguintes com o mesmo
+    token não verificam a assinatura novamente.
+
+    A função e assincrona para rodar no event loop, e não no pool de threads do FastAPI, então
+    o cache de tokens verificados nunca e acessado por duas threads ao mesmo tempo.
+
     Args:
         token (str): O token JWT a ser verificado.
     Returns:
@@ -20,11 +47,22 @@ def verify_token(token: str = Depends(oauth2_scheme)):
     Raises:
         UnauthorizedException: Se o token for invalido ou não contiver um ID de usuario.
     """
+    key = _token_key(token)
+    user_id = verified_tokens.get(key)
+    if user_id is not None:
+        return user_id
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
             raise UnauthorizedException
+
+        ttl = AUTH_TOKEN_CACHE_MAX_TTL
+        if payload.get("exp") is not None:
+            ttl = min(ttl, float(payload["exp"]) - time.time())
+        if ttl > 0:
+            verified_tokens.set(key, user_id, ttl)
         return user_id
     except JWTError:
         raise UnauthorizedException
\ No newline at end of file
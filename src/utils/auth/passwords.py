@@ -0,0 +1,122 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 15)))
+PASSWORD_SCRYPT_R = 8
+PASSWORD_SCRYPT_P = 1
+PASSWORD_SALT_BYTES = 16
+
+
+class PasswordHasher:
+    """
+    Gera e verifica hashes de senha com scrypt fora do event loop.
+
+    O scrypt e propositalmente lento, então o calculo roda em um pool de threads limitado a
+    `workers` threads e um semaforo limita as verificações em andamento ao mesmo valor. Com
+    muitos logins ao mesmo tempo as requisições excedentes aguardam o semaforo no event loop,
+    sem bloquear as demais rotas do worker nem acumular trabalho na fila do pool.
+
+    Os hashes ficam no formato `scrypt$<n>$<r>$<p>$<salt>$<hash>`, com salt e hash em base64,
+    então os parametros podem ser alterados sem invalidar as senhas ja cadastradas.
+
+    Args:
+        workers (int): Quantidade de threads e de verificações simultaneas.
+        n (int): Custo de CPU e memoria do scrypt para os novos hashes, potencia de 2.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, n: int = PASSWORD_SCRYPT_N):
+        self.workers = workers
+        self.n = n
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._dummy_hash: str | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+        return self._semaphore
+
+    @staticmethod
+    def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r, dklen=32)
+
+    def _hash(self, password: str) -> str:
+        salt = os.urandom(PASSWORD_SALT_BYTES)
+        digest = self._scrypt(password, salt, self.n, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P)
+        return "$".join([
+            "scrypt",
+            str(self.n),
+            str(PASSWORD_SCRYPT_R),
+            str(PASSWORD_SCRYPT_P),
+            base64.b64encode(salt).decode(),
+            base64.b64encode(digest).decode()
+        ])
+
+    def _verify(self, password: str, password_hash: str) -> bool:
+        try:
+            algorithm, n, r, p, salt, digest = password_hash.split("$")
+            if algorithm != "scrypt":
+                return False
+            expected = base64.b64decode(digest)
+            return hmac.compare_digest(self._scrypt(password, base64.b64decode(salt), int(n), int(r), int(p)), expected)
+        except ValueError:
+            return False
+
+    async def _run(self, fn, *args):
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+
+    async def hash(self, password: str) -> str:
+        """
+        Gera o hash da senha com um salt aleatorio.
+
+        Args:
+            password (str): Senha em texto plano.
+
+        Returns:
+            str: Hash da senha.
+        """
+        return await self._run(self._hash, password)
+
+    async def verify(self, password: str, password_hash: str | None) -> bool:
+        """
+        Verifica se a senha corresponde ao hash.
+
+        Quando `password_hash` e None, como no login de um usuario inexistente, a senha e
+        verificada contra um hash descartavel, então o tempo de resposta não revela se o
+        usuario existe.
+
+        Args:
+            password (str): Senha em texto plano.
+            password_hash (str): Hash armazenado da senha.
+
+        Returns:
+            bool: True se a senha corresponder ao hash.
+        """
+        if password_hash is None:
+            if self._dummy_hash is None:
+                self._dummy_hash = await self.hash(base64.b64encode(os.urandom(PASSWORD_SALT_BYTES)).decode())
+            await self._run(self._verify, password, self._dummy_hash)
+            return False
+        return await self._run(self._verify, password, password_hash)
+
+    def shutdown(self):
+        """
+        Finaliza o pool de threads.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
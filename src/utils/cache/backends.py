@@ -0,0 +1,201 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Hashable
+
+import orjson
+from redis.exceptions import RedisError
+
+from src.utils.cache.cache_versions import CacheVersions
+from src.utils.cache.ttl_cache import TTLCache
+
+
+class CacheBackend(ABC):
+    """
+    Interface dos caches usados pelos serviços.
+
+    Os valores armazenados devem ser serializaveis em JSON (dict, list, str, int, float, bool
+    e None), então o mesmo codigo funciona com o cache em memoria e com o cache compartilhado.
+
+    Alem dos valores o cache mantem versões por chave, usadas para invalidar de uma vez todas
+    as entradas que incluem a versão da chave.
+    """
+
+    @abstractmethod
+    async def get(self, key: Hashable) -> Any:
+        """
+        Retorna o valor da chave ou None se a mesma não existir ou estiver expirada.
+        """
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """
+        Armazena um valor, `ttl` sobrescreve o tempo de vida padrão do cache.
+        """
+
+    @abstractmethod
+    async def delete(self, key: Hashable):
+        """
+        Remove a chave do cache.
+        """
+
+    @abstractmethod
+    async def get_version(self, key: Hashable) -> int | None:
+        """
+        Retorna a versão atual da chave ou None se a mesma não puder ser obtida, caso em que
+        as entradas que dependem da versão não devem ser lidas nem gravadas.
+        """
+
+    @abstractmethod
+    async def bump_version(self, key: Hashable) -> int | None:
+        """
+        Incrementa a versão da chave e retorna a nova versão.
+        """
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """
+        Retorna os contadores de uso do cache.
+        """
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Cache em memoria do processo, com TTL e descarte LRU.
+
+    Com `maxbytes` o tamanho de cada entrada e o tamanho do valor serializado com orjson, o
+    mesmo armazenado pelo cache do Redis.
+
+    Args:
+        maxsize (int): Quantidade maxima de entradas e de versões no cache.
+        ttl (float): Tempo de vida padrão das entradas em segundos.
+        timer (Callable): Função que retorna o tempo atual, usada nos testes.
+        maxbytes (int): Tamanho maximo somado dos valores serializados, None desativa o limite.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        maxbytes: int | None = None
+    ):
+        self._cache = TTLCache(
+            maxsize=maxsize,
+            ttl=ttl,
+            timer=timer,
+            maxbytes=maxbytes,
+            sizeof=lambda value: len(orjson.dumps(value))
+        )
+        self._versions = CacheVersions(maxsize=maxsize)
+
+    async def get(self, key: Hashable) -> Any:
+        return self._cache.get(key)
+
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: Hashable):
+        self._cache.delete(key)
+
+    async def get_version(self, key: Hashable) -> int:
+        return self._versions.get(key)
+
+    async def bump_version(self, key: Hashable) -> int:
+        return self._versions.bump(key)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {"backend": "memory", **self._cache.stats(), "versions": len(self._versions)}
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache compartilhado entre os workers em um servidor compativel com o protocolo do Redis.
+
+    Os valores são serializados com orjson e as chaves ficam no formato `<namespace>:<chave>`.
+    Erros de conexão com o servidor não propagam, a leitura e tratada como um miss e a escrita
+    e ignorada, então o serviço continua funcionando direto no banco de dados.
+
+    As versões ficam em `<namespace>:version:<chave>` e expiram `version_ttl` segundos depois da
+    ultima alteração. Como `version_ttl` e maior que o TTL das entradas, quando a versão volta
+    para zero as entradas da versão zero anterior ja expiraram.
+
+    Args:
+        client (redis.asyncio.Redis): Cliente assincrono do Redis.
+        namespace (str): Prefixo das chaves deste cache.
+        ttl (float): Tempo de vida padrão das entradas em segundos.
+        version_ttl (float): Tempo de vida das versões em segundos.
+    """
+
+    def __init__(self, client, namespace: str, ttl: float, version_ttl: float = 86400):
+        self.client = client
+        self.namespace = namespace
+        self.ttl = ttl
+        self.version_ttl = max(version_ttl, ttl * 2)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _version_key(self, key: Hashable) -> str:
+        return f"{self.namespace}:version:{key}"
+
+    async def get(self, key: Hashable) -> Any:
+        try:
+            payload = await self.client.get(self._key(key))
+        except RedisError:
+            self.errors += 1
+            payload = None
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return orjson.loads(payload)
+
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        try:
+            await self.client.set(
+                self._key(key),
+                orjson.dumps(value),
+                px=int((self.ttl if ttl is None else ttl) * 1000)
+            )
+        except RedisError:
+            self.errors += 1
+
+    async def delete(self, key: Hashable):
+        try:
+            await self.client.delete(self._key(key))
+        except RedisError:
+            self.errors += 1
+
+    async def get_version(self, key: Hashable) -> int | None:
+        try:
+            version = await self.client.get(self._version_key(key))
+        except RedisError:
+            self.errors += 1
+            return None
+        return int(version or 0)
+
+    async def bump_version(self, key: Hashable) -> int | None:
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.incr(self._version_key(key))
+                pipe.expire(self._version_key(key), int(self.version_ttl))
+                version, _ = await pipe.execute()
+            return version
+        except RedisError:
+            self.errors += 1
+            return None
+
+    def stats(self) -> dict:
+        return {
+            "backend": "redis",
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors
+        }
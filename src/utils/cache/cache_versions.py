@@ -0,0 +1,62 @@
+import itertools
+from collections import OrderedDict
+from typing import Hashable
+
+
+class CacheVersions:
+    """
+    Versões por chave usadas para invalidar todas as entradas de cache de uma chave de uma vez.
+
+    As entradas de cache incluem a versão atual da chave, então basta incrementar a versão para
+    que as entradas antigas deixem de ser encontradas e sejam descartadas pelo LRU do cache.
+
+    As versões vem de um contador global e o mapa e limitado por LRU. Quando a versão de uma
+    chave e descartada o piso passa a ser a maior versão descartada, então uma chave sem versão
+    nunca volta para uma versão anterior a sua ultima alteração.
+
+    Args:
+        maxsize (int): Quantidade maxima de chaves com versão.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._versions: OrderedDict[Hashable, int] = OrderedDict()
+        self._counter = itertools.count(1)
+        self._floor = 0
+
+    def get(self, key: Hashable) -> int:
+        """
+        Retorna a versão atual da chave.
+
+        Args:
+            key (Hashable): Chave buscada.
+
+        Returns:
+            int: Versão atual da chave.
+        """
+        version = self._versions.get(key)
+        if version is None:
+            return self._floor
+        self._versions.move_to_end(key)
+        return version
+
+    def bump(self, key: Hashable) -> int:
+        """
+        Incrementa a versão da chave, invalidando as entradas de cache da versão anterior.
+
+        Args:
+            key (Hashable): Chave alterada.
+
+        Returns:
+            int: Nova versão da chave.
+        """
+        version = next(self._counter)
+        self._versions[key] = version
+        self._versions.move_to_end(key)
+        while len(self._versions) > self.maxsize:
+            _, evicted = self._versions.popitem(last=False)
+            self._floor = max(self._floor, evicted)
+        return version
+
+    def __len__(self) -> int:
+        return len(self._versions)
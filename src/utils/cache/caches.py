@@ -0,0 +1,85 @@
+import os
+
+import redis.asyncio as redis
+
+from src.utils.cache.backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from src.utils.cache.stale_while_revalidate import StaleWhileRevalidate
+
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+CACHE_VERSION_TTL = float(os.getenv("CACHE_VERSION_TTL", "86400"))
+CACHE_EARLY_REFRESH_BETA = float(os.getenv("CACHE_EARLY_REFRESH_BETA", "1"))
+PRODUCT_CACHE_MAXSIZE = int(os.getenv("PRODUCT_CACHE_MAXSIZE", "10000"))
+PRODUCT_CACHE_TTL = float(os.getenv("PRODUCT_CACHE_TTL", "300"))
+PRODUCT_CACHE_STALE_TTL = float(os.getenv("PRODUCT_CACHE_STALE_TTL", "86400"))
+PRODUCT_NEGATIVE_CACHE_MAXSIZE = int(os.getenv("PRODUCT_NEGATIVE_CACHE_MAXSIZE", "10000"))
+PRODUCT_NEGATIVE_CACHE_TTL = float(os.getenv("PRODUCT_NEGATIVE_CACHE_TTL", "60"))
+WISHLIST_MEMBERSHIP_CACHE_MAXSIZE = int(os.getenv("WISHLIST_MEMBERSHIP_CACHE_MAXSIZE", "10000"))
+WISHLIST_MEMBERSHIP_CACHE_TTL = float(os.getenv("WISHLIST_MEMBERSHIP_CACHE_TTL", "60"))
+WISHLIST_PAGE_CACHE_MAXSIZE = int(os.getenv("WISHLIST_PAGE_CACHE_MAXSIZE", "10000"))
+WISHLIST_PAGE_CACHE_MAXBYTES = int(os.getenv("WISHLIST_PAGE_CACHE_MAXBYTES", str(32 * 1024 * 1024)))
+WISHLIST_PAGE_CACHE_TTL = float(os.getenv("WISHLIST_PAGE_CACHE_TTL", "60"))
+WISHLIST_PAGE_CACHE_STALE_TTL = float(os.getenv("WISHLIST_PAGE_CACHE_STALE_TTL", "300"))
+WISHLIST_PAGE_CACHE_MAX_PAGE = int(os.getenv("WISHLIST_PAGE_CACHE_MAX_PAGE", "3"))
+WISHLIST_PAGE_CACHE_MAX_PAGE_SIZE = int(os.getenv("WISHLIST_PAGE_CACHE_MAX_PAGE_SIZE", "100"))
+CLIENT_CACHE_MAXSIZE = int(os.getenv("CLIENT_CACHE_MAXSIZE", "10000"))
+CLIENT_CACHE_TTL = float(os.getenv("CLIENT_CACHE_TTL", "60"))
+CLIENT_CACHE_STALE_TTL = float(os.getenv("CLIENT_CACHE_STALE_TTL", "300"))
+READ_YOUR_WRITES_WINDOW = float(os.getenv("READ_YOUR_WRITES_WINDOW", "5"))
+READ_YOUR_WRITES_MAXSIZE = int(os.getenv("READ_YOUR_WRITES_MAXSIZE", "10000"))
+
+redis_client = redis.from_url(CACHE_REDIS_URL) if CACHE_REDIS_URL else None
+
+
+def create_cache(namespace: str, maxsize: int, ttl: float, maxbytes: int | None = None) -> CacheBackend:
+    """
+    Cria um cache compartilhado no Redis quando `CACHE_REDIS_URL` estiver configurada, ou um
+    cache em memoria do processo caso contrario.
+
+    Args:
+        namespace (str): Prefixo das chaves do cache no Redis.
+        maxsize (int): Quantidade maxima de entradas do cache em memoria.
+        ttl (float): Tempo de vida padrão das entradas em segundos.
+        maxbytes (int): Tamanho maximo somado dos valores serializados no cache em memoria.
+
+    Returns:
+        CacheBackend: Cache criado.
+    """
+    if redis_client is not None:
+        return RedisCacheBackend(redis_client, namespace, ttl, version_ttl=CACHE_VERSION_TTL)
+    return MemoryCacheBackend(maxsize=maxsize, ttl=ttl, maxbytes=maxbytes)
+
+
+async def close_caches():
+    """
+    Aguarda as atualizações de cache em segundo plano e fecha as conexões com o Redis, se o
+    mesmo estiver configurado.
+    """
+    for swr in (product_swr, wishlist_page_swr, client_swr):
+        await swr.drain()
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+product_cache = create_cache("product", PRODUCT_CACHE_MAXSIZE, PRODUCT_CACHE_TTL + PRODUCT_CACHE_STALE_TTL)
+negative_product_cache = create_cache("product-not-found", PRODUCT_NEGATIVE_CACHE_MAXSIZE, PRODUCT_NEGATIVE_CACHE_TTL)
+wishlist_membership_cache = create_cache("wishlist-membership", WISHLIST_MEMBERSHIP_CACHE_MAXSIZE, WISHLIST_MEMBERSHIP_CACHE_TTL)
+wishlist_page_cache = create_cache(
+    "wishlist-page",
+    WISHLIST_PAGE_CACHE_MAXSIZE,
+    WISHLIST_PAGE_CACHE_TTL + WISHLIST_PAGE_CACHE_STALE_TTL,
+    maxbytes=WISHLIST_PAGE_CACHE_MAXBYTES
+)
+wishlist_versions = create_cache(
+    "wishlist",
+    WISHLIST_PAGE_CACHE_MAXSIZE,
+    max(WISHLIST_PAGE_CACHE_TTL + WISHLIST_PAGE_CACHE_STALE_TTL, WISHLIST_MEMBERSHIP_CACHE_TTL)
+)
+client_cache = create_cache("client", CLIENT_CACHE_MAXSIZE, CLIENT_CACHE_TTL + CLIENT_CACHE_STALE_TTL)
+client_versions = create_cache("client-version", CLIENT_CACHE_MAXSIZE, CLIENT_CACHE_TTL + CLIENT_CACHE_STALE_TTL)
+recent_writes = create_cache("recent-writes", READ_YOUR_WRITES_MAXSIZE, READ_YOUR_WRITES_WINDOW)
+
+product_swr = StaleWhileRevalidate(product_cache, PRODUCT_CACHE_TTL, PRODUCT_CACHE_STALE_TTL, beta=CACHE_EARLY_REFRESH_BETA)
+wishlist_page_swr = StaleWhileRevalidate(
+    wishlist_page_cache, WISHLIST_PAGE_CACHE_TTL, WISHLIST_PAGE_CACHE_STALE_TTL, beta=CACHE_EARLY_REFRESH_BETA
+)
+client_swr = StaleWhileRevalidate(client_cache, CLIENT_CACHE_TTL, CLIENT_CACHE_STALE_TTL, beta=CACHE_EARLY_REFRESH_BETA)
@@ -0,0 +1,52 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes para a mesma chave em uma unica execução.
+
+    Enquanto uma chamada para a chave estiver em andamento, as demais aguardam o resultado
+    (ou o erro) da mesma em vez de executar a função novamente.
+
+    A função costuma usar recursos da primeira chamada, como a sessão do banco de dados da
+    requisição, então o cancelamento da primeira chamada cancela a execução antes de liberar
+    os mesmos. As demais chamadas não recebem o cancelamento, elas executam a propria função
+    novamente, e o cancelamento de uma delas não afeta a execução compartilhada.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa `fn` para a chave, ou aguarda a execução que ja estiver em andamento.
+
+        Args:
+            key (Hashable): Chave que identifica a chamada.
+            fn (Callable): Função assincrona executada quando não houver chamada em andamento.
+
+        Returns:
+            Any: Resultado da execução compartilhada.
+        """
+        while True:
+            task = self._calls.get(key)
+            if task is None or task.done():
+                task = asyncio.ensure_future(fn())
+                self._calls[key] = task
+                task.add_done_callback(lambda done: self._forget(key, done))
+                return await task
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
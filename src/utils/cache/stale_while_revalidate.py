@@ -0,0 +1,158 @@
+import asyncio
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+from src.utils.cache.backends import CacheBackend
+from src.utils.cache.single_flight import SingleFlight
+from src.utils.helpers.helpers_functions import HelperFunctions
+
+logger = HelperFunctions.get_logger()
+
+
+class StaleWhileRevalidate:
+    """
+    Leitura de cache com TTL flexivel, stale-while-revalidate e expiração antecipada probabilistica.
+
+    As entradas ficam frescas por `ttl` segundos e continuam guardadas por mais `stale_ttl`
+    segundos. Uma entrada vencida continua sendo retornada enquanto uma unica tarefa em segundo
+    plano atualiza a mesma, então quando uma chave muito acessada vence as requisições não vão
+    todas juntas para a origem dos dados.
+
+    Para espalhar as atualizações, cada leitura de uma entrada fresca pode antecipar a
+    atualização com probabilidade crescente conforme a entrada se aproxima do vencimento,
+    proporcional ao tempo que a entrada levou para ser carregada (XFetch).
+
+    Args:
+        cache (CacheBackend): Cache onde as entradas são armazenadas.
+        ttl (float): Tempo em segundos que a entrada fica fresca.
+        stale_ttl (float): Tempo em segundos que a entrada vencida continua sendo usada.
+        beta (float): Agressividade da expiração antecipada, 0 desliga a mesma.
+        timer (Callable): Função que retorna o tempo atual, usada nos testes.
+        random_fn (Callable): Função que retorna um numero entre 0 e 1, usada nos testes.
+    """
+
+    def __init__(
+        self,
+        cache: CacheBackend,
+        ttl: float,
+        stale_ttl: float,
+        beta: float = 1.0,
+        timer: Callable[[], float] = time.time,
+        random_fn: Callable[[], float] = random.random
+    ):
+        self.cache = cache
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.beta = beta
+        self._timer = timer
+        self._random = random_fn
+        self._flight = SingleFlight()
+        self._tasks: set[asyncio.Task] = set()
+        self._refreshing: set[Hashable] = set()
+        self.stale_hits = 0
+        self.early_refreshes = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def _should_refresh(self, entry: dict, now: float) -> bool:
+        if now >= entry["fresh_until"]:
+            self.stale_hits += 1
+            return True
+        if self.beta > 0 and now - entry["delta"] * self.beta * math.log(1 - self._random()) >= entry["fresh_until"]:
+            self.early_refreshes += 1
+            return True
+        return False
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        started_at = self._timer()
+        value = await loader()
+        now = self._timer()
+        await self.cache.set(
+            key,
+            {"value": value, "fresh_until": now + self.ttl, "delta": now - started_at},
+            ttl=self.ttl + self.stale_ttl
+        )
+        return value
+
+    async def _refresh(self, key: Hashable, refresher: Callable[[], Awaitable[Any]]):
+        try:
+            await self._flight.do(key, lambda: self._load(key, refresher))
+            self.refreshes += 1
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.warning(f"Erro ao atualizar a chave {key} do cache -> {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        refresher: Callable[[], Awaitable[Any]] | None = None
+    ) -> Any:
+        """
+        Retorna o valor da chave, carregando o mesmo com `loader` quando não estiver no cache.
+
+        Args:
+            key (Hashable): Chave buscada.
+            loader (Callable): Função assincrona que carrega o valor, chamadas concorrentes para a
+                mesma chave são agrupadas em uma unica execução.
+            refresher (Callable): Função usada na atualização em segundo plano, quando a mesma não
+                puder reutilizar recursos da requisição (como a sessão do banco de dados). Por padrão
+                e usado o `loader`.
+
+        Returns:
+            Any: Valor da chave.
+        """
+        entry = await self.cache.get(key)
+        if entry is None:
+            return await self._flight.do(key, lambda: self._load(key, loader))
+
+        if self._should_refresh(entry, self._timer()) and key not in self._refreshing:
+            self._refreshing.add(key)
+            task = asyncio.create_task(self._refresh(key, refresher or loader))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return entry["value"]
+
+    async def peek(self, key: Hashable) -> Any:
+        """
+        Retorna o valor da chave mesmo que o mesmo esteja vencido, sem carregar o mesmo.
+
+        Args:
+            key (Hashable): Chave buscada.
+
+        Returns:
+            Any: Valor da chave ou None se a mesma não estiver no cache.
+        """
+        entry = await self.cache.get(key)
+        return None if entry is None else entry["value"]
+
+    async def drain(self):
+        """
+        Aguarda o fim das atualizações em segundo plano em andamento.
+        """
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def delete(self, key: Hashable):
+        await self.cache.delete(key)
+
+    def stats(self) -> dict:
+        """
+        Retorna os contadores do cache e das atualizações em segundo plano.
+
+        Returns:
+            dict: Dicionário com os contadores do cache, stale_hits, early_refreshes, refreshes,
+                refresh_errors e a quantidade de atualizações em andamento.
+        """
+        return {
+            **self.cache.stats(),
+            "stale_hits": self.stale_hits,
+            "early_refreshes": self.early_refreshes,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "refreshing": len(self._refreshing)
+        }
@@ -0,0 +1,106 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Cache em memoria com tempo de expiração (TTL) e descarte LRU.
+
+    Com `maxbytes` o cache tambem e limitado pela soma dos tamanhos das entradas, calculados por
+    `sizeof`, e entradas maiores que `maxbytes` não são armazenadas.
+
+    Args:
+        maxsize (int): Quantidade maxima de entradas no cache.
+        ttl (float): Tempo de vida padrão das entradas em segundos.
+        timer (Callable): Função que retorna o tempo atual, usada nos testes.
+        maxbytes (int): Tamanho maximo somado das entradas, None desativa o limite.
+        sizeof (Callable): Função que retorna o tamanho de um valor, obrigatoria com `maxbytes`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        maxbytes: int | None = None,
+        sizeof: Callable[[Any], int] | None = None
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._timer = timer
+        self._data: OrderedDict[Hashable, tuple[Any, float, int]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retorna o valor da chave se o mesmo existir e não estiver expirado.
+
+        Args:
+            key (Hashable): Chave buscada.
+            default (Any): Valor retornado quando a chave não for encontrada.
+
+        Returns:
+            Any: Valor armazenado ou `default`.
+        """
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= self._timer():
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """
+        Armazena um valor no cache, descartando as entradas menos usadas se necessario.
+
+        Args:
+            key (Hashable): Chave a ser armazenada.
+            value (Any): Valor a ser armazenado.
+            ttl (float): Tempo de vida da entrada, sobrescreve o TTL padrão do cache.
+        """
+        self.delete(key)
+        size = self._sizeof(value) if self.maxbytes is not None else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        self._data[key] = (value, self._timer() + (self.ttl if ttl is None else ttl), size)
+        self.bytes += size
+        while len(self._data) > self.maxsize or (self.maxbytes is not None and self.bytes > self.maxbytes):
+            _, entry = self._data.popitem(last=False)
+            self.bytes -= entry[2]
+            self.evictions += 1
+
+    def delete(self, key: Hashable):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+
+    def clear(self):
+        self._data.clear()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """
+        Retorna os contadores de uso do cache.
+
+        Returns:
+            dict: Dicionário com hits, misses, evictions, size, maxsize, bytes e maxbytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.bytes,
+            "maxbytes": self.maxbytes
+        }
@@ -0,0 +1,85 @@
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker para chamadas a serviços externos.
+
+    Depois de `failure_threshold` falhas seguidas o circuito abre e as chamadas são recusadas
+    imediatamente. Passado o `recovery_timeout` o circuito fica meio aberto e libera uma unica
+    chamada de teste, que fecha o circuito em caso de sucesso ou o abre novamente em caso de falha.
+
+    Args:
+        failure_threshold (int): Quantidade de falhas seguidas para abrir o circuito.
+        recovery_timeout (float): Tempo em segundos que o circuito fica aberto antes do teste.
+        timer (Callable): Função que retorna o tempo atual, usada nos testes.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30, timer: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._timer = timer
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.rejected = 0
+        self._probe_started_at: float | None = None
+
+    def allow_request(self) -> bool:
+        """
+        Indica se a chamada pode ser feita no estado atual do circuito.
+
+        Returns:
+            bool: True se a chamada pode seguir, False se deve falhar imediatamente.
+        """
+        now = self._timer()
+        if self.state == self.OPEN and now - self.opened_at >= self.recovery_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_started_at = None
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_started_at is None or now - self._probe_started_at >= self.recovery_timeout:
+                self._probe_started_at = now
+                return True
+
+        if self.state == self.CLOSED:
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = self._timer()
+            self._probe_started_at = None
+
+    def snapshot(self) -> dict:
+        """
+        Retorna o estado atual do circuito para monitoramento.
+
+        Returns:
+            dict: Dicionário com state, failures, rejected e o tempo restante para o proximo teste.
+        """
+        retry_in = None
+        if self.state == self.OPEN:
+            retry_in = max(0.0, self.recovery_timeout - (self._timer() - self.opened_at))
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "failure_threshold": self.failure_threshold,
+            "rejected": self.rejected,
+            "retry_in": retry_in
+        }
@@ -0,0 +1,163 @@
+import asyncio
+import os
+
+import httpx
+
+from src.utils.catalog.circuit_breaker import CircuitBreaker
+from src.utils.exceptions.exceptions import ProductCatalogUnavailableException
+
+PRODUCT_API_URL = os.getenv("PRODUCT_API_URL", "http://challenge-api.luizalabs.com/api/product")
+PRODUCT_API_TIMEOUT = float(os.getenv("PRODUCT_API_TIMEOUT", "3"))
+PRODUCT_API_RETRIES = int(os.getenv("PRODUCT_API_RETRIES", "1"))
+PRODUCT_API_RETRY_BACKOFF = float(os.getenv("PRODUCT_API_RETRY_BACKOFF", "0.1"))
+PRODUCT_API_RETRY_BUDGET_RATIO = float(os.getenv("PRODUCT_API_RETRY_BUDGET_RATIO", "0.2"))
+PRODUCT_API_RETRY_BUDGET_MAX_TOKENS = int(os.getenv("PRODUCT_API_RETRY_BUDGET_MAX_TOKENS", "10"))
+PRODUCT_API_MAX_CONNECTIONS = int(os.getenv("PRODUCT_API_MAX_CONNECTIONS", "100"))
+PRODUCT_API_MAX_KEEPALIVE = int(os.getenv("PRODUCT_API_MAX_KEEPALIVE", "20"))
+PRODUCT_API_BREAKER_FAILURE_THRESHOLD = int(os.getenv("PRODUCT_API_BREAKER_FAILURE_THRESHOLD", "5"))
+PRODUCT_API_BREAKER_RECOVERY_TIMEOUT = float(os.getenv("PRODUCT_API_BREAKER_RECOVERY_TIMEOUT", "30"))
+
+
+class RetryBudget:
+    """
+    Limita a quantidade de retentativas feitas contra a API de produtos.
+
+    Cada requisição deposita `ratio` tokens e cada retentativa consome um token, então
+    durante uma indisponibilidade as retentativas ficam limitadas a uma fração do trafego
+    normal em vez de multiplicar a carga sobre a API.
+
+    Args:
+        ratio (float): Fração de retentativas permitida em relação as requisições.
+        max_tokens (int): Quantidade maxima de tokens acumulados, tambem usada como saldo inicial.
+    """
+
+    def __init__(self, ratio: float = PRODUCT_API_RETRY_BUDGET_RATIO, max_tokens: int = PRODUCT_API_RETRY_BUDGET_MAX_TOKENS):
+        self.ratio = ratio
+        self.max_tokens = float(max_tokens)
+        self._tokens = float(max_tokens)
+
+    def on_request(self):
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def can_retry(self) -> bool:
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+
+class ProductCatalogClient:
+    """
+    Cliente assincrono da API de produtos.
+
+    Mantem um unico `httpx.AsyncClient` com pool de conexões keep-alive, evitando abrir uma
+    conexão nova a cada produto favoritado e sem bloquear o event loop. As chamadas passam por
+    um circuit breaker, então com a API fora do ar as chamadas falham imediatamente.
+
+    Args:
+        base_url (str): URL base da API de produtos, pode apontar para um stub local.
+        timeout (float): Timeout padrão de cada chamada em segundos.
+        retries (int): Quantidade padrão de retentativas por chamada.
+        backoff (float): Tempo base de espera entre as retentativas em segundos.
+        retry_budget (RetryBudget): Limite de retentativas compartilhado entre as chamadas.
+        circuit_breaker (CircuitBreaker): Circuit breaker compartilhado entre as chamadas.
+        transport (httpx.AsyncBaseTransport): Transporte alternativo, usado nos testes.
+    """
+
+    def __init__(
+        self,
+        base_url: str = PRODUCT_API_URL,
+        timeout: float = PRODUCT_API_TIMEOUT,
+        retries: int = PRODUCT_API_RETRIES,
+        backoff: float = PRODUCT_API_RETRY_BACKOFF,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        transport: httpx.AsyncBaseTransport | None = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.retry_budget = retry_budget or RetryBudget()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=PRODUCT_API_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=PRODUCT_API_BREAKER_RECOVERY_TIMEOUT
+        )
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=PRODUCT_API_MAX_CONNECTIONS,
+                    max_keepalive_connections=PRODUCT_API_MAX_KEEPALIVE
+                ),
+                transport=self._transport
+            )
+        return self._client
+
+    async def get_product(self, product_id: int, timeout: float | None = None, retries: int | None = None) -> dict | None:
+        """
+        Busca as informações de um produto na API de produtos.
+
+        Args:
+            product_id (int): Identificador do produto.
+            timeout (float): Timeout desta chamada, sobrescreve o padrão do cliente.
+            retries (int): Retentativas desta chamada, sobrescreve o padrão do cliente.
+
+        Apenas o status 404 indica que o produto não existe. Qualquer outro status diferente de
+        200, como 429 ou 403, e tratado como indisponibilidade da API, então o produto não vai para
+        o cache negativo e os fallbacks do serviço são usados.
+
+        Raises:
+            ProductCatalogUnavailableException: Se a API não responder depois das retentativas, se
+                responder com um status inesperado ou se o circuito estiver aberto.
+
+        Returns:
+            dict | None: Informações do produto ou None se o produto não existir.
+        """
+        if not self.circuit_breaker.allow_request():
+            raise ProductCatalogUnavailableException("Product catalog is unavailable -> circuit open")
+
+        attempts = 1 + (self.retries if retries is None else retries)
+        self.retry_budget.on_request()
+        last_error = None
+
+        for attempt in range(attempts):
+            if attempt > 0:
+                if not self.retry_budget.can_retry():
+                    break
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                response = await self._get_client().get(
+                    f"/{product_id}/",
+                    timeout=self.timeout if timeout is None else timeout
+                )
+            except httpx.HTTPError as e:
+                last_error = e
+                continue
+
+            if response.status_code in (200, 404):
+                self.circuit_breaker.record_success()
+                return response.json() if response.status_code == 200 else None
+            last_error = f"status {response.status_code}"
+            # Apenas 429 e 5xx são temporarios, os demais status não mudam em uma retentativa.
+            if response.status_code != 429 and response.status_code < 500:
+                break
+
+        self.circuit_breaker.record_failure()
+        raise ProductCatalogUnavailableException(f"Product catalog is unavailable -> {last_error}")
+
+    async def aclose(self):
+        """
+        Fecha o pool de conexões do cliente.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+product_catalog_client = ProductCatalogClient()
@@ -0,0 +1,56 @@
+import time
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool de conexões assincrono do SQLAlchemy que mede o tempo de espera por uma conexão.
+
+    O tempo de cada checkout inclui a espera por uma conexão livre e, quando o pool ainda
+    esta crescendo, a abertura da conexão. Os contadores são do processo e reiniciam quando
+    o pool e recriado pelo `engine.dispose()`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def stats(self) -> dict:
+        """
+        Retorna o estado atual do pool e os contadores de espera.
+
+        Returns:
+            dict: Dicionário com pool_size, max_overflow, checked_out, idle, overflow,
+                checkouts, timeouts e os tempos de espera em segundos.
+        """
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout": self.timeout(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(0, self.overflow()),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_total": self.wait_total,
+            "wait_avg": self.wait_total / self.checkouts if self.checkouts else 0.0,
+            "wait_max": self.wait_max
+        }
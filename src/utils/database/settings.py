@@ -0,0 +1,77 @@
+import os
+from dataclasses import dataclass
+
+from src.utils.database.pool import InstrumentedAsyncQueuePool
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """
+    Configurações da conexão e do pool de conexões com o banco de dados.
+
+    Os padrões são os mesmos do SQLAlchemy e do asyncpg. Com varios workers cada processo tem
+    o seu pool, então `(pool_size + max_overflow) * workers` deve ficar abaixo do
+    `max_connections` do PostgreSQL.
+
+    Args:
+        url (str): URL de conexão com o banco de dados.
+        pool_size (int): Quantidade de conexões mantidas abertas no pool.
+        max_overflow (int): Conexões extras abertas acima de `pool_size` nos picos, fechadas na devolução.
+        pool_timeout (float): Tempo maximo em segundos aguardando uma conexão livre.
+        pool_recycle (int): Idade maxima em segundos de uma conexão antes de ser reaberta, -1 desativa.
+        pool_pre_ping (bool): Testa a conexão antes de cada uso, descartando conexões derrubadas.
+        statement_cache_size (int): Tamanho do cache de prepared statements por conexão do asyncpg
+            e do SQLAlchemy, deve ser 0 atras de um pgbouncer em modo transaction.
+    """
+
+    url: str
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    statement_cache_size: int = 100
+
+    @classmethod
+    def from_env(cls, prefix: str = "DATABASE") -> "DatabaseSettings":
+        """
+        Carrega as configurações das variaveis de ambiente `<prefix>_URL`, `<prefix>_POOL_SIZE`,
+        `<prefix>_MAX_OVERFLOW`, `<prefix>_POOL_TIMEOUT`, `<prefix>_POOL_RECYCLE`,
+        `<prefix>_POOL_PRE_PING` e `<prefix>_STATEMENT_CACHE_SIZE`.
+
+        Args:
+            prefix (str): Prefixo das variaveis de ambiente.
+
+        Returns:
+            DatabaseSettings: Configurações carregadas, com os padrões nas variaveis não definidas.
+        """
+        return cls(
+            url=os.getenv(f"{prefix}_URL"),
+            pool_size=int(os.getenv(f"{prefix}_POOL_SIZE", str(cls.pool_size))),
+            max_overflow=int(os.getenv(f"{prefix}_MAX_OVERFLOW", str(cls.max_overflow))),
+            pool_timeout=float(os.getenv(f"{prefix}_POOL_TIMEOUT", str(cls.pool_timeout))),
+            pool_recycle=int(os.getenv(f"{prefix}_POOL_RECYCLE", str(cls.pool_recycle))),
+            pool_pre_ping=os.getenv(f"{prefix}_POOL_PRE_PING", str(cls.pool_pre_ping)).lower() in ("1", "true", "yes"),
+            statement_cache_size=int(os.getenv(f"{prefix}_STATEMENT_CACHE_SIZE", str(cls.statement_cache_size)))
+        )
+
+    def engine_kwargs(self) -> dict:
+        """
+        Retorna os parametros do `create_async_engine` para estas configurações.
+
+        Returns:
+            dict: Parametros do engine, incluindo o pool instrumentado.
+        """
+        return {
+            "echo": False,
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "connect_args": {
+                "statement_cache_size": self.statement_cache_size,
+                "prepared_statement_cache_size": self.statement_cache_size
+            }
+        }
@@ -20,3 +20,8 @@ class DataAlreadyExistsException(HTTPException):
     def __init__(self, message: str):
         super().__init__(status_code=409, detail=message)
         self._message = message
+
+class ProductCatalogUnavailableException(HTTPException):
+    def __init__(self, message: str = "Product catalog is unavailable."):
+        super().__init__(status_code=503, detail=message)
+        self._message = message
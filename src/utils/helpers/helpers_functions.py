@@ -1,11 +1,15 @@
 import logging
 import sys
+import base64
+import json
 from os import environ
 from datetime import datetime
 from pytz import timezone
 import logging
 import sys
 
+from src.utils.exceptions.exceptions import SchemaValidationError
+
 class HelperFunctions:
     """
         Esta classe agrupa as funções de funções auxiliares.
@@ -13,18 +17,6 @@ class HelperFunctions:
 
     logger = None
 
-    @staticmethod
-    def get_time(time_zone: str = 'America/Sao_Paulo'):
-
-        """
-            Retorna a hora atual pra timezone
-        """
-
-        try:
-            return datetime.now().astimezone(timezone(time_zone))
-        except Exception as error:
-            pass
-    
     @staticmethod
     def timetz(*args):
         """
@@ -36,6 +28,42 @@ class HelperFunctions:
         tz = timezone('America/Sao_Paulo')
         return datetime.now(tz).timetuple()
 
+    @staticmethod
+    def encode_cursor(values: dict) -> str:
+        """
+            Gera um cursor opaco de paginação a partir dos valores da ultima linha retornada.
+
+        Args:
+            values (dict): Valores da chave de ordenação da ultima linha da página.
+
+        Returns:
+            str: Cursor codificado em base64 url-safe.
+        """
+        payload = json.dumps(values, separators=(",", ":"), default=str).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> dict:
+        """
+            Decodifica um cursor de paginação gerado por `encode_cursor`.
+
+        Args:
+            cursor (str): Cursor recebido na requisição.
+
+        Raises:
+            SchemaValidationError: Se o cursor for invalido.
+
+        Returns:
+            dict: Valores da chave de ordenação contidos no cursor.
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if not isinstance(values, dict):
+                raise ValueError
+            return values
+        except ValueError:
+            raise SchemaValidationError("Invalid pagination cursor.")
+
     @staticmethod
     def get_logger(name: str = "clients-wishlist-api") -> logging.Logger:
         """
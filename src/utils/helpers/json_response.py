@@ -0,0 +1,25 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Resposta JSON serializada direto para bytes com orjson, sem passar pelo `jsonable_encoder`.
+
+    Datas, UUIDs e dataclasses são serializados pelo proprio orjson e os schemas do Pydantic
+    com `model_dump(mode="json")`. Deve ser usada nas respostas montadas manualmente, como
+    nos manipuladores de exceção. As rotas com `response_model` não devem usar esta classe,
+    com a classe padrão o FastAPI ja serializa o schema direto para bytes pelo Pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
+from src.utils.database.postgres import Base
+
+class Products(Base):
+    """
+    Modelo de dados para a tabela de Produtos.
+
+    Guarda uma unica vez as informações de cada produto retornadas pela API de produtos,
+    compartilhadas por todas as wishlists que possuem o produto.
+
+    Atributos:
+        product_id (int): Identificador único do produto.
+        product_info (dict): Informações sobre o produto, armazenadas como JSONB.
+        updated_at (DateTime): Data e hora da ultima atualização das informações do produto.
+
+    Métodos:
+        __repr__(): Retorna uma representação em string do objeto Products.
+        json(): Retorna um dicionário com os dados do produto.
+        __str__(): Retorna uma string formatada com os detalhes do produto.
+    """
+    __tablename__ = "products"
+
+    product_id = Column(Integer, primary_key=True, autoincrement=False)
+    product_info = Column(JSONB)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+    def __repr__(self):
+        return f"<Products(product_id={self.product_id}, product_info={self.product_info}, updated_at={self.updated_at})>"
+
+    def json(self):
+        return {
+            "product_id": self.product_id,
+            "product_info": self.product_info,
+            "updated_at": self.updated_at
+        }
+
+    def __str__(self):
+        return f"Products(product_id={self.product_id})"
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, String, DateTime, func
+from src.utils.database.postgres import Base
+
+class Users(Base):
+    """
+    Modelo de dados para a tabela de Usuarios da API.
+
+    Atributos:
+        id (int): Identificador único do usuario.
+        username (str): Nome de usuario usado no login, deve ser único.
+        password_hash (str): Hash scrypt da senha do usuario.
+        created_at (DateTime): Data e hora de criação do usuario.
+
+    Métodos:
+        __repr__(): Retorna uma representação em string do objeto Users.
+        json(): Retorna um dicionário com os dados do usuario, sem o hash da senha.
+        __str__(): Retorna uma string formatada com os detalhes do usuario.
+    """
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True, index=True)
+    username = Column(String, unique=True, nullable=False)
+    password_hash = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+    def __repr__(self):
+        return f"<Users(id={self.id}, username={self.username}, created_at={self.created_at})>"
+
+    def json(self):
+        return {
+            "id": self.id,
+            "username": self.username,
+            "created_at": self.created_at
+        }
+
+    def __str__(self):
+        return f"Usuario(id={self.id}, username={self.username})"
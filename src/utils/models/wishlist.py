@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Index, Integer, String, DateTime
+from sqlalchemy import Column, Index, Integer, DateTime, UniqueConstraint, func
 from src.utils.database.postgres import Base
 
 class Wishlist(Base):
@@ -8,8 +8,8 @@ class Wishlist(Base):
     Atributos:
         wishlist_id (int): Identificador único da wishlist.
         client_id (int): Identificador do cliente associado à wishlist.
-        product_id (int): Identificador do produto na wishlist.
-        product_info (str): Informações sobre o produto.
+        product_id (int): Identificador do produto na wishlist, as informações do produto
+            ficam na tabela products.
         created_at (DateTime): Data e hora de criação da wishlist.
 
     Métodos:
@@ -24,11 +24,11 @@ class Wishlist(Base):
     wishlist_id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, nullable=False, index=True)
     product_id = Column(Integer, index=True)
-    product_info = Column(String)
-    created_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
-        Index('idx_wishlist_client_product', 'client_id', 'product_id'),
+        UniqueConstraint('client_id', 'product_id', name='uq_wishlist_client_product'),
+        Index('idx_wishlist_client_created', 'client_id', 'created_at', 'wishlist_id'),
     )
 
 
@@ -36,7 +36,6 @@ class Wishlist(Base):
         return f"<Wishlist(wishlist_id={self.wishlist_id}," \
                f"client_id={self.client_id},"\
                f"product_id={self.product_id},"\
-               f"product_info={self.product_info},"\
                f"created_at={self.created_at})>"
     
     def json(self):
@@ -44,7 +43,6 @@ class Wishlist(Base):
             "wishlist_id": self.wishlist_id,
             "client_id": self.client_id,
             "product_id": self.product_id,
-            "product_info": self.product_info,
             "created_at": self.created_at
         }
     
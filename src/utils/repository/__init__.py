@@ -1,2 +1,4 @@
 from .clients_repository import ClientsRepository
-from .wishlist_repository import WishlistRepository
\ No newline at end of file
+from .wishlist_repository import WishlistRepository
+from .products_repository import ProductsRepository
+from .users_repository import UsersRepository
\ No newline at end of file
@@ -1,33 +1,45 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy import Row, delete, func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.future import select
-from src.utils.exceptions.exceptions import DataAlreadyExistsException
 from src.utils.models.clients import Clients
 from src.utils.schemas.clients_schema import ClientsCreate, ClientsUpdate, ListAllClientsRequest
-from src.utils.helpers.helpers_functions import HelperFunctions
+from src.utils.cache.caches import client_versions
 
 
 class ClientsRepository:
 
-    async def get_all(db: AsyncSession, request: ListAllClientsRequest) -> tuple[list[Clients], bool]:
+    async def get_all(db: AsyncSession, request: ListAllClientsRequest, after_id: int | None = None) -> tuple[list[Row], bool]:
         """
-            Obter todos os clientes de maneira paginada.
+            Obter todos os clientes de maneira paginada, ordenados pelo ID.
+
+            Quando `after_id` e informado a paginação e feita por keyset, buscando os clientes
+            com ID maior que o ultimo cliente da página anterior pela chave primaria. Sem `after_id`
+            e usado o OFFSET de `page`.
+
+            A consulta seleciona apenas as colunas retornadas pela API, então as linhas não são
+            carregadas como objetos Clients nem registradas no identity map da sessão.
 
             Args:
                 db (AsyncSession): Sessão assíncrona do banco de dados.
                 request (ListAllClientsRequest): Schema contendo os parâmetros de paginação.
+                after_id (int): ID do ultimo cliente da página anterior.
             Returns:
-                Tuple(List[Clients], bool): Lista de clientes e um booleano (has_next) indicando se ha mais paginas
+                Tuple(List[Row], bool): Lista de linhas (id, nome, email, created_at) dos clientes e um
+                    booleano (has_next) indicando se ha mais paginas
         """
         try:
+            statement = select(Clients.id, Clients.nome, Clients.email, Clients.created_at)
+            if after_id is not None:
+                statement = statement.where(Clients.id > after_id)
+            elif request.page > 1:
+                statement = statement.offset((request.page - 1) * request.page_size)
+
             result = await db.execute(
-                select(
-                    Clients
-                ).offset(
-                    (request.page - 1) * request.page_size
-                ).limit(request.page_size + 1)
+                statement.order_by(Clients.id).limit(request.page_size + 1)
             )
-            rows = result.scalars().all()
+            rows = result.all()
             has_next = len(rows) > request.page_size
             rows = rows[:request.page_size]
 
@@ -56,94 +68,101 @@ class ClientsRepository:
         except Exception as e:
             raise
     
-    async def get_by_email(db: AsyncSession, email: str) -> Clients | None:
+    async def create(db: AsyncSession, Clients_data: ClientsCreate) -> Clients | None:
         """
-            Obter um cliente pelo email.
-
-            Args:
-                db (AsyncSession): Sessão assíncrona do banco de dados.
-                email (str): Email do cliente a ser buscado.
-
-            Returns:
-                Clients: Cliente encontrado ou None se não encontrado.
-        """
-        try:
-            result = await db.execute(select(Clients).where(Clients.email == email))
-            return result.scalars().first()
-        except Exception as e:
-            raise
-    
-    async def create(db: AsyncSession, Clients_data: ClientsCreate) -> Clients:
-        """
-        Cria um novo cliente no banco de dados.
+        Cria um novo cliente no banco de dados em um unico comando INSERT ... ON CONFLICT (email)
+        DO NOTHING RETURNING, o ID e a data de criação são gerados pelo banco de dados e o indice
+        unico do email garante que o mesmo não seja cadastrado duas vezes.
 
         Args:
             db (AsyncSession): Sessão assíncrona do banco de dados.
             Clients_data (ClientsCreate): Dados do cliente a ser criado.
 
         Returns:
-            Clients: Cliente criado com os dados do mesmo.
+            Clients | None: Cliente criado com os dados do mesmo ou None se o email ja estiver cadastrado.
         """
         try:
-            client = Clients(**Clients_data.dict())
-            client.created_at = HelperFunctions.get_time().replace(tzinfo=None)
-            db.add(client)
+            result = await db.execute(
+                insert(Clients).values(**Clients_data.dict()).on_conflict_do_nothing(
+                    index_elements=[Clients.email]
+                ).returning(Clients)
+            )
+            client = result.scalars().first()
             await db.commit()
-            await db.refresh(client)
             return client
         except Exception as e:
             raise
 
+    async def invalidate_cache(clients_id: int):
+        """
+        Invalida o cliente no cache de clientes, deve ser chamado depois do commit de qualquer
+        alteração no cliente.
+
+        Args:
+            clients_id (int): ID do cliente alterado.
+        """
+        await client_versions.bump_version(clients_id)
+
     async def update(db: AsyncSession, clients_id: int, clients_data: ClientsUpdate) -> Clients:
         """
-        Atualiza os dados de um cliente existente.
+        Atualiza os dados de um cliente existente em um unico comando UPDATE ... RETURNING e
+        invalida o mesmo no cache de clientes. A data de atualização e gerada pelo banco de dados
+        e o indice unico do email garante que o mesmo não pertença a outro cliente.
 
         Args:
             db (AsyncSession): Sessão assíncrona do banco de dados.
             clients_id (int): ID do cliente a ser atualizado.
             clients_data (ClientsUpdate): Dados atualizados do cliente.
         
+        Raises:
+            NoResultFound: Se o cliente não for encontrado.
+            IntegrityError: Se o email informado ja estiver cadastrado para outro cliente.
+
         Returns:
             Clients: Cliente atualizado com os novos dados.
         """
         try:
-            client = await db.get(Clients, clients_id)
-            if not client:
-                raise NoResultFound
-            
-            if clients_data.email:
-                existing_client_by_email = await ClientsRepository.get_by_email(db, clients_data.email)
-                if existing_client_by_email:
-                    raise DataAlreadyExistsException("Client with this parameter already exists in the base")
-            
-            data = clients_data.dict(exclude_unset=True)
-            for key, value in data.items():
-                if value is not None:
-                    setattr(client, key, value)
-            client.updated_at = HelperFunctions.get_time().replace(tzinfo=None)
+            data = {key: value for key, value in clients_data.dict(exclude_unset=True).items() if value is not None}
+            result = await db.execute(
+                update(Clients).where(
+                    Clients.id == clients_id
+                ).values(**data, updated_at=func.now()).returning(Clients).execution_options(synchronize_session=False)
+            )
+            client = result.scalars().first()
             await db.commit()
-            await db.refresh(client)
+            if client is None:
+                raise NoResultFound
+            await ClientsRepository.invalidate_cache(clients_id)
             return client
         except Exception as e:
             raise
 
     async def delete(db: AsyncSession, Clients_id: int) -> Clients:
         """
-        Deleta um cliente pelo ID.
+        Deleta um cliente pelo ID em um unico comando DELETE ... RETURNING e invalida o mesmo
+        no cache de clientes.
 
         Args:
             db (AsyncSession): Sessão assíncrona do banco de dados.
             Clients_id (int): ID do cliente a ser deletado.
         
+        Raises:
+            NoResultFound: Se o cliente não for encontrado.
+
         returns:
             Clients: Cliente deletado com os dados do mesmo.
         """
         try:
-            client = await db.get(Clients, Clients_id)
-            if not client:
-                raise NoResultFound
-            await db.delete(client)
+            result = await db.execute(
+                delete(Clients).where(
+                    Clients.id == Clients_id
+                ).returning(Clients).execution_options(synchronize_session=False)
+            )
+            client = result.scalars().first()
             await db.commit()
+            await ClientsRepository.invalidate_cache(Clients_id)
+            if client is None:
+                raise NoResultFound
             return client
         except Exception as e:
             raise
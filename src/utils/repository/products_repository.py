@@ -0,0 +1,86 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Boolean, cast, func
+from sqlalchemy.dialects.postgresql import insert
+from src.utils.models.products import Products
+
+
+class ProductsRepository:
+
+    async def get_by_id(db: AsyncSession, product_id: int) -> Products | None:
+        """
+            Obter um produto pelo ID.
+
+            Args:
+                db (AsyncSession): Sessão assíncrona do banco de dados.
+                product_id (int): ID do produto a ser buscado.
+            Returns:
+                Products: Produto encontrado ou None se não encontrado.
+        """
+        try:
+            return await db.get(Products, product_id)
+        except Exception as e:
+            raise
+
+    async def upsert(db: AsyncSession, product_id: int, product_info: dict, overwrite: bool = True):
+        """
+        Insere ou atualiza as informações de um produto, sem realizar o commit da transação.
+
+        Quando as informações do produto não mudaram a linha não é reescrita.
+
+        Args:
+            db (AsyncSession): Sessão assíncrona do banco de dados.
+            product_id (int): ID do produto.
+            product_info (dict): Informações do produto.
+            overwrite (bool): Se False mantem as informações do produto ja existente, usado
+                para não sobrescrever um produto real com um produto mockado.
+        """
+        try:
+            statement = insert(Products).values(product_id=product_id, product_info=product_info)
+            if overwrite:
+                statement = statement.on_conflict_do_update(
+                    index_elements=[Products.product_id],
+                    set_={
+                        "product_info": statement.excluded.product_info,
+                        "updated_at": func.now()
+                    },
+                    where=Products.product_info.is_distinct_from(statement.excluded.product_info)
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=[Products.product_id])
+            await db.execute(statement)
+        except Exception as e:
+            raise
+
+    async def upsert_many(db: AsyncSession, products: dict[int, dict]):
+        """
+        Insere ou atualiza as informações de varios produtos em um unico comando, sem realizar
+        o commit da transação.
+
+        Produtos mockados não sobrescrevem as informações de um produto ja existente e quando
+        as informações do produto não mudaram a linha não é reescrita. As linhas são enviadas
+        ordenadas pelo ID do produto, então lotes concorrentes com produtos em comum travam as
+        linhas na mesma ordem e não entram em deadlock.
+
+        Args:
+            db (AsyncSession): Sessão assíncrona do banco de dados.
+            products (dict[int, dict]): Informações dos produtos indexadas pelo ID do produto.
+        """
+        try:
+            if not products:
+                return
+            statement = insert(Products).values([
+                {"product_id": product_id, "product_info": product_info}
+                for product_id, product_info in sorted(products.items())
+            ])
+            statement = statement.on_conflict_do_update(
+                index_elements=[Products.product_id],
+                set_={
+                    "product_info": statement.excluded.product_info,
+                    "updated_at": func.now()
+                },
+                where=Products.product_info.is_distinct_from(statement.excluded.product_info)
+                & ~func.coalesce(cast(statement.excluded.product_info["mocked"].astext, Boolean), False)
+            )
+            await db.execute(statement)
+        except Exception as e:
+            raise
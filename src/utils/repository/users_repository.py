@@ -0,0 +1,48 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+from src.utils.models.users import Users
+
+
+class UsersRepository:
+
+    async def get_by_username(db: AsyncSession, username: str) -> Users | None:
+        """
+            Obter um usuario pelo nome de usuario.
+
+            Args:
+                db (AsyncSession): Sessão assíncrona do banco de dados.
+                username (str): Nome de usuario a ser buscado.
+            Returns:
+                Users: Usuario encontrado ou None se não encontrado.
+        """
+        try:
+            result = await db.execute(select(Users).where(Users.username == username))
+            return result.scalars().first()
+        except Exception as e:
+            raise
+
+    async def create(db: AsyncSession, username: str, password_hash: str) -> Users | None:
+        """
+        Cria um novo usuario em um unico comando INSERT ... ON CONFLICT (username) DO NOTHING
+        RETURNING.
+
+        Args:
+            db (AsyncSession): Sessão assíncrona do banco de dados.
+            username (str): Nome de usuario.
+            password_hash (str): Hash da senha do usuario, gerado pelo PasswordHasher.
+
+        Returns:
+            Users | None: Usuario criado ou None se o nome de usuario ja estiver cadastrado.
+        """
+        try:
+            result = await db.execute(
+                insert(Users).values(username=username, password_hash=password_hash).on_conflict_do_nothing(
+                    index_elements=[Users.username]
+                ).returning(Users)
+            )
+            user = result.scalars().first()
+            await db.commit()
+            return user
+        except Exception as e:
+            raise
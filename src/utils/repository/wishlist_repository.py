@@ -1,31 +1,79 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from sqlalchemy import Integer, any_, bindparam, delete, func, tuple_
 from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from src.utils.exceptions.exceptions import GenericExceptions
 from src.utils.models.wishlist import Wishlist
+from src.utils.models.products import Products
 from src.utils.schemas.wishlist_schema import (
     AddProductInWishlistRequest,
     GetWishlistByClientIdRequest,
     DeleteProductFromWishList
 )
-from src.utils.helpers.helpers_functions import HelperFunctions
 from sqlalchemy.exc import NoResultFound
 
 
 class WishlistRepository:
     
-    async def get_by_client_id(db: AsyncSession, request: GetWishlistByClientIdRequest):
+    async def get_by_client_id(
+        db: AsyncSession,
+        request: GetWishlistByClientIdRequest,
+        product_fields: list[str] | None = None,
+        after: tuple[datetime, int] | None = None
+    ):
+        """
+        Obtem os produtos da wishlist do cliente de maneira paginada, ordenados por
+        (created_at, wishlist_id), junto com as informações de cada produto vindas da tabela products.
+
+        Quando `after` e informado a paginação e feita por keyset, buscando as linhas depois da
+        ultima linha da página anterior pelo indice idx_wishlist_client_created, então o custo
+        não cresce com a profundidade da página. Sem `after` e usado o OFFSET de `page`.
+
+        Args:
+            db (AsyncSession): Sessão assincrona do banco de dados.
+            request (GetWishlistByClientIdRequest): Schema contendo o cliente e os parâmetros de paginação.
+            product_fields (list[str]): Campos do produto a serem retornados, a projeção e feita no
+                banco de dados. Quando não informado todas as informações do produto são retornadas.
+            after (tuple[datetime, int]): created_at e wishlist_id da ultima linha da página anterior.
+        Returns:
+            Tuple(List[Row], bool): Lista de linhas (wishlist_id, client_id, product_id, created_at,
+                product_info) da wishlist e um booleano (has_next) indicando se ha mais paginas. As
+                linhas não são carregadas como objetos Wishlist, apenas as colunas usadas na resposta
+                são selecionadas.
+        """
         try:
+            product_info = Products.product_info
+            if product_fields:
+                product_info = func.jsonb_build_object(
+                    *[item for field in product_fields for item in (field, Products.product_info[field])]
+                )
+
+            statement = select(
+                Wishlist.wishlist_id,
+                Wishlist.client_id,
+                Wishlist.product_id,
+                Wishlist.created_at,
+                product_info.label("product_info")
+            ).outerjoin(
+                Products, Products.product_id == Wishlist.product_id
+            ).where(
+                Wishlist.client_id == request.client_id
+            )
+
+            if after is not None:
+                statement = statement.where(tuple_(Wishlist.created_at, Wishlist.wishlist_id) > tuple_(*after))
+            elif request.page > 1:
+                statement = statement.offset((request.page - 1) * request.page_size)
+
             result = await db.execute(
-                select(
-                    Wishlist
-                ).where(
-                    Wishlist.client_id == request.client_id
-                ).offset(
-                    (request.page - 1) * request.page_size
+                statement.order_by(
+                    Wishlist.created_at,
+                    Wishlist.wishlist_id
                 ).limit(request.page_size + 1)
-                )
-        
-            rows = result.scalars().all()
+            )
+
+            rows = result.all()
             has_next = len(rows) > request.page_size
             rows = rows[:request.page_size]
 
@@ -33,84 +81,131 @@ class WishlistRepository:
         except Exception as e:
             raise
     
-    async def get_by_product_id(db: AsyncSession, product_id: int) -> Wishlist:
-        try:
-            result = await db.execute(select(Wishlist).where(Wishlist.product_id == product_id))
-            return result.scalars().first()
-        except Exception as e:
-            raise
-    
-    async def get_by_client_id_and_product_id(db: AsyncSession, wishlist_data: AddProductInWishlistRequest):
+    async def get_favorited_product_ids(db: AsyncSession, client_id: int, product_ids: list[int]) -> set[int]:
+        """
+        Obtem quais dos produtos informados estão na wishlist do cliente.
+
+        A consulta usa apenas as colunas do indice unico (client_id, product_id), permitindo
+        um index-only scan com um unico `product_id = ANY(...)`.
+
+        Args:
+            db (AsyncSession): Sessão assincrona do banco de dados.
+            client_id (int): Identificador do cliente.
+            product_ids (list[int]): Identificadores dos produtos a serem verificados.
+        Returns:
+            set[int]: Identificadores dos produtos que estão na wishlist do cliente.
+        """
         try:
+            if not product_ids:
+                return set()
             result = await db.execute(
-                select(
-                    Wishlist
-                ).filter(
-                    Wishlist.client_id == wishlist_data.client_id,
-                    Wishlist.product_id == wishlist_data.product_id
+                select(Wishlist.product_id).where(
+                    Wishlist.client_id == client_id,
+                    Wishlist.product_id == any_(bindparam("product_ids", product_ids, type_=ARRAY(Integer)))
                 )
             )
-            return result.scalars().first()
+            return set(result.scalars().all())
         except Exception as e:
             raise
- 
-    async def create(db: AsyncSession, wishlist_data: AddProductInWishlistRequest, product_info: str) -> Wishlist:
+
+    async def create(db: AsyncSession, wishlist_data: AddProductInWishlistRequest) -> Wishlist | None:
         """
-        Cria um novo produto na wishlist do cliente.
+        Cria um novo produto na wishlist do cliente. As informações do produto ficam na tabela
+        products, a wishlist guarda somente a referencia ao produto.
+
+        A inserção e feita em um unico comando INSERT ... ON CONFLICT DO NOTHING RETURNING, que
+        retorna a data de criação gerada pelo banco de dados, a constraint unica
+        uq_wishlist_client_product garante que o mesmo produto não seja adicionado duas vezes
+        mesmo com requisições concorrentes.
 
         Args:
             db (AsyncSession): Sessão assincrona do banco de dados.
             wishlist_data (AddProductInWishlistRequest): Schema contendo os dados do produto a ser adicionado na wishlist.
-            product_info (str): Informações adicionais sobre o produto.
-        Raises:
-            HTTPException: Se o produto ja estiver na wishlist do cliente ou se o produto não for encontrado.
-            GenericExceptions: Se ocorrer um erro ao adicionar o produto na wishlist.
         Returns:
-            Wishlist: Retorna um objeto Wishlist com os dados do produto adicionado na wishlist.
+            Wishlist | None: Retorna um objeto Wishlist com os dados do produto adicionado na wishlist,
+                ou None se o produto ja estiver na wishlist do cliente.
         """
         try:
-            wishlist = Wishlist(
-                client_id=wishlist_data.client_id,
-                product_id=wishlist_data.product_id,
-                product_info=product_info,
-                created_at=HelperFunctions.get_time().replace(tzinfo=None)
+            result = await db.execute(
+                insert(Wishlist).values(
+                    client_id=wishlist_data.client_id,
+                    product_id=wishlist_data.product_id
+                ).on_conflict_do_nothing(
+                    index_elements=[Wishlist.client_id, Wishlist.product_id]
+                ).returning(Wishlist)
             )
-            db.add(wishlist)
+            wishlist = result.scalars().first()
             await db.commit()
-            await db.refresh(wishlist)
             return wishlist
         except Exception as e:
             raise
     
-    async def delete_by_client_id_and_product_id(db: AsyncSession, request: DeleteProductFromWishList):
+    async def delete_by_client_id_and_product_id(db: AsyncSession, request: DeleteProductFromWishList) -> Wishlist:
         """
-        Deleta um produto da wishlist do cliente.
+        Deleta um produto da wishlist do cliente em um unico comando DELETE ... RETURNING.
 
         Args:
             db (AsyncSession): Sessão assincrona do banco de dados.
             request (DeleteProductFromWishList): Schema contendo os dados do cliente e do produto a ser deletado.
         Raises:
             NoResultFound: Se o produto não for encontrado na wishlist do cliente.
-            GenericExceptions: Se ocorrer um erro ao deletar o produto da wishlist.
         Returns:
-            Wishlist: Retorna o objeto Wishlist deletado, ou None se não houver produto na wishlist.
+            Wishlist: Retorna o objeto Wishlist deletado.
         """
         try:
-            product = await WishlistRepository.get_by_client_id_and_product_id(db, request)
-            if not product:
-                raise NoResultFound
             result = await db.execute(
-                select(Wishlist).where(
+                delete(Wishlist).where(
                     Wishlist.client_id == request.client_id,
                     Wishlist.product_id == request.product_id
-                )
+                ).returning(Wishlist).execution_options(synchronize_session=False)
             )
             wishlist = result.scalars().first()
-            if wishlist:
-                await db.delete(wishlist)
-                await db.commit()
-                return wishlist
-            return None
-        
+            await db.commit()
+            if wishlist is None:
+                raise NoResultFound
+            return wishlist
         except Exception as e:
-            raise
\ No newline at end of file
+            raise
+
+    async def bulk_update(db: AsyncSession, client_id: int, add_ids: list[int], remove_ids: list[int]) -> tuple[set[int], set[int]]:
+        """
+        Adiciona e remove varios produtos da wishlist do cliente em uma unica transação.
+
+        Os produtos são adicionados com um unico INSERT de varias linhas com ON CONFLICT DO NOTHING
+        e removidos com um unico DELETE ... WHERE product_id = ANY(...), ambos com RETURNING para
+        saber quais produtos foram de fato alterados. Os produtos adicionados são enviados ordenados,
+        então lotes concorrentes com produtos em comum travam as linhas na mesma ordem e não entram
+        em deadlock.
+
+        Args:
+            db (AsyncSession): Sessão assincrona do banco de dados.
+            client_id (int): Identificador do cliente.
+            add_ids (list[int]): Identificadores dos produtos a serem adicionados.
+            remove_ids (list[int]): Identificadores dos produtos a serem removidos.
+        Returns:
+            Tuple(set[int], set[int]): Produtos adicionados e produtos removidos.
+        """
+        try:
+            created, deleted = set(), set()
+            if add_ids:
+                result = await db.execute(
+                    insert(Wishlist).values([
+                        {"client_id": client_id, "product_id": product_id}
+                        for product_id in sorted(add_ids)
+                    ]).on_conflict_do_nothing(
+                        index_elements=[Wishlist.client_id, Wishlist.product_id]
+                    ).returning(Wishlist.product_id)
+                )
+                created = set(result.scalars().all())
+            if remove_ids:
+                result = await db.execute(
+                    delete(Wishlist).where(
+                        Wishlist.client_id == client_id,
+                        Wishlist.product_id == any_(bindparam("product_ids", remove_ids, type_=ARRAY(Integer)))
+                    ).returning(Wishlist.product_id).execution_options(synchronize_session=False)
+                )
+                deleted = set(result.scalars().all())
+            await db.commit()
+            return created, deleted
+        except Exception as e:
+            raise
@@ -22,8 +22,10 @@ class ClientsOut(BaseModel):
 class ListAllClientsRequest(BaseModel):
     page: int = 1
     page_size: int = 10
+    cursor: Optional[str] = None
 
 class ListAllClientsResponse(BaseModel):
     items: list[ClientsOut]
     has_next: bool
+    next_cursor: Optional[str] = None
 
@@ -1,10 +1,34 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from fastapi import Query
-from typing import Optional
+from typing import Literal, Optional
 
 from src.utils.helpers.helpers_functions import HelperFunctions
 
+class ProductInfo(BaseModel):
+    """
+    Schema com as informações de um produto retornadas pela API de produtos.
+
+    Attributes:
+        id (int | str): Identificador do produto na API de produtos.
+        title (str): Titulo do produto.
+        brand (str): Marca do produto.
+        price (float): Preço do produto.
+        image (str): URL da imagem do produto.
+        reviewScore (float): Nota media das avaliações do produto.
+        mocked (bool): Indica se o produto foi mockado por indisponibilidade da API de produtos.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    id: Optional[int | str] = None
+    title: Optional[str] = None
+    brand: Optional[str] = None
+    price: Optional[float] = None
+    image: Optional[str] = None
+    reviewScore: Optional[float] = None
+    mocked: Optional[bool] = None
+
+
 class WishlistBase(BaseModel):
     """
     Schema base para a wishlist de um cliente.
@@ -12,13 +36,13 @@ class WishlistBase(BaseModel):
     Attributes:
         client_id (int): Identificador unico do cliente.
         product_id (int): Identificador do produto na wishlist.
-        product_info (str): Informações sobre o produto.
+        product_info (ProductInfo): Informações sobre o produto.
         created_at (str):   Data e hora de criação da wishlist.
 
     """
     client_id: int
     product_id: int
-    product_info: str
+    product_info: Optional[ProductInfo] = None
     created_at: datetime
 
 
@@ -36,10 +60,26 @@ class GetWishlistByClientIdRequest(BaseModel):
     client_id: int = Field(example=[1])
     page: int = Field(Query(1, example=1))
     page_size: int = Field(Query(10, example=10))
+    cursor: Optional[str] = None
+    fields: Optional[str] = None
 
 class GetWishlistByClientIdResponse(BaseModel):
     items: list[WishlistBase]
     has_next: bool
+    next_cursor: Optional[str] = None
+
+class GetWishlistMembershipRequest(BaseModel):
+    client_id: int = Field(example=[1])
+    product_ids: str = Field(Query(..., example="1,2,3"))
+
+class GetWishlistMembershipResponse(BaseModel):
+    """
+    Schema com os produtos consultados que estão na wishlist do cliente.
+
+    Attributes:
+        favorites (list[int]): Identificadores dos produtos favoritados, na ordem em que foram consultados.
+    """
+    favorites: list[int]
 
 class AddProductInWishlistRequest(BaseModel):
     client_id: int
@@ -48,6 +88,34 @@ class AddProductInWishlistRequest(BaseModel):
 class AddProductInWishlistRequestPayload(BaseModel):
     product_id: int
 
+class BatchWishlistRequestPayload(BaseModel):
+    """
+    Schema para adicionar e remover varios produtos da wishlist de um cliente de uma vez.
+
+    Attributes:
+        add (list[int]): Identificadores dos produtos a serem adicionados.
+        remove (list[int]): Identificadores dos produtos a serem removidos.
+    """
+    add: list[int] = Field(default_factory=list, examples=[[1, 2]])
+    remove: list[int] = Field(default_factory=list, examples=[[3]])
+
+class BatchWishlistItemResult(BaseModel):
+    """
+    Resultado da operação de um produto no lote.
+
+    Attributes:
+        product_id (int): Identificador do produto.
+        action (str): Operação solicitada, `add` ou `remove`.
+        status (str): Resultado da operação, `created`, `already_exists`, `product_not_found`,
+            `deleted` ou `not_found`.
+    """
+    product_id: int
+    action: Literal["add", "remove"]
+    status: Literal["created", "already_exists", "product_not_found", "deleted", "not_found"]
+
+class BatchWishlistResponse(BaseModel):
+    items: list[BatchWishlistItemResult]
+
 
 class DeleteProductFromWishList(BaseModel):
     client_id: int = Field(example=1)
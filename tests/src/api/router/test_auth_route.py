@@ -1,10 +1,19 @@
 import pytest
+from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 from src.main import app
+from src.api.services.auth_services import AuthService
+from src.utils.exceptions.exceptions import UnauthorizedException
 
 client = TestClient(app)
 
-def test_login_success():
+@pytest.fixture
+def mock_auth_login():
+    with patch.object(AuthService, 'login', new_callable=AsyncMock) as mock:
+        yield mock
+
+def test_login_success(mock_auth_login):
+    mock_auth_login.return_value = {"access_token": "token", "token_type": "bearer"}
     response = client.post(
         "/api/v1/token",
         data={"username": "admin", "password": "admin"},
@@ -14,11 +23,13 @@ def test_login_success():
     data = response.json()
     assert "access_token" in data
     assert data["token_type"] == "bearer"
+    assert mock_auth_login.call_args.args[1:] == ("admin", "admin")
 
-def test_login_invalid_credentials():
+def test_login_invalid_credentials(mock_auth_login):
+    mock_auth_login.side_effect = UnauthorizedException
     response = client.post(
         "/api/v1/token",
         data={"username": "wrong", "password": "wrong"},
         headers={"Content-Type": "application/x-www-form-urlencoded"}
     )
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
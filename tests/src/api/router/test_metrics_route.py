@@ -0,0 +1,60 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+import os
+from jose import jwt
+
+
+@pytest.fixture
+def client():
+    from src.main import app
+    return TestClient(app)
+
+@pytest.fixture
+def token():
+    SECRET_KEY = os.getenv("SECRET_KEY", "test_secret_key")
+    ALGORITHM = "HS256"
+    payload = {"sub": "testuser"}
+    return "Bearer " + jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+def test_get_product_catalog_metrics(token, client):
+    response = client.get(
+        "/api/v1/metrics/product-catalog",
+        headers={"Authorization": token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["circuit_breaker"]["state"] == "closed"
+    assert "hits" in response.json()["product_cache"]
+    assert "hits" in response.json()["negative_product_cache"]
+
+def test_get_product_catalog_metrics_unauthorized(client):
+    response = client.get("/api/v1/metrics/product-catalog")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+def test_get_wishlist_cache_metrics(token, client):
+    response = client.get(
+        "/api/v1/metrics/wishlist-cache",
+        headers={"Authorization": token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert "hits" in response.json()["page_cache"]
+    assert "hits" in response.json()["membership_cache"]
+
+def test_get_client_cache_metrics(token, client):
+    response = client.get(
+        "/api/v1/metrics/client-cache",
+        headers={"Authorization": token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert "hits" in response.json()
+
+def test_get_database_pool_metrics(token, client):
+    response = client.get(
+        "/api/v1/metrics/database-pool",
+        headers={"Authorization": token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["primary"]["pool_size"] == 5
+    assert "checked_out" in response.json()["primary"]
+    assert "wait_max" in response.json()["primary"]
+    assert response.json()["read"]["pool_size"] == 5
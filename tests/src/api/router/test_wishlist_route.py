@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 from src.api.services.clients_services import ClientsService
 from src.api.services.wishlist_services import WishlistService
+from src.utils.schemas.wishlist_schema import GetWishlistByClientIdResponse, WishlistBase
 import os
 from jose import jwt
 from datetime import datetime
@@ -31,6 +32,16 @@ def mock_wishlist_add_product_in_wishlist():
     with patch.object(WishlistService, 'add_product_in_wishlist', new_callable=AsyncMock) as mock:
         yield mock
 
+@pytest.fixture
+def mock_wishlist_batch_update_wishlist():
+    with patch.object(WishlistService, 'batch_update_wishlist', new_callable=AsyncMock) as mock:
+        yield mock
+
+@pytest.fixture
+def mock_wishlist_get_wishlist_membership():
+    with patch.object(WishlistService, 'get_wishlist_membership', new_callable=AsyncMock) as mock:
+        yield mock
+
 @pytest.fixture
 def mock_wishlist_delete_product_from_wishlist():
     with patch.object(WishlistService, 'delete_product_from_wishlist', new_callable=AsyncMock) as mock:
@@ -50,13 +61,40 @@ async def test_get_wishlist_by_client_id(mock_wishlist_get_wishlist_by_client_id
     assert "items" in response.json()
     assert "has_next" in response.json()
 
+@pytest.mark.asyncio
+async def test_get_wishlist_by_client_id_with_fields(mock_wishlist_get_wishlist_by_client_id, token, client):
+    mock_wishlist_get_wishlist_by_client_id.return_value = GetWishlistByClientIdResponse(
+        items=[WishlistBase(client_id=1, product_id=1, product_info={"title": "Product Title"}, created_at=datetime.now())],
+        has_next=False
+    )
+    response = client.get(
+        "/api/v1/clients/1/favorite/?fields=title",
+        headers={"Authorization": token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["product_info"] == {"title": "Product Title"}
+    assert mock_wishlist_get_wishlist_by_client_id.call_args.args[1].fields == "title"
+
+@pytest.mark.asyncio
+async def test_get_wishlist_membership(mock_wishlist_get_wishlist_membership, token, client):
+    mock_wishlist_get_wishlist_membership.return_value = {"favorites": [1]}
+    response = client.get(
+        "/api/v1/clients/1/favorite/contains?product_ids=1,2",
+        headers={"Authorization": token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"favorites": [1]}
+    request = mock_wishlist_get_wishlist_membership.call_args.args[1]
+    assert request.client_id == 1
+    assert request.product_ids == "1,2"
+
 @pytest.mark.asyncio
 async def test_add_product_in_wishlist(mock_wishlist_add_product_in_wishlist, token, client):
     mock_wishlist_add_product_in_wishlist.return_value = {
         "wishlist_id": 1,
         "client_id": 1,
         "product_id": 1,
-        "product_info": '{"price": 100.0,"image": "http://example.com/image.jpg","brand": "Brand","title": "Product Title","reviewScore": 4.5}',
+        "product_info": {"price": 100.0, "image": "http://example.com/image.jpg", "brand": "Brand", "title": "Product Title", "reviewScore": 4.5},
         "created_at": datetime.now().isoformat(),
     }
     response = client.post(
@@ -67,6 +105,26 @@ async def test_add_product_in_wishlist(mock_wishlist_add_product_in_wishlist, to
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["client_id"] == 1
     assert response.json()["product_id"] == 1
+    assert response.json()["product_info"]["title"] == "Product Title"
+
+@pytest.mark.asyncio
+async def test_batch_update_wishlist(mock_wishlist_batch_update_wishlist, token, client):
+    mock_wishlist_batch_update_wishlist.return_value = {
+        "items": [
+            {"product_id": 1, "action": "add", "status": "created"},
+            {"product_id": 2, "action": "remove", "status": "deleted"}
+        ]
+    }
+    response = client.post(
+        "/api/v1/clients/1/favorite/batch",
+        json={"add": [1], "remove": [2]},
+        headers={"Authorization": token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["status"] == "created"
+    payload = mock_wishlist_batch_update_wishlist.call_args.args[2]
+    assert payload.add == [1]
+    assert payload.remove == [2]
 
 @pytest.mark.asyncio
 async def test_delete_product_from_wishlist(mock_wishlist_delete_product_from_wishlist, token, client):
@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from jose import jwt
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.services.auth_services import AuthService
+from src.utils.auth.auth import SECRET_KEY, ALGORITHM
+from src.utils.exceptions.exceptions import UnauthorizedException
+
+@pytest.mark.asyncio
+async def test_login_success():
+    db = MagicMock(spec=AsyncSession)
+    user = MagicMock(username="admin", password_hash="scrypt$hash")
+    with patch("src.utils.repository.UsersRepository.get_by_username", new_callable=AsyncMock) as mock_get_by_username, \
+         patch("src.api.services.auth_services.password_hasher.verify", new_callable=AsyncMock) as mock_verify:
+        mock_get_by_username.return_value = user
+        mock_verify.return_value = True
+        result = await AuthService.login(db, "admin", "admin")
+        mock_verify.assert_awaited_once_with("admin", "scrypt$hash")
+        assert result["token_type"] == "bearer"
+        assert jwt.decode(result["access_token"], SECRET_KEY, algorithms=[ALGORITHM])["sub"] == "admin"
+
+@pytest.mark.asyncio
+async def test_login_releases_connection_before_verify():
+    db = MagicMock(spec=AsyncSession)
+    db.in_transaction.return_value = True
+
+    async def verify(password, password_hash):
+        db.commit.assert_awaited_once()
+        return True
+
+    with patch("src.utils.repository.UsersRepository.get_by_username", new_callable=AsyncMock) as mock_get_by_username, \
+         patch("src.api.services.auth_services.password_hasher.verify", side_effect=verify) as mock_verify:
+        mock_get_by_username.return_value = MagicMock(username="admin", password_hash="scrypt$hash")
+        await AuthService.login(db, "admin", "admin")
+        mock_verify.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_login_wrong_password():
+    db = MagicMock(spec=AsyncSession)
+    with patch("src.utils.repository.UsersRepository.get_by_username", new_callable=AsyncMock) as mock_get_by_username, \
+         patch("src.api.services.auth_services.password_hasher.verify", new_callable=AsyncMock) as mock_verify:
+        mock_get_by_username.return_value = MagicMock(username="admin", password_hash="scrypt$hash")
+        mock_verify.return_value = False
+        with pytest.raises(UnauthorizedException):
+            await AuthService.login(db, "admin", "wrong")
+
+@pytest.mark.asyncio
+async def test_login_unknown_user_still_verifies_password():
+    db = MagicMock(spec=AsyncSession)
+    with patch("src.utils.repository.UsersRepository.get_by_username", new_callable=AsyncMock) as mock_get_by_username, \
+         patch("src.api.services.auth_services.password_hasher.verify", new_callable=AsyncMock) as mock_verify:
+        mock_get_by_username.return_value = None
+        mock_verify.return_value = False
+        with pytest.raises(UnauthorizedException):
+            await AuthService.login(db, "unknown", "admin")
+        mock_verify.assert_awaited_once_with("admin", None)
+
+@pytest.mark.asyncio
+async def test_ensure_admin_user_creates_missing_admin():
+    with patch("src.api.services.auth_services.AsyncSessionLocal", MagicMock()), \
+         patch("src.utils.repository.UsersRepository.get_by_username", new_callable=AsyncMock) as mock_get_by_username, \
+         patch("src.utils.repository.UsersRepository.create", new_callable=AsyncMock) as mock_create, \
+         patch("src.api.services.auth_services.password_hasher.hash", new_callable=AsyncMock) as mock_hash:
+        mock_get_by_username.return_value = None
+        mock_hash.return_value = "scrypt$hash"
+        await AuthService.ensure_admin_user()
+        assert mock_create.call_args.args[1:] == ("admin", "scrypt$hash")
+
+        mock_create.reset_mock()
+        mock_get_by_username.return_value = MagicMock()
+        await AuthService.ensure_admin_user()
+        mock_create.assert_not_awaited()
@@ -1,43 +1,107 @@
 import pytest
+from datetime import datetime
 from unittest.mock import AsyncMock, patch, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from src.api.services.clients_services import ClientsService
-from src.utils.exceptions.exceptions import GenericExceptions
+from src.api.services.clients_services import ClientsService, CLIENTS_MAX_PAGE_SIZE
+from src.utils.exceptions.exceptions import GenericExceptions, SchemaValidationError, DataAlreadyExistsException
+from src.utils.helpers.helpers_functions import HelperFunctions
 from src.utils.schemas.clients_schema import ClientsCreate, ClientsUpdate, ListAllClientsRequest, ClientsOut
+from src.utils.cache.caches import client_cache, client_versions
+from sqlalchemy.exc import NoResultFound, IntegrityError
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    client_cache.clear()
+    yield
+    client_cache.clear()
 
 @pytest.mark.asyncio
 async def test_get_all_clients_success():
     db = MagicMock(spec=AsyncSession)
-    request = MagicMock(spec=ListAllClientsRequest)
+    request = ListAllClientsRequest()
     logger = MagicMock()
-    fake_clients = [MagicMock(json=lambda: {"id": 1, "nome": "Test", "email": "test@test.com", "wishlist_id": 1, "created_at": "2024-01-01T00:00:00"})]
+    fake_clients = [MagicMock(id=1, nome="Test", email="test@test.com", created_at=datetime(2024, 1, 1))]
     with patch("src.utils.repository.ClientsRepository.get_all", new_callable=AsyncMock) as mock_get_all:
         mock_get_all.return_value = (fake_clients, False)
         result = await ClientsService.get_all_clients(db, request, logger)
         assert hasattr(result, "items")
         assert hasattr(result, "has_next")
         assert result.items[0].id == 1
+        assert result.items[0].model_dump() == {"id": 1, "nome": "Test", "email": "test@test.com", "created_at": datetime(2024, 1, 1)}
 
 @pytest.mark.asyncio
 async def test_get_all_clients_exception():
     db = MagicMock(spec=AsyncSession)
-    request = MagicMock(spec=ListAllClientsRequest)
+    request = ListAllClientsRequest()
     logger = MagicMock()
     with patch("src.utils.repository.ClientsRepository.get_all", new_callable=AsyncMock) as mock_get_all:
         mock_get_all.side_effect = Exception("DB error")
         with pytest.raises(GenericExceptions):
             await ClientsService.get_all_clients(db, request, logger)
 
+@pytest.mark.asyncio
+async def test_get_all_clients_keyset():
+    db = MagicMock(spec=AsyncSession)
+    request = ListAllClientsRequest(page_size=1)
+    logger = MagicMock()
+    fake_clients = [MagicMock(id=5, nome="Test", email="test@test.com", created_at=datetime(2024, 1, 1))]
+    with patch("src.utils.repository.ClientsRepository.get_all", new_callable=AsyncMock) as mock_get_all:
+        mock_get_all.return_value = (fake_clients, True)
+        result = await ClientsService.get_all_clients(db, request, logger)
+        assert HelperFunctions.decode_cursor(result.next_cursor) == {"id": 5}
+
+        mock_get_all.return_value = ([], False)
+        result = await ClientsService.get_all_clients(db, ListAllClientsRequest(page_size=1, cursor=result.next_cursor), logger)
+        assert mock_get_all.call_args.args[2] == 5
+        assert result.next_cursor is None
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_data", [
+    {"page_size": 0},
+    {"page_size": CLIENTS_MAX_PAGE_SIZE + 1},
+    {"cursor": "invalid"},
+    {"cursor": HelperFunctions.encode_cursor({"id": "abc"})}
+])
+async def test_get_all_clients_invalid_request(request_data):
+    db = MagicMock(spec=AsyncSession)
+    logger = MagicMock()
+    with pytest.raises(SchemaValidationError):
+        await ClientsService.get_all_clients(db, ListAllClientsRequest(**request_data), logger)
+
 @pytest.mark.asyncio
 async def test_get_client_success():
     db = MagicMock(spec=AsyncSession)
     client_id = 1
     fake_client = MagicMock()
+    fake_client.json.return_value = {"id": 1, "nome": "Mario", "email": "mario@example.com", "created_at": None}
     with patch("src.utils.repository.ClientsRepository.get_by_id", new_callable=AsyncMock) as mock_get_by_id:
         mock_get_by_id.return_value = fake_client
         result = await ClientsService.get_client(db, client_id)
-        assert result == fake_client
+        assert result == ClientsOut(id=1, nome="Mario", email="mario@example.com", created_at=None)
+
+@pytest.mark.asyncio
+async def test_get_client_uses_cache():
+    db = MagicMock(spec=AsyncSession)
+    fake_client = MagicMock()
+    fake_client.json.return_value = {"id": 1, "nome": "Mario", "email": "mario@example.com", "created_at": None}
+    with patch("src.utils.repository.ClientsRepository.get_by_id", new_callable=AsyncMock) as mock_get_by_id:
+        mock_get_by_id.return_value = fake_client
+        first = await ClientsService.get_client(db, 1)
+        assert await ClientsService.get_client(db, 1) == first
+        assert mock_get_by_id.await_count == 1
+
+        await client_versions.bump_version(1)
+        await ClientsService.get_client(db, 1)
+        assert mock_get_by_id.await_count == 2
+
+@pytest.mark.asyncio
+async def test_ensure_client_exists_not_found():
+    db = MagicMock(spec=AsyncSession)
+    with patch("src.utils.repository.ClientsRepository.get_by_id", new_callable=AsyncMock) as mock_get_by_id:
+        mock_get_by_id.side_effect = NoResultFound
+        with pytest.raises(NoResultFound):
+            await ClientsService.ensure_client_exists(db, 1)
 
 @pytest.mark.asyncio
 async def test_get_client_exception():
@@ -54,20 +118,29 @@ async def test_create_client_success():
     client_data = MagicMock(spec=ClientsCreate)
     client_data.email = "test@test.com"
     fake_client = MagicMock()
-    with patch("src.utils.repository.ClientsRepository.get_by_email", new_callable=AsyncMock) as mock_get_by_email, \
-         patch("src.utils.repository.ClientsRepository.create", new_callable=AsyncMock) as mock_create:
-        mock_get_by_email.return_value = None
+    with patch("src.utils.repository.ClientsRepository.create", new_callable=AsyncMock) as mock_create:
         mock_create.return_value = fake_client
         result = await ClientsService.create_client(db, client_data)
         assert result == fake_client
+        mock_create.assert_awaited_once_with(db, client_data)
+
+@pytest.mark.asyncio
+async def test_create_client_email_already_exists():
+    db = MagicMock(spec=AsyncSession)
+    client_data = MagicMock(spec=ClientsCreate)
+    client_data.email = "test@test.com"
+    with patch("src.utils.repository.ClientsRepository.create", new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = None
+        with pytest.raises(DataAlreadyExistsException):
+            await ClientsService.create_client(db, client_data)
 
 @pytest.mark.asyncio
 async def test_create_client_exception():
     db = MagicMock(spec=AsyncSession)
     client_data = MagicMock(spec=ClientsCreate)
     client_data.email = "test@test.com"
-    with patch("src.utils.repository.ClientsRepository.get_by_email", new_callable=AsyncMock) as mock_get_by_email:
-        mock_get_by_email.side_effect = Exception("Erro na base de dados")
+    with patch("src.utils.repository.ClientsRepository.create", new_callable=AsyncMock) as mock_create:
+        mock_create.side_effect = Exception("Erro na base de dados")
         with pytest.raises(GenericExceptions):
             await ClientsService.create_client(db, client_data)
 
@@ -92,6 +165,15 @@ async def test_update_client_exception():
         with pytest.raises(GenericExceptions):
             await ClientsService.update_client(db, client_id, client_data)
 
+@pytest.mark.asyncio
+async def test_update_client_email_already_exists():
+    db = MagicMock(spec=AsyncSession)
+    client_data = MagicMock(spec=ClientsUpdate)
+    with patch("src.utils.repository.ClientsRepository.update", new_callable=AsyncMock) as mock_update:
+        mock_update.side_effect = IntegrityError("UPDATE clients", {}, Exception("duplicate key"))
+        with pytest.raises(IntegrityError):
+            await ClientsService.update_client(db, 1, client_data)
+
 @pytest.mark.asyncio
 async def test_delete_cliente_success():
     db = MagicMock(spec=AsyncSession)
@@ -1,10 +1,38 @@
+import asyncio
+import fakeredis
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
-from src.utils.schemas.wishlist_schema import GetWishlistByClientIdRequest
+from datetime import datetime
+from src.utils.schemas.wishlist_schema import GetWishlistByClientIdRequest, BatchWishlistRequestPayload, GetWishlistMembershipRequest
+from src.utils.helpers.helpers_functions import HelperFunctions
 from src.api.services.wishlist_services import WishlistService
+from src.api.services.clients_services import ClientsService
+from sqlalchemy.exc import NoResultFound
+from src.utils.catalog.product_catalog import product_catalog_client
+from src.utils.exceptions.exceptions import ProductCatalogUnavailableException, SchemaValidationError, DataAlreadyExistsException
+from src.utils.cache.backends import RedisCacheBackend
+from src.utils.cache.stale_while_revalidate import StaleWhileRevalidate
+from src.utils.cache.caches import product_swr, product_cache, negative_product_cache, wishlist_membership_cache, wishlist_page_cache
+
+@pytest.fixture(autouse=True)
+def clear_product_cache():
+    product_cache.clear()
+    negative_product_cache.clear()
+    wishlist_membership_cache.clear()
+    wishlist_page_cache.clear()
+    yield
+    product_cache.clear()
+    negative_product_cache.clear()
+    wishlist_membership_cache.clear()
+    wishlist_page_cache.clear()
+
+@pytest.fixture(autouse=True)
+def mock_ensure_client_exists():
+    with patch.object(ClientsService, "ensure_client_exists", new_callable=AsyncMock) as mock:
+        yield mock
 
 @pytest.mark.asyncio
 async def test_get_client_by_client_id_success():
@@ -12,7 +40,7 @@ async def test_get_client_by_client_id_success():
     db = MagicMock(spec=AsyncSession)
     request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10)
     logger = MagicMock()
-    fake_wishlist = [MagicMock(json=lambda: {"wishlist_id": 1, "client_id": 1, "product_id": 1, "product_info": '{"price": 100.0, "image": "http://example.com/image.jpg", "brand": "Brand", "title": "Product Title", "reviewScore": 4.5}', "created_at": "2024-01-01T00:00:00"})]
+    fake_wishlist = [MagicMock(wishlist_id=1, client_id=1, product_id=1, created_at="2024-01-01T00:00:00", product_info={"price": 100.0, "image": "http://example.com/image.jpg", "brand": "Brand", "title": "Product Title", "reviewScore": 4.5})]
     
     with patch("src.utils.repository.WishlistRepository.get_by_client_id", new_callable=AsyncMock) as mock_get_by_client_id:
         mock_get_by_client_id.return_value = (fake_wishlist, False)
@@ -21,6 +49,69 @@ async def test_get_client_by_client_id_success():
         assert hasattr(result, "has_next")
         assert len(result.items) == 1
         assert result.items[0].client_id == 1
+        assert result.items[0].product_info.title == "Product Title"
+
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_uses_page_cache():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10)
+    logger = MagicMock()
+    fake_wishlist = [MagicMock(wishlist_id=1, client_id=1, product_id=1, created_at="2024-01-01T00:00:00", product_info={"title": "Product Title"})]
+
+    with patch("src.utils.repository.WishlistRepository.get_by_client_id", new_callable=AsyncMock) as mock_get_by_client_id:
+        mock_get_by_client_id.return_value = (fake_wishlist, False)
+        first = await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        second = await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        assert second == first
+        assert mock_get_by_client_id.await_count == 1
+
+        await WishlistService.get_wishlist_by_client_id(db, GetWishlistByClientIdRequest(client_id=2, page=1, page_size=10), logger)
+        assert mock_get_by_client_id.await_count == 2
+
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_uses_shared_page_cache():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10, fields="title")
+    logger = MagicMock()
+    fake_wishlist = [MagicMock(wishlist_id=1, client_id=1, product_id=1, created_at=datetime(2024, 1, 1), product_info={"title": "Product Title"})]
+    redis_client = fakeredis.FakeAsyncRedis()
+
+    with patch("src.api.services.wishlist_services.wishlist_page_swr", StaleWhileRevalidate(RedisCacheBackend(redis_client, "wishlist-page", ttl=60), ttl=60, stale_ttl=60)), \
+         patch("src.api.services.wishlist_services.wishlist_versions", RedisCacheBackend(redis_client, "wishlist", ttl=60)), \
+         patch("src.utils.repository.WishlistRepository.get_by_client_id", new_callable=AsyncMock) as mock_get_by_client_id:
+        mock_get_by_client_id.return_value = (fake_wishlist, False)
+        first = await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        second = await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        assert mock_get_by_client_id.await_count == 1
+        assert second == first
+        assert second.items[0].product_info.model_dump(exclude_unset=True) == {"title": "Product Title"}
+
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_page_cache_invalidated_on_write():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10)
+    logger = MagicMock()
+
+    with patch("src.utils.repository.WishlistRepository.get_by_client_id", new_callable=AsyncMock) as mock_get_by_client_id, \
+         patch("src.utils.repository.WishlistRepository.delete_by_client_id_and_product_id", new_callable=AsyncMock):
+        mock_get_by_client_id.return_value = ([], False)
+        await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        await WishlistService.delete_product_from_wishlist(db, MagicMock(client_id=1, product_id=1))
+        await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        assert mock_get_by_client_id.await_count == 2
+
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_does_not_cache_cursor_pages():
+    db = MagicMock(spec=AsyncSession)
+    cursor = HelperFunctions.encode_cursor({"created_at": "2024-01-01T00:00:00", "wishlist_id": 1})
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10, cursor=cursor)
+    logger = MagicMock()
+
+    with patch("src.utils.repository.WishlistRepository.get_by_client_id", new_callable=AsyncMock) as mock_get_by_client_id:
+        mock_get_by_client_id.return_value = ([], False)
+        await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        assert mock_get_by_client_id.await_count == 2
 
 @pytest.mark.asyncio
 async def test_get_client_by_client_id_exception():
@@ -33,6 +124,56 @@ async def test_get_client_by_client_id_exception():
         with pytest.raises(HTTPException):
             await WishlistService.get_wishlist_by_client_id(db, request, logger)
 
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_with_fields():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10, fields="title, price,title")
+    logger = MagicMock()
+    fake_wishlist = [MagicMock(wishlist_id=1, client_id=1, product_id=1, created_at="2024-01-01T00:00:00", product_info={"title": "Product Title", "price": 100.0})]
+
+    with patch("src.utils.repository.WishlistRepository.get_by_client_id", new_callable=AsyncMock) as mock_get_by_client_id:
+        mock_get_by_client_id.return_value = (fake_wishlist, False)
+        result = await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        assert mock_get_by_client_id.call_args.args[2] == ["title", "price"]
+        assert result.items[0].product_info.model_fields_set == {"title", "price"}
+
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_with_invalid_fields():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10, fields="title,stock")
+    logger = MagicMock()
+
+    with pytest.raises(SchemaValidationError):
+        await WishlistService.get_wishlist_by_client_id(db, request, logger)
+
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_returns_next_cursor():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=1)
+    logger = MagicMock()
+    row = MagicMock(wishlist_id=7, client_id=1, product_id=1, created_at=datetime(2024, 1, 1), product_info=None)
+
+    with patch("src.utils.repository.WishlistRepository.get_by_client_id", new_callable=AsyncMock) as mock_get_by_client_id:
+        mock_get_by_client_id.return_value = ([row], True)
+        result = await WishlistService.get_wishlist_by_client_id(db, request, logger)
+        assert result.has_next is True
+        assert HelperFunctions.decode_cursor(result.next_cursor) == {"created_at": "2024-01-01T00:00:00", "wishlist_id": 7}
+
+        next_request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=1, cursor=result.next_cursor)
+        mock_get_by_client_id.return_value = ([], False)
+        result = await WishlistService.get_wishlist_by_client_id(db, next_request, logger)
+        assert mock_get_by_client_id.call_args.args[3] == (datetime(2024, 1, 1), 7)
+        assert result.next_cursor is None
+
+@pytest.mark.asyncio
+async def test_get_client_by_client_id_with_invalid_cursor():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistByClientIdRequest(client_id=1, page=1, page_size=10, cursor=HelperFunctions.encode_cursor({"id": 1}))
+    logger = MagicMock()
+
+    with pytest.raises(SchemaValidationError):
+        await WishlistService.get_wishlist_by_client_id(db, request, logger)
+
 @pytest.mark.asyncio
 async def test_add_product_in_wishlist_success():
     db = MagicMock(spec=AsyncSession)
@@ -40,26 +181,45 @@ async def test_add_product_in_wishlist_success():
     wishlist_data.client_id = 1
     wishlist_data.product_id = 1
 
-    mock_result = MagicMock()
-    mock_scalars = MagicMock()
-    mock_scalars.first.return_value = None
-    mock_result.scalars.return_value = mock_scalars
-    db.execute.return_value = mock_result
-
     mock_wishlist_obj = MagicMock()
     mock_wishlist_obj.json.return_value = {
         "client_id": 1,
         "product_id": 1,
-        "product_info": '{"price": 100.0, "image": "http://example.com/image.jpg", "brand": "Brand", "title": "Product Title", "reviewScore": 4.5}',
         "created_at": "2024-01-01T00:00:00"
     }
 
-    with patch("src.utils.repository.WishlistRepository.create", new_callable=AsyncMock) as mock_create:
+    with patch("src.utils.repository.WishlistRepository.create", new_callable=AsyncMock) as mock_create, \
+         patch("src.utils.repository.ProductsRepository.upsert", new_callable=AsyncMock) as mock_upsert, \
+         patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
         mock_create.return_value = mock_wishlist_obj
+        mock_get_product.return_value = {"price": 100.0, "title": "Product Title"}
 
         result = await WishlistService.add_product_in_wishlist(db, wishlist_data)
         assert result.client_id == 1
         assert result.product_id == 1
+        assert result.product_info.title == "Product Title"
+        mock_upsert.assert_awaited_once_with(db, 1, {"price": 100.0, "title": "Product Title"}, overwrite=True)
+
+@pytest.mark.asyncio
+async def test_add_product_in_wishlist_releases_connection_before_catalog():
+    db = MagicMock(spec=AsyncSession)
+    db.in_transaction.return_value = True
+    wishlist_data = MagicMock()
+    wishlist_data.client_id = 1
+    wishlist_data.product_id = 1
+
+    async def get_product(product_id):
+        db.commit.assert_awaited_once()
+        return {"price": 100.0, "title": "Product Title"}
+
+    with patch("src.utils.repository.WishlistRepository.create", new_callable=AsyncMock) as mock_create, \
+         patch("src.utils.repository.ProductsRepository.upsert", new_callable=AsyncMock), \
+         patch.object(product_catalog_client, "get_product", side_effect=get_product) as mock_get_product:
+        mock_create.return_value = MagicMock()
+        mock_create.return_value.json.return_value = {"client_id": 1, "product_id": 1, "created_at": "2024-01-01T00:00:00"}
+
+        await WishlistService.add_product_in_wishlist(db, wishlist_data)
+        mock_get_product.assert_awaited_once_with(1)
 
 @pytest.mark.asyncio
 async def test_add_product_in_wishlist_product_exists():
@@ -68,11 +228,27 @@ async def test_add_product_in_wishlist_product_exists():
     wishlist_data.client_id = 1
     wishlist_data.product_id = 1
     
-    with patch("src.utils.repository.WishlistRepository.get_by_client_id_and_product_id", new_callable=AsyncMock) as mock_get_by_client_id_and_product_id:
-        mock_get_by_client_id_and_product_id.return_value = True
+    with patch("src.utils.repository.WishlistRepository.create", new_callable=AsyncMock) as mock_create, \
+         patch("src.utils.repository.ProductsRepository.upsert", new_callable=AsyncMock), \
+         patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_create.return_value = None
+        mock_get_product.return_value = {"id": 1}
         
-        with pytest.raises(HTTPException):
+        with pytest.raises(DataAlreadyExistsException):
+            await WishlistService.add_product_in_wishlist(db, wishlist_data)
+
+@pytest.mark.asyncio
+async def test_add_product_in_wishlist_client_not_found(mock_ensure_client_exists):
+    db = MagicMock(spec=AsyncSession)
+    wishlist_data = MagicMock()
+    wishlist_data.client_id = 1
+    wishlist_data.product_id = 1
+    mock_ensure_client_exists.side_effect = NoResultFound
+
+    with patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        with pytest.raises(NoResultFound):
             await WishlistService.add_product_in_wishlist(db, wishlist_data)
+        mock_get_product.assert_not_awaited()
 
 @pytest.mark.asyncio
 async def test_add_product_in_wishlist_product_not_found():
@@ -81,12 +257,226 @@ async def test_add_product_in_wishlist_product_not_found():
     wishlist_data.client_id = 1
     wishlist_data.product_id = 1
     
-    with patch("src.utils.repository.WishlistRepository.get_by_client_id_and_product_id", new_callable=AsyncMock) as mock_get_by_client_id_and_product_id, \
-         patch("requests.get", side_effect=Exception("Product not found")):
-        mock_get_by_client_id_and_product_id.return_value = None
+    with patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_get_product.return_value = None
         
-        with pytest.raises(HTTPException):
+        with pytest.raises(HTTPException) as exc_info:
             await WishlistService.add_product_in_wishlist(db, wishlist_data)
+        assert exc_info.value.status_code == 404
+
+@pytest.mark.asyncio
+async def test_add_product_in_wishlist_negative_cached_product_not_found():
+    db = MagicMock(spec=AsyncSession)
+    wishlist_data = MagicMock()
+    wishlist_data.client_id = 1
+    wishlist_data.product_id = 1
+    await negative_product_cache.set(1, True)
+
+    with patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product, \
+         patch("src.utils.repository.WishlistRepository.create", new_callable=AsyncMock) as mock_create:
+        with pytest.raises(HTTPException) as exc_info:
+            await WishlistService.add_product_in_wishlist(db, wishlist_data)
+        assert exc_info.value.status_code == 404
+        mock_get_product.assert_not_awaited()
+        mock_create.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_add_product_in_wishlist_catalog_unavailable():
+    db = MagicMock(spec=AsyncSession)
+    wishlist_data = MagicMock()
+    wishlist_data.client_id = 1
+    wishlist_data.product_id = 1
+
+    mock_wishlist_obj = MagicMock()
+    mock_wishlist_obj.json.return_value = {
+        "client_id": 1,
+        "product_id": 1,
+        "created_at": "2024-01-01T00:00:00"
+    }
+
+    with patch("src.utils.repository.WishlistRepository.create", new_callable=AsyncMock) as mock_create, \
+         patch("src.utils.repository.ProductsRepository.get_by_id", new_callable=AsyncMock) as mock_get_product_by_id, \
+         patch("src.utils.repository.ProductsRepository.upsert", new_callable=AsyncMock) as mock_upsert, \
+         patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_get_product_by_id.return_value = None
+        mock_get_product.side_effect = ProductCatalogUnavailableException()
+        mock_create.return_value = mock_wishlist_obj
+
+        result = await WishlistService.add_product_in_wishlist(db, wishlist_data)
+        assert result.product_id == 1
+        assert result.product_info.mocked is True
+        assert mock_upsert.call_args.kwargs["overwrite"] is False
+
+@pytest.mark.asyncio
+async def test_get_product_info_uses_products_table_when_catalog_unavailable():
+    db = MagicMock(spec=AsyncSession)
+    with patch("src.utils.repository.ProductsRepository.get_by_id", new_callable=AsyncMock) as mock_get_product_by_id, \
+         patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_get_product.side_effect = ProductCatalogUnavailableException()
+        mock_get_product_by_id.return_value = MagicMock(product_info={"id": 1, "title": "Produto"})
+
+        assert await WishlistService.get_product_info(1, db) == {"id": 1, "title": "Produto"}
+
+@pytest.mark.asyncio
+async def test_get_product_info_uses_cache():
+    with patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_get_product.return_value = {"id": 1, "title": "Produto"}
+
+        assert await WishlistService.get_product_info(1) == {"id": 1, "title": "Produto"}
+        assert await WishlistService.get_product_info(1) == {"id": 1, "title": "Produto"}
+        mock_get_product.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_get_product_info_coalesces_concurrent_fetches():
+    async def slow_get_product(product_id):
+        await asyncio.sleep(0.01)
+        return {"id": product_id}
+
+    with patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_get_product.side_effect = slow_get_product
+
+        results = await asyncio.gather(*[WishlistService.get_product_info(1) for _ in range(10)])
+        assert all(result == {"id": 1} for result in results)
+        mock_get_product.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_get_product_info_caches_not_found():
+    with patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_get_product.return_value = None
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc:
+                await WishlistService.get_product_info(1)
+            assert exc.value.status_code == 404
+        mock_get_product.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_get_product_info_uses_stale_cache_when_catalog_unavailable():
+    await product_cache.set(1, {"value": {"id": 1, "title": "Produto"}, "fresh_until": 0, "delta": 0})
+    with patch.object(product_catalog_client, "get_product", new_callable=AsyncMock) as mock_get_product:
+        mock_get_product.side_effect = ProductCatalogUnavailableException()
+
+        assert await WishlistService.get_product_info(1) == {"id": 1, "title": "Produto"}
+        await product_swr.drain()
+        mock_get_product.assert_awaited_once_with(1)
+        assert await WishlistService.get_product_info(1) == {"id": 1, "title": "Produto"}
+        await product_swr.drain()
+
+@pytest.mark.asyncio
+async def test_batch_update_wishlist_success():
+    db = MagicMock(spec=AsyncSession)
+    payload = BatchWishlistRequestPayload(add=[1, 2, 3, 1], remove=[4, 5])
+
+    async def get_product(product_id):
+        return None if product_id == 3 else {"id": product_id}
+
+    with patch("src.utils.repository.WishlistRepository.bulk_update", new_callable=AsyncMock) as mock_bulk_update, \
+         patch("src.utils.repository.ProductsRepository.upsert_many", new_callable=AsyncMock) as mock_upsert_many, \
+         patch.object(product_catalog_client, "get_product", side_effect=get_product):
+        mock_bulk_update.return_value = ({1}, {4})
+
+        result = await WishlistService.batch_update_wishlist(db, 1, payload)
+        mock_upsert_many.assert_awaited_once_with(db, {1: {"id": 1}, 2: {"id": 2}})
+        mock_bulk_update.assert_awaited_once_with(db, 1, [1, 2], [4, 5])
+        assert [(item.product_id, item.action, item.status) for item in result.items] == [
+            (1, "add", "created"),
+            (2, "add", "already_exists"),
+            (3, "add", "product_not_found"),
+            (4, "remove", "deleted"),
+            (5, "remove", "not_found")
+        ]
+
+@pytest.mark.asyncio
+async def test_batch_update_wishlist_releases_connection_before_catalog():
+    db = MagicMock(spec=AsyncSession)
+    db.in_transaction.return_value = True
+    payload = BatchWishlistRequestPayload(add=[1, 2])
+
+    async def get_product(product_id):
+        db.commit.assert_awaited_once()
+        return {"id": product_id}
+
+    with patch("src.utils.repository.WishlistRepository.bulk_update", new_callable=AsyncMock) as mock_bulk_update, \
+         patch("src.utils.repository.ProductsRepository.upsert_many", new_callable=AsyncMock), \
+         patch.object(product_catalog_client, "get_product", side_effect=get_product) as mock_get_product:
+        mock_bulk_update.return_value = ({1, 2}, set())
+
+        await WishlistService.batch_update_wishlist(db, 1, payload)
+        assert mock_get_product.await_count == 2
+
+@pytest.mark.asyncio
+async def test_batch_update_wishlist_conflicting_products():
+    db = MagicMock(spec=AsyncSession)
+    payload = BatchWishlistRequestPayload(add=[1], remove=[1])
+
+    with pytest.raises(SchemaValidationError):
+        await WishlistService.batch_update_wishlist(db, 1, payload)
+
+@pytest.mark.asyncio
+async def test_batch_update_wishlist_too_many_products():
+    db = MagicMock(spec=AsyncSession)
+    payload = BatchWishlistRequestPayload(add=list(range(1, 200)))
+
+    with patch("src.api.services.wishlist_services.WISHLIST_BATCH_MAX_ITEMS", 100):
+        with pytest.raises(SchemaValidationError):
+            await WishlistService.batch_update_wishlist(db, 1, payload)
+
+@pytest.mark.asyncio
+async def test_get_wishlist_membership_uses_cache():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistMembershipRequest(client_id=1, product_ids="1,2,3")
+
+    with patch("src.utils.repository.WishlistRepository.get_favorited_product_ids", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = {1, 3}
+        result = await WishlistService.get_wishlist_membership(db, request)
+        assert result.favorites == [1, 3]
+
+        mock_get.return_value = {4}
+        request = GetWishlistMembershipRequest(client_id=1, product_ids="3,4,1")
+        result = await WishlistService.get_wishlist_membership(db, request)
+        assert result.favorites == [3, 4, 1]
+        assert mock_get.await_args_list[1].args == (db, 1, [4])
+
+        result = await WishlistService.get_wishlist_membership(db, request)
+        assert mock_get.await_count == 2
+
+@pytest.mark.asyncio
+async def test_get_wishlist_membership_invalidated_on_delete():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistMembershipRequest(client_id=1, product_ids="1")
+
+    with patch("src.utils.repository.WishlistRepository.get_favorited_product_ids", new_callable=AsyncMock) as mock_get, \
+         patch("src.utils.repository.WishlistRepository.delete_by_client_id_and_product_id", new_callable=AsyncMock):
+        mock_get.return_value = {1}
+        assert (await WishlistService.get_wishlist_membership(db, request)).favorites == [1]
+
+        await WishlistService.delete_product_from_wishlist(db, MagicMock(client_id=1, product_id=1))
+
+        mock_get.return_value = set()
+        assert (await WishlistService.get_wishlist_membership(db, request)).favorites == []
+
+@pytest.mark.asyncio
+async def test_get_wishlist_membership_does_not_cache_result_invalidated_during_query():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistMembershipRequest(client_id=1, product_ids="1")
+
+    async def get_favorited_product_ids(*args):
+        await WishlistService.invalidate_wishlist_cache(1)
+        return {1}
+
+    with patch("src.utils.repository.WishlistRepository.get_favorited_product_ids", side_effect=get_favorited_product_ids) as mock_get:
+        assert (await WishlistService.get_wishlist_membership(db, request)).favorites == [1]
+        mock_get.side_effect = None
+        mock_get.return_value = set()
+        assert (await WishlistService.get_wishlist_membership(db, request)).favorites == []
+
+@pytest.mark.asyncio
+async def test_get_wishlist_membership_invalid_product_ids():
+    db = MagicMock(spec=AsyncSession)
+    request = GetWishlistMembershipRequest(client_id=1, product_ids="1,abc")
+
+    with pytest.raises(SchemaValidationError):
+        await WishlistService.get_wishlist_membership(db, request)
 
 @pytest.mark.asyncio
 async def test_delete_product_from_wishlist_success():
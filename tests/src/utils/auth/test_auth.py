@@ -1,8 +1,12 @@
 import os
+import time
 import pytest
+from unittest.mock import patch
 from jose import jwt
+from jose.exceptions import ExpiredSignatureError
 from fastapi import Depends
-from src.utils.auth.auth import verify_token, ALGORITHM
+from src.utils.auth.auth import verify_token, invalidate_token, ALGORITHM
+from src.utils.cache.ttl_cache import TTLCache
 from src.utils.exceptions.exceptions import UnauthorizedException
 
 SECRET_KEY = "test_secret_key"
@@ -14,16 +18,62 @@ def set_secret_key_env(monkeypatch):
 def generate_token(payload, key=SECRET_KEY):
     return jwt.encode(payload, key, algorithm=ALGORITHM)
 
-def test_verify_token_valid(monkeypatch):
+@pytest.mark.asyncio
+async def test_verify_token_valid(monkeypatch):
     token = generate_token({"sub": "user123"})
-    assert verify_token(token) == "user123"
+    assert await verify_token(token) == "user123"
 
-def test_verify_token_no_sub(monkeypatch):
+@pytest.mark.asyncio
+async def test_verify_token_no_sub(monkeypatch):
     token = generate_token({})
     with pytest.raises(UnauthorizedException):
-        verify_token(token)
+        await verify_token(token)
 
-def test_verify_token_invalid_token(monkeypatch):
+@pytest.mark.asyncio
+async def test_verify_token_invalid_token(monkeypatch):
     invalid_token = "invalid.token.value"
     with pytest.raises(UnauthorizedException):
-        verify_token(invalid_token)
\ No newline at end of file
+        await verify_token(invalid_token)
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    clock = [0.0]
+    cache = TTLCache(maxsize=10, ttl=300, timer=lambda: clock[0])
+    monkeypatch.setattr("src.utils.auth.auth.verified_tokens", cache)
+    return cache, clock
+
+@pytest.mark.asyncio
+async def test_verify_token_uses_cache(token_cache):
+    cache, _ = token_cache
+    token = generate_token({"sub": "user123", "exp": int(time.time()) + 3600})
+    with patch("src.utils.auth.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+        assert await verify_token(token) == "user123"
+        assert await verify_token(token) == "user123"
+        assert mock_decode.call_count == 1
+    assert cache.hits == 1
+
+@pytest.mark.asyncio
+async def test_verify_token_cache_expires_with_token(token_cache):
+    _, clock = token_cache
+    token = generate_token({"sub": "user123", "exp": int(time.time()) + 10})
+    assert await verify_token(token) == "user123"
+    clock[0] = 11
+    with patch("src.utils.auth.auth.jwt.decode", side_effect=ExpiredSignatureError):
+        with pytest.raises(UnauthorizedException):
+            await verify_token(token)
+
+@pytest.mark.asyncio
+async def test_verify_token_invalid_token_not_cached(token_cache):
+    cache, _ = token_cache
+    with pytest.raises(UnauthorizedException):
+        await verify_token(generate_token({"sub": "user123"}, key="other_key"))
+    assert len(cache) == 0
+
+@pytest.mark.asyncio
+async def test_invalidate_token(token_cache):
+    cache, _ = token_cache
+    token = generate_token({"sub": "user123"})
+    await verify_token(token)
+    assert len(cache) == 1
+    invalidate_token(token)
+    assert len(cache) == 0
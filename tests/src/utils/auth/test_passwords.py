@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import time
+import pytest
+from src.utils.auth.passwords import PasswordHasher
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=2, n=2 ** 8)
+    yield hasher
+    hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(hasher):
+    password_hash = await hasher.hash("admin")
+    assert password_hash.startswith("scrypt$256$8$1$")
+    assert password_hash != await hasher.hash("admin")
+    assert await hasher.verify("admin", password_hash) is True
+    assert await hasher.verify("wrong", password_hash) is False
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("password_hash", ["", "bcrypt$1$2$3$4$5", "scrypt$invalid"])
+async def test_verify_invalid_hash(hasher, password_hash):
+    assert await hasher.verify("admin", password_hash) is False
+
+@pytest.mark.asyncio
+async def test_verify_without_hash_runs_dummy_verification(hasher):
+    assert await hasher.verify("admin", None) is False
+    assert hasher._dummy_hash is not None
+
+@pytest.mark.asyncio
+async def test_hashing_runs_in_bounded_thread_pool(hasher, monkeypatch):
+    running, max_running, threads = 0, 0, set()
+    lock = threading.Lock()
+
+    def slow_scrypt(password, salt, n, r, p):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return b"digest"
+
+    monkeypatch.setattr(hasher, "_scrypt", slow_scrypt)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.gather(*(hasher.hash("admin") for _ in range(6)))
+    task.cancel()
+
+    assert max_running == 2
+    assert all(name.startswith("password-hasher") for name in threads)
+    assert ticks > 5
@@ -0,0 +1,70 @@
+import pytest
+import fakeredis
+from unittest.mock import AsyncMock
+from redis.exceptions import ConnectionError
+from src.utils.cache.backends import MemoryCacheBackend, RedisCacheBackend
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        return MemoryCacheBackend(maxsize=10, ttl=60)
+    return RedisCacheBackend(fakeredis.FakeAsyncRedis(), "test", ttl=60)
+
+@pytest.mark.asyncio
+async def test_get_set_delete(cache):
+    assert await cache.get("a") is None
+    await cache.set("a", {"id": 1, "title": "Produto", "tags": ["x"]})
+    assert await cache.get("a") == {"id": 1, "title": "Produto", "tags": ["x"]}
+    await cache.delete("a")
+    assert await cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+@pytest.mark.asyncio
+async def test_versions(cache):
+    initial = await cache.get_version(1)
+    bumped = await cache.bump_version(1)
+    assert bumped != initial
+    assert await cache.get_version(1) == bumped
+    assert await cache.get_version(2) == initial
+
+@pytest.mark.asyncio
+async def test_redis_backend_is_shared_between_workers():
+    server = fakeredis.FakeServer()
+    worker_a = RedisCacheBackend(fakeredis.FakeAsyncRedis(server=server), "product", ttl=60)
+    worker_b = RedisCacheBackend(fakeredis.FakeAsyncRedis(server=server), "product", ttl=60)
+
+    await worker_a.set(1, {"id": 1})
+    assert await worker_b.get(1) == {"id": 1}
+    await worker_a.bump_version(1)
+    assert await worker_b.get_version(1) == 1
+
+@pytest.mark.asyncio
+async def test_redis_backend_sets_ttl():
+    client = fakeredis.FakeAsyncRedis()
+    cache = RedisCacheBackend(client, "product", ttl=60)
+    await cache.set(1, {"id": 1})
+    await cache.set(2, {"id": 2}, ttl=5)
+    assert 0 < await client.pttl("product:1") <= 60000
+    assert 0 < await client.pttl("product:2") <= 5000
+
+@pytest.mark.asyncio
+async def test_redis_backend_fails_open():
+    client = AsyncMock()
+    client.get.side_effect = ConnectionError()
+    client.set.side_effect = ConnectionError()
+    cache = RedisCacheBackend(client, "product", ttl=60)
+
+    assert await cache.get(1) is None
+    await cache.set(1, {"id": 1})
+    assert await cache.get_version(1) is None
+    assert cache.stats()["errors"] == 3
+
+@pytest.mark.asyncio
+async def test_memory_backend_bounded_by_serialized_size():
+    cache = MemoryCacheBackend(maxsize=10, ttl=60, maxbytes=40)
+    await cache.set("a", {"title": "x" * 20})
+    await cache.set("b", {"title": "y" * 20})
+    assert await cache.get("a") is None
+    assert await cache.get("b") == {"title": "y" * 20}
+    assert cache.stats()["bytes"] == len('{"title":""}') + 20
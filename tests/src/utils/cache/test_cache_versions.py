@@ -0,0 +1,17 @@
+from src.utils.cache.cache_versions import CacheVersions
+
+def test_bump_changes_version():
+    versions = CacheVersions(maxsize=10)
+    initial = versions.get("a")
+    assert versions.bump("a") != initial
+    assert versions.get("a") != initial
+    assert versions.get("b") == initial
+
+def test_evicted_key_never_returns_to_old_version():
+    versions = CacheVersions(maxsize=1)
+    first = versions.get("a")
+    bumped = versions.bump("a")
+    versions.bump("b")
+    assert len(versions) == 1
+    assert versions.get("a") != first
+    assert versions.get("a") >= bumped
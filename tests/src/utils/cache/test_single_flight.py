@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+from src.utils.cache.single_flight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_result():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    results = await asyncio.gather(*[flight.do(1, fetch) for _ in range(10)])
+    assert len(calls) == 1
+    assert all(result == {"id": 1} for result in results)
+    assert flight.in_flight() == 0
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_error():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("catalog error")
+
+    results = await asyncio.gather(*[flight.do(1, fetch) for _ in range(5)], return_exceptions=True)
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    flight = SingleFlight()
+
+    async def fetch(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(flight.do(1, lambda: fetch(1)), flight.do(2, lambda: fetch(2)))
+    assert results == [1, 2]
+
+@pytest.mark.asyncio
+async def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert await flight.do(1, fetch) == 1
+    assert await flight.do(1, fetch) == 2
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_cancels_its_call_and_followers_run_their_own():
+    flight = SingleFlight()
+    events = []
+
+    def fetch(name):
+        async def run():
+            events.append(f"{name}:start")
+            try:
+                await asyncio.sleep(0.02)
+            except asyncio.CancelledError:
+                events.append(f"{name}:cancelled")
+                raise
+            return name
+        return run
+
+    leader = asyncio.create_task(flight.do(1, fetch("leader")))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do(1, fetch("follower")))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert events == ["leader:start", "leader:cancelled"]
+    assert await follower == "follower"
+    assert events == ["leader:start", "leader:cancelled", "follower:start"]
+    assert flight.in_flight() == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_does_not_cancel_call():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return {"id": 1}
+
+    leader = asyncio.create_task(flight.do(1, fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do(1, fetch))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == {"id": 1}
+    assert follower.cancelled()
+    assert flight.in_flight() == 0
@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.utils.cache.backends import MemoryCacheBackend
+from src.utils.cache.stale_while_revalidate import StaleWhileRevalidate
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def create_swr(timer, random_fn=lambda: 0.0, beta=1.0):
+    return StaleWhileRevalidate(
+        MemoryCacheBackend(maxsize=10, ttl=60, timer=timer),
+        ttl=10,
+        stale_ttl=50,
+        beta=beta,
+        timer=timer,
+        random_fn=random_fn
+    )
+
+@pytest.mark.asyncio
+async def test_miss_loads_and_fresh_hit_uses_cache():
+    timer = FakeTimer()
+    swr = create_swr(timer)
+    loader = AsyncMock(return_value={"id": 1})
+
+    assert await swr.get(1, loader) == {"id": 1}
+    assert await swr.get(1, loader) == {"id": 1}
+    loader.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced():
+    swr = create_swr(FakeTimer())
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    results = await asyncio.gather(*[swr.get(1, loader) for _ in range(10)])
+    assert len(calls) == 1
+    assert all(result == {"id": 1} for result in results)
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_one_refresh_runs():
+    timer = FakeTimer()
+    swr = create_swr(timer)
+    await swr.get(1, AsyncMock(return_value="old"))
+    timer.now += 11
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "new"
+
+    results = await asyncio.gather(*[swr.get(1, loader) for _ in range(10)])
+    assert results == ["old"] * 10
+    await swr.drain()
+    assert len(calls) == 1
+    assert await swr.get(1, loader) == "new"
+    assert swr.stats()["stale_hits"] == 10
+    assert swr.stats()["refreshes"] == 1
+
+@pytest.mark.asyncio
+async def test_background_refresh_uses_refresher():
+    timer = FakeTimer()
+    swr = create_swr(timer)
+    await swr.get(1, AsyncMock(return_value="old"))
+    timer.now += 11
+    loader = AsyncMock(return_value="loader")
+    refresher = AsyncMock(return_value="refresher")
+
+    assert await swr.get(1, loader, refresher) == "old"
+    await swr.drain()
+    loader.assert_not_awaited()
+    assert await swr.peek(1) == "refresher"
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_value():
+    timer = FakeTimer()
+    swr = create_swr(timer)
+    await swr.get(1, AsyncMock(return_value="old"))
+    timer.now += 11
+
+    assert await swr.get(1, AsyncMock(side_effect=ValueError("db down"))) == "old"
+    await swr.drain()
+    assert await swr.peek(1) == "old"
+    assert swr.stats()["refresh_errors"] == 1
+
+@pytest.mark.asyncio
+async def test_entry_expires_after_stale_ttl():
+    timer = FakeTimer()
+    swr = create_swr(timer)
+    await swr.get(1, AsyncMock(return_value="old"))
+    timer.now += 61
+
+    assert await swr.get(1, AsyncMock(return_value="new")) == "new"
+
+@pytest.mark.asyncio
+async def test_probabilistic_early_refresh():
+    timer = FakeTimer()
+    draws = iter([0.0, 0.999999])
+    swr = create_swr(timer, random_fn=lambda: next(draws))
+
+    async def slow_loader():
+        timer.now += 1
+        return "old"
+
+    await swr.get(1, slow_loader)
+    timer.now += 8
+    refresher = AsyncMock(return_value="new")
+
+    assert await swr.get(1, refresher) == "old"
+    await swr.drain()
+    refresher.assert_not_awaited()
+
+    assert await swr.get(1, refresher) == "old"
+    await swr.drain()
+    refresher.assert_awaited_once()
+    assert swr.stats()["early_refreshes"] == 1
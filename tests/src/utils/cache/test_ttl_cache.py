@@ -0,0 +1,62 @@
+import pytest
+from src.utils.cache.ttl_cache import TTLCache
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_get_and_set():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_per_entry_ttl():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+    cache.set("a", 1, ttl=1)
+    timer.now = 2
+    assert cache.get("a") is None
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+def test_delete_and_clear():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    assert cache.get("a") is None
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+def test_maxbytes_eviction():
+    cache = TTLCache(maxsize=10, ttl=10, maxbytes=10, sizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.set("a", "xxx")
+    assert cache.stats()["bytes"] == 7
+    cache.set("c", "xxxx")
+    assert cache.get("b") is None
+    assert cache.get("a") == "xxx"
+    assert cache.stats()["bytes"] == 7
+    cache.set("d", "x" * 11)
+    assert cache.get("d") is None
+    assert cache.get("c") == "xxxx"
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
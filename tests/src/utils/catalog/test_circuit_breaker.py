@@ -0,0 +1,48 @@
+import pytest
+from src.utils.catalog.circuit_breaker import CircuitBreaker
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, timer=FakeTimer())
+    breaker.record_failure()
+    assert breaker.allow_request() is True
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.snapshot()["rejected"] == 1
+
+def test_half_open_allows_single_probe():
+    timer = FakeTimer()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, timer=timer)
+    breaker.record_failure()
+    timer.now = 10
+    assert breaker.allow_request() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is False
+
+def test_probe_success_closes_circuit():
+    timer = FakeTimer()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, timer=timer)
+    breaker.record_failure()
+    timer.now = 10
+    breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() is True
+
+def test_probe_failure_reopens_circuit():
+    timer = FakeTimer()
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, timer=timer)
+    for _ in range(3):
+        breaker.record_failure()
+    timer.now = 10
+    breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.snapshot()["retry_in"] == 10
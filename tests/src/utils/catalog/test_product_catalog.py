@@ -0,0 +1,121 @@
+import httpx
+import pytest
+from src.utils.catalog.circuit_breaker import CircuitBreaker
+from src.utils.catalog.product_catalog import ProductCatalogClient, RetryBudget
+from src.utils.exceptions.exceptions import ProductCatalogUnavailableException
+
+BASE_URL = "http://catalog.local/api/product"
+
+def build_client(handler, retries=1, retry_budget=None):
+    return ProductCatalogClient(
+        base_url=BASE_URL,
+        retries=retries,
+        backoff=0,
+        retry_budget=retry_budget,
+        transport=httpx.MockTransport(handler)
+    )
+
+@pytest.mark.asyncio
+async def test_get_product_success():
+    def handler(request):
+        assert str(request.url) == f"{BASE_URL}/1/"
+        return httpx.Response(200, json={"id": 1, "title": "Produto"})
+
+    client = build_client(handler)
+    assert await client.get_product(1) == {"id": 1, "title": "Produto"}
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_product_not_found():
+    client = build_client(lambda request: httpx.Response(404))
+    assert await client.get_product(1) is None
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_product_retries_server_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"id": 1})
+
+    client = build_client(handler, retries=2)
+    assert await client.get_product(1) == {"id": 1}
+    assert len(calls) == 2
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_product_rate_limited_is_unavailable():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429)
+
+    client = build_client(handler, retries=2)
+    with pytest.raises(ProductCatalogUnavailableException):
+        await client.get_product(1)
+    assert len(calls) == 3
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_product_unexpected_status_is_unavailable_without_retry():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(403)
+
+    client = build_client(handler, retries=2)
+    with pytest.raises(ProductCatalogUnavailableException):
+        await client.get_product(1)
+    assert len(calls) == 1
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_product_unavailable():
+    def handler(request):
+        raise httpx.ConnectError("connection refused")
+
+    client = build_client(handler, retries=2)
+    with pytest.raises(ProductCatalogUnavailableException):
+        await client.get_product(1)
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_product_retry_budget_exhausted():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    client = build_client(handler, retries=3, retry_budget=RetryBudget(ratio=0, max_tokens=0))
+    with pytest.raises(ProductCatalogUnavailableException):
+        await client.get_product(1)
+    assert len(calls) == 1
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_product_fails_fast_when_circuit_open():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    client = ProductCatalogClient(
+        base_url=BASE_URL,
+        retries=0,
+        circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=60),
+        transport=httpx.MockTransport(handler)
+    )
+    with pytest.raises(ProductCatalogUnavailableException):
+        await client.get_product(1)
+    with pytest.raises(ProductCatalogUnavailableException):
+        await client.get_product(1)
+    assert len(calls) == 1
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+    await client.aclose()
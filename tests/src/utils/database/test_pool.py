@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.util import greenlet_spawn
+from src.utils.database.pool import InstrumentedAsyncQueuePool
+
+@pytest.mark.asyncio
+async def test_pool_stats():
+    pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=1, max_overflow=1, timeout=0.05)
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+    stats = pool.stats()
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["checkouts"] == 2
+
+    with pytest.raises(TimeoutError):
+        await greenlet_spawn(pool.connect)
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["wait_max"] >= 0.05
+
+    await greenlet_spawn(second.close)
+    await greenlet_spawn(first.close)
+    stats = pool.stats()
+    assert stats["checked_out"] == 0
+    assert stats["idle"] == 1
+    assert stats["overflow"] == 0
+    assert stats["wait_avg"] == stats["wait_total"] / 3
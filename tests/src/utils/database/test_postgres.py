@@ -0,0 +1,109 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.utils.cache.backends import MemoryCacheBackend
+from src.utils.database import postgres
+
+
+@pytest.fixture
+def clock():
+    return [0.0]
+
+@pytest.fixture(autouse=True)
+def read_replica(monkeypatch, clock):
+    monkeypatch.setattr(postgres, "recent_writes", MemoryCacheBackend(maxsize=100, ttl=5, timer=lambda: clock[0]))
+    yield postgres.read_engine
+
+def test_read_engine_uses_read_database():
+    assert postgres.read_engine is not postgres.engine
+    assert postgres.read_engine.url.database == "postgres_test_read"
+    assert postgres.engine.url.database == "postgres_test"
+
+def request_for(client_id=None):
+    return SimpleNamespace(path_params={} if client_id is None else {"client_id": client_id}, state=SimpleNamespace())
+
+async def session_from(dependency, request, user_id):
+    generator = dependency(request, user_id)
+    session = await generator.__anext__()
+    await generator.aclose()
+    return session
+
+@pytest.mark.asyncio
+async def test_get_read_db_uses_read_replica(read_replica):
+    session = await session_from(postgres.get_read_db, request_for(1), "user")
+    assert session.bind is read_replica
+
+@pytest.mark.asyncio
+async def test_get_write_db_uses_primary():
+    session = await session_from(postgres.get_write_db, request_for(1), "user")
+    assert session.bind is postgres.engine
+
+@pytest.mark.asyncio
+async def test_get_read_db_marks_clients_not_users(read_replica, clock):
+    await session_from(postgres.get_write_db, request_for(1), "admin")
+    assert (await session_from(postgres.get_read_db, request_for(1), "admin")).bind is postgres.engine
+    assert (await session_from(postgres.get_read_db, request_for(2), "admin")).bind is read_replica
+    assert (await session_from(postgres.get_read_db, request_for(), "admin")).bind is read_replica
+
+    clock[0] = 6
+    assert (await session_from(postgres.get_read_db, request_for(1), "admin")).bind is read_replica
+
+@pytest.mark.asyncio
+async def test_get_write_db_marks_client_created_by_route(read_replica):
+    request = request_for()
+    generator = postgres.get_write_db(request, "admin")
+    await generator.__anext__()
+    postgres.mark_client_written(request, 3)
+    await generator.aclose()
+
+    assert (await session_from(postgres.get_read_db, request_for(3), "admin")).bind is postgres.engine
+    assert (await session_from(postgres.get_read_db, request_for(1), "admin")).bind is read_replica
+
+@pytest.mark.asyncio
+async def test_get_read_db_reads_recently_written_client_from_primary(read_replica):
+    await session_from(postgres.get_write_db, request_for(1), "user")
+    assert (await session_from(postgres.get_read_db, request_for(1), "other")).bind is postgres.engine
+    assert (await session_from(postgres.get_read_db, request_for(2), "other")).bind is read_replica
+
+@pytest.mark.asyncio
+async def test_get_write_db_renews_marks_after_slow_handler(read_replica, clock):
+    generator = postgres.get_write_db(request_for(1), "user")
+    await generator.__anext__()
+    clock[0] = 10
+    await generator.aclose()
+
+    assert (await session_from(postgres.get_read_db, request_for(1), "user")).bind is postgres.engine
+
+    clock[0] = 16
+    assert (await session_from(postgres.get_read_db, request_for(1), "other")).bind is read_replica
+
+@pytest.mark.asyncio
+async def test_get_read_db_without_read_replica(monkeypatch):
+    monkeypatch.setattr(postgres, "read_engine", postgres.engine)
+    monkeypatch.setattr(postgres, "AsyncReadSessionLocal", postgres.AsyncSessionLocal)
+    session = await session_from(postgres.get_read_db, request_for(1), "user")
+    assert session.bind is postgres.engine
+
+@pytest.mark.asyncio
+async def test_session_does_not_check_out_connection_until_first_query():
+    checkouts = postgres.engine.pool.stats()["checkouts"]
+    generator = postgres.get_db()
+    session = await generator.__anext__()
+    assert not session.in_transaction()
+    await generator.aclose()
+    assert postgres.engine.pool.stats()["checkouts"] == checkouts
+
+@pytest.mark.asyncio
+async def test_release_connection_commits_open_transaction():
+    db = MagicMock(spec=AsyncSession)
+    db.in_transaction.return_value = True
+    await postgres.release_connection(db)
+    db.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_release_connection_without_transaction():
+    db = MagicMock(spec=AsyncSession)
+    db.in_transaction.return_value = False
+    await postgres.release_connection(db)
+    db.commit.assert_not_awaited()
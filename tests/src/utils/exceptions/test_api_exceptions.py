@@ -0,0 +1,21 @@
+import orjson
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy.exc import IntegrityError
+from src.utils.exceptions.api_exceptions import integrity_error_handler
+from src.utils.helpers.json_response import FastJSONResponse
+
+@pytest.mark.asyncio
+async def test_integrity_error_handler_unique_violation():
+    exc = IntegrityError("UPDATE clients", {}, MagicMock(sqlstate="23505"))
+    response = await integrity_error_handler(MagicMock(), exc)
+    assert isinstance(response, FastJSONResponse)
+    assert response.status_code == 409
+    assert orjson.loads(response.body) == {"message": "Record with this parameter already exists in the base."}
+
+@pytest.mark.asyncio
+async def test_integrity_error_handler_other_violation():
+    exc = IntegrityError("INSERT INTO clients", {}, MagicMock(sqlstate="23502"))
+    response = await integrity_error_handler(MagicMock(), exc)
+    assert response.status_code == 400
+    assert orjson.loads(response.body) == {"message": "Database integrity error."}
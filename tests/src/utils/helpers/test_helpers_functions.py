@@ -0,0 +1,14 @@
+import pytest
+from src.utils.helpers.helpers_functions import HelperFunctions
+from src.utils.exceptions.exceptions import SchemaValidationError
+
+def test_encode_and_decode_cursor():
+    values = {"created_at": "2024-01-01T00:00:00", "wishlist_id": 10}
+    cursor = HelperFunctions.encode_cursor(values)
+    assert "=" not in cursor
+    assert HelperFunctions.decode_cursor(cursor) == values
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "!!!"])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(SchemaValidationError):
+        HelperFunctions.decode_cursor(cursor)
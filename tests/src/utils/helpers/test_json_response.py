@@ -0,0 +1,20 @@
+import orjson
+import pytest
+from datetime import datetime, timezone
+from src.utils.helpers.json_response import FastJSONResponse
+from src.utils.schemas.clients_schema import ClientsOut
+
+def test_fast_json_response_serializes_models_and_datetimes():
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    client = ClientsOut(id=1, nome="Test", email="test@test.com", created_at=created_at)
+    response = FastJSONResponse(content={"items": [client], "generated_at": created_at, 1: "ok"})
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == {
+        "items": [{"id": 1, "nome": "Test", "email": "test@test.com", "created_at": "2024-01-01T00:00:00Z"}],
+        "generated_at": "2024-01-01T00:00:00+00:00",
+        "1": "ok"
+    }
+
+def test_fast_json_response_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        FastJSONResponse(content={"value": object()})
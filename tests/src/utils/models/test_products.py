@@ -0,0 +1,30 @@
+import pytest
+from src.utils.models.products import Products
+from datetime import datetime
+
+def test_products_repr():
+    product = Products(
+        product_id=1,
+        product_info={"title": "Produto Teste"},
+        updated_at=datetime(2024, 1, 1, 12, 0, 0)
+    )
+    expected = "<Products(product_id=1, product_info={'title': 'Produto Teste'}, updated_at=2024-01-01 12:00:00)>"
+    assert repr(product) == expected
+
+def test_products_json():
+    dt = datetime(2024, 2, 2, 15, 30, 0)
+    product = Products(
+        product_id=2,
+        product_info={"title": "Produto Topdemais"},
+        updated_at=dt
+    )
+    expected = {
+        "product_id": 2,
+        "product_info": {"title": "Produto Topdemais"},
+        "updated_at": dt
+    }
+    assert product.json() == expected
+
+def test_products_str():
+    product = Products(product_id=3, product_info={"title": "Produto X"})
+    assert str(product) == "Products(product_id=3)"
@@ -0,0 +1,16 @@
+import pytest
+from src.utils.models.users import Users
+from datetime import datetime
+
+def test_users_repr():
+    user = Users(id=1, username="admin", password_hash="scrypt$hash", created_at=datetime(2024, 1, 1, 12, 0, 0))
+    assert repr(user) == "<Users(id=1, username=admin, created_at=2024-01-01 12:00:00)>"
+
+def test_users_json_does_not_expose_password_hash():
+    dt = datetime(2024, 1, 1, 12, 0, 0)
+    user = Users(id=1, username="admin", password_hash="scrypt$hash", created_at=dt)
+    assert user.json() == {"id": 1, "username": "admin", "created_at": dt}
+
+def test_users_str():
+    user = Users(id=2, username="admin")
+    assert str(user) == "Usuario(id=2, username=admin)"
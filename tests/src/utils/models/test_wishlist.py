@@ -7,10 +7,9 @@ def test_wishlist_repr():
         wishlist_id=1,
         client_id=10,
         product_id=100,
-        product_info="{'name': 'Produto Teste'}",
         created_at=datetime(2024, 1, 1, 12, 0, 0)
     )
-    expected = "<Wishlist(wishlist_id=1,client_id=10,product_id=100,product_info={'name': 'Produto Teste'},created_at=2024-01-01 12:00:00)>"
+    expected = "<Wishlist(wishlist_id=1,client_id=10,product_id=100,created_at=2024-01-01 12:00:00)>"
     assert repr(wishlist) == expected
 
 def test_wishlist_json():
@@ -19,14 +18,12 @@ def test_wishlist_json():
         wishlist_id=2,
         client_id=20,
         product_id=200,
-        product_info="{'name': 'PRoduto Topdemais'}",
         created_at=dt
     )
     expected = {
         "wishlist_id": 2,
         "client_id": 20,
         "product_id": 200,
-        "product_info": "{'name': 'PRoduto Topdemais'}",
         "created_at": dt
     }
     assert wishlist.json() == expected
@@ -36,7 +33,6 @@ def test_wishlist_str():
         wishlist_id=3,
         client_id=30,
         product_id=300,
-        product_info="{'name': 'Produto X'}",
         created_at=datetime(2024, 3, 3, 10, 0, 0)
     )
     expected = "Wishlist(wishlist_id=3, client_id=30, product_id=300)"
@@ -2,22 +2,25 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.exc import NoResultFound
 from src.utils.repository.clients_repository import ClientsRepository
+from src.utils.cache.caches import client_versions
+from src.utils.schemas.clients_schema import ClientsUpdate
+from sqlalchemy.dialects import postgresql
 
 @pytest.mark.asyncio
 async def test_get_all_success():
     db = AsyncMock()
     request = MagicMock(page=1, page_size=2)
     fake_clients = [MagicMock(), MagicMock(), MagicMock()]
-    scalars_mock = MagicMock()
-    scalars_mock.all.return_value = fake_clients
     result_mock = MagicMock()
-    result_mock.scalars.return_value = scalars_mock
+    result_mock.all.return_value = fake_clients
     db.execute.return_value = result_mock
 
     rows, has_next = await ClientsRepository.get_all(db, request)
     assert isinstance(rows, list)
     assert len(rows) == 2
     assert has_next is True
+    statement = str(db.execute.call_args.args[0].compile())
+    assert statement.startswith("SELECT clients.id, clients.nome, clients.email, clients.created_at \nFROM clients")
 
 @pytest.mark.asyncio
 async def test_get_by_id_success():
@@ -35,74 +38,63 @@ async def test_get_by_id_not_found():
         await ClientsRepository.get_by_id(db, 1)
 
 @pytest.mark.asyncio
-async def test_get_by_email_success():
+async def test_create_success():
     db = AsyncMock()
+    client_data = MagicMock()
+    client_data.dict.return_value = {"nome": "Test", "email": "test@email.com"}
     fake_client = MagicMock()
-    scalars_mock = MagicMock()
-    scalars_mock.first.return_value = fake_client
     result_mock = MagicMock()
-    result_mock.scalars.return_value = scalars_mock
+    result_mock.scalars.return_value.first.return_value = fake_client
     db.execute.return_value = result_mock
 
-    result = await ClientsRepository.get_by_email(db, "test@email.com")
+    result = await ClientsRepository.create(db, client_data)
     assert result == fake_client
+    db.execute.assert_awaited_once()
+    db.commit.assert_awaited_once()
+    db.refresh.assert_not_awaited()
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert statement.startswith("INSERT INTO clients (nome, email)")
+    assert "ON CONFLICT (email) DO NOTHING" in statement
+    assert "RETURNING clients.id, clients.nome, clients.email, clients.created_at, clients.updated_at" in statement
 
 @pytest.mark.asyncio
-async def test_get_by_email_none():
+async def test_create_email_conflict_returns_none():
     db = AsyncMock()
-    scalars_mock = MagicMock()
-    scalars_mock.first.return_value = None
+    client_data = MagicMock()
+    client_data.dict.return_value = {"nome": "Test", "email": "test@email.com"}
     result_mock = MagicMock()
-    result_mock.scalars.return_value = scalars_mock
+    result_mock.scalars.return_value.first.return_value = None
     db.execute.return_value = result_mock
 
-    result = await ClientsRepository.get_by_email(db, "notfound@email.com")
-    assert result is None
-
-
-@pytest.mark.asyncio
-async def test_create_success():
-    db = AsyncMock()
-    client_data = MagicMock()
-    client_data.dict.return_value = {"nome": "Test", "email": "test@email.com"}
-    fake_client = MagicMock()
-    with patch("src.utils.repository.clients_repository.Clients", return_value=fake_client):
-        with patch("src.utils.repository.clients_repository.HelperFunctions.get_time") as mock_time:
-            mock_time.return_value.replace.return_value = "2024-01-01T00:00:00"
-            db.add.return_value = None
-            db.commit.return_value = None
-            db.refresh.return_value = None
-            result = await ClientsRepository.create(db, client_data)
-            assert result == fake_client
-            assert fake_client.created_at == "2024-01-01T00:00:00"
+    assert await ClientsRepository.create(db, client_data) is None
 
 @pytest.mark.asyncio
 async def test_update_success():
     db = AsyncMock()
     client = MagicMock()
-    db.get.return_value = client
-    clients_data = MagicMock()
-    clients_data.dict.return_value = {"nome": "Novo Mario"}
-
-    mock_result = MagicMock()
-    mock_scalars = MagicMock()
-    mock_scalars.first.return_value = None
-    mock_result.scalars.return_value = mock_scalars
-    db.execute.return_value = mock_result
-
-    db.commit.return_value = None
-    db.refresh.return_value = None
+    clients_data = ClientsUpdate(nome="Novo Mario", email="mario@email.com")
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.first.return_value = client
+    db.execute.return_value = result_mock
 
+    version = await client_versions.get_version(1)
     result = await ClientsRepository.update(db, 1, clients_data)
     assert result == client
-    assert client.nome == "Novo Mario"
+    assert await client_versions.get_version(1) != version
+    db.get.assert_not_awaited()
+    db.refresh.assert_not_awaited()
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    db.execute.assert_awaited_once()
+    assert "updated_at=now() WHERE clients.id" in statement
+    assert "RETURNING" in statement
 
 @pytest.mark.asyncio
 async def test_update_not_found():
     db = AsyncMock()
-    db.get.return_value = None
-    clients_data = MagicMock()
-    import pytest
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.first.return_value = None
+    db.execute.return_value = result_mock
+    clients_data = ClientsUpdate(nome="Novo Mario")
     with pytest.raises(NoResultFound):
         await ClientsRepository.update(db, 1, clients_data)
 
@@ -111,15 +103,42 @@ async def test_update_not_found():
 async def test_delete_success():
     db = AsyncMock()
     client = MagicMock()
-    db.get.return_value = client
-    db.delete.return_value = None
-    db.commit.return_value = None
+    scalars_mock = MagicMock()
+    scalars_mock.first.return_value = client
+    result_mock = MagicMock()
+    result_mock.scalars.return_value = scalars_mock
+    db.execute.return_value = result_mock
+    version = await client_versions.get_version(1)
     result = await ClientsRepository.delete(db, 1)
     assert result == client
+    assert await client_versions.get_version(1) != version
+    db.get.assert_not_awaited()
+    db.commit.assert_awaited_once()
+    statement = str(db.execute.call_args.args[0].compile())
+    assert statement.startswith("DELETE FROM clients")
+    assert "RETURNING" in statement
 
 @pytest.mark.asyncio
 async def test_delete_not_found():
     db = AsyncMock()
-    db.get.return_value = None
+    scalars_mock = MagicMock()
+    scalars_mock.first.return_value = None
+    result_mock = MagicMock()
+    result_mock.scalars.return_value = scalars_mock
+    db.execute.return_value = result_mock
     with pytest.raises(NoResultFound):
         await ClientsRepository.delete(db, 1)
+
+@pytest.mark.asyncio
+async def test_get_all_keyset():
+    db = AsyncMock()
+    request = MagicMock(page=3, page_size=2)
+    result_mock = MagicMock()
+    result_mock.all.return_value = []
+    db.execute.return_value = result_mock
+
+    await ClientsRepository.get_all(db, request, after_id=10)
+    statement = str(db.execute.call_args.args[0].compile())
+    assert "clients.id >" in statement
+    assert "ORDER BY clients.id" in statement
+    assert "OFFSET" not in statement
@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.utils.repository.products_repository import ProductsRepository
+from src.utils.models.products import Products
+
+@pytest.mark.asyncio
+async def test_get_by_id_success():
+    db = AsyncMock()
+    product = MagicMock()
+    db.get.return_value = product
+    result = await ProductsRepository.get_by_id(db, 1)
+    assert result == product
+    db.get.assert_awaited_once_with(Products, 1)
+
+@pytest.mark.asyncio
+async def test_upsert_does_not_commit():
+    db = AsyncMock()
+    await ProductsRepository.upsert(db, 1, {"title": "Produto"})
+    db.execute.assert_awaited_once()
+    db.commit.assert_not_awaited()
+    statement = str(db.execute.call_args.args[0].compile())
+    assert "ON CONFLICT (product_id) DO UPDATE" in statement
+
+@pytest.mark.asyncio
+async def test_upsert_without_overwrite():
+    db = AsyncMock()
+    await ProductsRepository.upsert(db, 1, {"mocked": True}, overwrite=False)
+    statement = str(db.execute.call_args.args[0].compile())
+    assert "ON CONFLICT (product_id) DO NOTHING" in statement
+
+@pytest.mark.asyncio
+async def test_upsert_many_single_statement():
+    db = AsyncMock()
+    await ProductsRepository.upsert_many(db, {1: {"title": "Produto"}, 2: {"mocked": True}})
+    db.execute.assert_awaited_once()
+    db.commit.assert_not_awaited()
+    statement = str(db.execute.call_args.args[0].compile())
+    assert "ON CONFLICT (product_id) DO UPDATE" in statement
+    assert "mocked" not in statement
+
+@pytest.mark.asyncio
+async def test_upsert_many_orders_rows_by_product_id():
+    db = AsyncMock()
+    await ProductsRepository.upsert_many(db, {3: {"title": "C"}, 1: {"title": "A"}, 2: {"title": "B"}})
+    params = db.execute.call_args.args[0].compile().params
+    assert [params[f"product_id_m{i}"] for i in range(3)] == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_upsert_many_empty():
+    db = AsyncMock()
+    await ProductsRepository.upsert_many(db, {})
+    db.execute.assert_not_awaited()
@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from src.utils.repository.users_repository import UsersRepository
+
+@pytest.mark.asyncio
+async def test_get_by_username():
+    db = AsyncMock()
+    user = MagicMock()
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.first.return_value = user
+    db.execute.return_value = result_mock
+
+    assert await UsersRepository.get_by_username(db, "admin") == user
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "WHERE users.username = " in statement
+
+@pytest.mark.asyncio
+async def test_create_success():
+    db = AsyncMock()
+    user = MagicMock()
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.first.return_value = user
+    db.execute.return_value = result_mock
+
+    assert await UsersRepository.create(db, "admin", "scrypt$hash") == user
+    db.commit.assert_awaited_once()
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert statement.startswith("INSERT INTO users (username, password_hash)")
+    assert "ON CONFLICT (username) DO NOTHING RETURNING" in statement
+
+@pytest.mark.asyncio
+async def test_create_exception():
+    db = AsyncMock()
+    db.execute.side_effect = Exception("DB error")
+    with pytest.raises(Exception):
+        await UsersRepository.create(db, "admin", "scrypt$hash")
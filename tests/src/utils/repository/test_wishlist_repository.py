@@ -1,64 +1,176 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.exc import NoResultFound
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
 from src.utils.repository.wishlist_repository import WishlistRepository
 
 @pytest.mark.asyncio
 async def test_delete_by_client_id_and_product_id_success():
     db = AsyncMock()
-    request = MagicMock()
-    fake_product = MagicMock()
+    request = MagicMock(client_id=1, product_id=2)
     fake_wishlist = MagicMock()
-    # Mock get_by_client_id_and_product_id to return a product
-    with patch.object(WishlistRepository, "get_by_client_id_and_product_id", new_callable=AsyncMock) as mock_get_by:
-        mock_get_by.return_value = fake_product
-        # Mock db.execute().scalars().first() to return a wishlist
-        scalars_mock = MagicMock()
-        scalars_mock.first.return_value = fake_wishlist
-        result_mock = MagicMock()
-        result_mock.scalars.return_value = scalars_mock
-        db.execute.return_value = result_mock
-        db.delete.return_value = None
-        db.commit.return_value = None
-
-        result = await WishlistRepository.delete_by_client_id_and_product_id(db, request)
-        assert result == fake_wishlist
-        db.delete.assert_awaited_once_with(fake_wishlist)
-        db.commit.assert_awaited_once()
+    scalars_mock = MagicMock()
+    scalars_mock.first.return_value = fake_wishlist
+    result_mock = MagicMock()
+    result_mock.scalars.return_value = scalars_mock
+    db.execute.return_value = result_mock
+
+    result = await WishlistRepository.delete_by_client_id_and_product_id(db, request)
+    assert result == fake_wishlist
+    db.execute.assert_awaited_once()
+    db.delete.assert_not_awaited()
+    db.commit.assert_awaited_once()
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert statement.startswith("DELETE FROM wishlist")
+    assert "RETURNING" in statement
 
 @pytest.mark.asyncio
 async def test_delete_by_client_id_and_product_id_not_found():
     db = AsyncMock()
-    request = MagicMock()
-    # Mock get_by_client_id_and_product_id to return None
-    with patch.object(WishlistRepository, "get_by_client_id_and_product_id", new_callable=AsyncMock) as mock_get_by:
-        mock_get_by.return_value = None
-        with pytest.raises(NoResultFound):
-            await WishlistRepository.delete_by_client_id_and_product_id(db, request)
+    request = MagicMock(client_id=1, product_id=2)
+    scalars_mock = MagicMock()
+    scalars_mock.first.return_value = None
+    result_mock = MagicMock()
+    result_mock.scalars.return_value = scalars_mock
+    db.execute.return_value = result_mock
+
+    with pytest.raises(NoResultFound):
+        await WishlistRepository.delete_by_client_id_and_product_id(db, request)
 
 @pytest.mark.asyncio
-async def test_delete_by_client_id_and_product_id_no_wishlist():
+async def test_delete_by_client_id_and_product_id_exception():
     db = AsyncMock()
-    request = MagicMock()
-    fake_product = MagicMock()
-    # Mock get_by_client_id_and_product_id to return a product
-    with patch.object(WishlistRepository, "get_by_client_id_and_product_id", new_callable=AsyncMock) as mock_get_by:
-        mock_get_by.return_value = fake_product
-        # Mock db.execute().scalars().first() to return None
-        scalars_mock = MagicMock()
-        scalars_mock.first.return_value = None
-        result_mock = MagicMock()
-        result_mock.scalars.return_value = scalars_mock
-        db.execute.return_value = result_mock
-
-        result = await WishlistRepository.delete_by_client_id_and_product_id(db, request)
-        assert result is None
+    request = MagicMock(client_id=1, product_id=2)
+    db.execute.side_effect = Exception("DB error")
+    with pytest.raises(Exception):
+        await WishlistRepository.delete_by_client_id_and_product_id(db, request)
 
 @pytest.mark.asyncio
-async def test_delete_by_client_id_and_product_id_exception():
+async def test_get_by_client_id_projects_product_fields():
+    db = AsyncMock()
+    request = MagicMock(client_id=1, page=1, page_size=2)
+    result_mock = MagicMock()
+    result_mock.all.return_value = [MagicMock(), MagicMock(), MagicMock()]
+    db.execute.return_value = result_mock
+
+    rows, has_next = await WishlistRepository.get_by_client_id(db, request, ["title", "price"])
+    assert len(rows) == 2
+    assert has_next is True
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "jsonb_build_object" in statement
+    assert statement.startswith("SELECT wishlist.wishlist_id, wishlist.client_id, wishlist.product_id, wishlist.created_at,")
+
+@pytest.mark.asyncio
+async def test_get_by_client_id_keyset():
+    db = AsyncMock()
+    request = MagicMock(client_id=1, page=3, page_size=2)
+    result_mock = MagicMock()
+    result_mock.all.return_value = [MagicMock()]
+    db.execute.return_value = result_mock
+
+    rows, has_next = await WishlistRepository.get_by_client_id(db, request, after=(datetime(2024, 1, 1), 5))
+    assert len(rows) == 1
+    assert has_next is False
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "(wishlist.created_at, wishlist.wishlist_id) >" in statement
+    assert "ORDER BY wishlist.created_at, wishlist.wishlist_id" in statement
+    assert "OFFSET" not in statement
+
+@pytest.mark.asyncio
+async def test_get_by_client_id_page_compatibility():
+    db = AsyncMock()
+    request = MagicMock(client_id=1, page=3, page_size=2)
+    result_mock = MagicMock()
+    result_mock.all.return_value = []
+    db.execute.return_value = result_mock
+
+    await WishlistRepository.get_by_client_id(db, request)
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "OFFSET" in statement
+    assert "ORDER BY wishlist.created_at, wishlist.wishlist_id" in statement
+
+@pytest.mark.asyncio
+async def test_create_success():
+    db = AsyncMock()
+    request = MagicMock(client_id=1, product_id=2)
+    fake_wishlist = MagicMock()
+    scalars_mock = MagicMock()
+    scalars_mock.first.return_value = fake_wishlist
+    result_mock = MagicMock()
+    result_mock.scalars.return_value = scalars_mock
+    db.execute.return_value = result_mock
+
+    result = await WishlistRepository.create(db, request)
+    assert result == fake_wishlist
+    db.commit.assert_awaited_once()
+    db.refresh.assert_not_awaited()
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (client_id, product_id) DO NOTHING RETURNING" in statement
+    assert statement.startswith("INSERT INTO wishlist (client_id, product_id) VALUES")
+
+@pytest.mark.asyncio
+async def test_create_conflict_returns_none():
+    db = AsyncMock()
+    request = MagicMock(client_id=1, product_id=2)
+    scalars_mock = MagicMock()
+    scalars_mock.first.return_value = None
+    result_mock = MagicMock()
+    result_mock.scalars.return_value = scalars_mock
+    db.execute.return_value = result_mock
+
+    assert await WishlistRepository.create(db, request) is None
+
+@pytest.mark.asyncio
+async def test_bulk_update_single_transaction():
+    db = AsyncMock()
+    inserted = MagicMock()
+    inserted.scalars.return_value.all.return_value = [1]
+    deleted = MagicMock()
+    deleted.scalars.return_value.all.return_value = [3]
+    db.execute.side_effect = [inserted, deleted]
+
+    created, removed = await WishlistRepository.bulk_update(db, 1, [1, 2], [3, 4])
+    assert created == {1}
+    assert removed == {3}
+    db.commit.assert_awaited_once()
+    insert_statement = str(db.execute.call_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+    delete_statement = str(db.execute.call_args_list[1].args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (client_id, product_id) DO NOTHING RETURNING wishlist.product_id" in insert_statement
+    assert "wishlist.product_id = ANY (%(product_ids)s::INTEGER[])" in delete_statement
+
+@pytest.mark.asyncio
+async def test_bulk_update_orders_added_products():
     db = AsyncMock()
-    request = MagicMock()
-    with patch.object(WishlistRepository, "get_by_client_id_and_product_id", new_callable=AsyncMock) as mock_get_by:
-        mock_get_by.side_effect = Exception("DB error")
-        with pytest.raises(Exception):
-            await WishlistRepository.delete_by_client_id_and_product_id(db, request)
\ No newline at end of file
+    inserted = MagicMock()
+    inserted.scalars.return_value.all.return_value = [1, 2, 3]
+    db.execute.return_value = inserted
+
+    await WishlistRepository.bulk_update(db, 1, [3, 1, 2], [])
+    params = db.execute.call_args.args[0].compile().params
+    assert [params[f"product_id_m{i}"] for i in range(3)] == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_bulk_update_only_remove():
+    db = AsyncMock()
+    deleted = MagicMock()
+    deleted.scalars.return_value.all.return_value = []
+    db.execute.return_value = deleted
+
+    created, removed = await WishlistRepository.bulk_update(db, 1, [], [3])
+    assert created == set()
+    assert removed == set()
+    db.execute.assert_awaited_once()
+    db.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_get_favorited_product_ids():
+    db = AsyncMock()
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = [1, 3]
+    db.execute.return_value = result_mock
+
+    assert await WishlistRepository.get_favorited_product_ids(db, 1, [1, 2, 3]) == {1, 3}
+    statement = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "SELECT wishlist.product_id" in statement
+    assert "wishlist.product_id = ANY (%(product_ids)s::INTEGER[])" in statement